@@ -36,7 +36,8 @@ INSTALL_REQUIRES = [
     "pydantic >= 2",
     "typing-extensions >= 4.7.1",
     "pyopenssl",
-    "PyJWT",
+    # token_verifier uses the claim validation of PyJWT (not part of its public API), tested with these versions
+    "PyJWT >= 2.9, < 2.11",
 ]
 
 setup(
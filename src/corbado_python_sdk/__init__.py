@@ -1,6 +1,10 @@
 from .config import Config as Config
 from .corbado_sdk import CorbadoSDK as CorbadoSDK
 from .entities import UserEntity as UserEntity
+from .entities import ValidatedSession as ValidatedSession
+from .exceptions import CircuitOpenException as CircuitOpenException
+from .exceptions import ConcurrencyLimitException as ConcurrencyLimitException
+from .exceptions import RateLimitException as RateLimitException
 from .exceptions import StandardException as StandardException
 from .exceptions import TokenValidationException, ValidationErrorType
 from .generated import (
@@ -12,9 +16,18 @@ from .generated import (
     UserStatus,
     UserUpdateReq,
 )
-from .services import IdentifierService, SessionService, UserService
+from .services import (
+    AsyncIdentifierService,
+    AsyncUserService,
+    IdentifierService,
+    SessionService,
+    UserService,
+)
 
 __all__ = [
+    "CircuitOpenException",
+    "ConcurrencyLimitException",
+    "RateLimitException",
     "TokenValidationException",
     "ValidationErrorType",
     "IdentifierCreateReq",
@@ -26,8 +39,11 @@ __all__ = [
     "UserStatus",
     "StandardException",
     "UserEntity",
+    "ValidatedSession",
     "CorbadoSDK",
     "Config",
+    "AsyncIdentifierService",
+    "AsyncUserService",
     "IdentifierService",
     "SessionService",
     "UserService",
@@ -0,0 +1,12 @@
+from .api import AsyncIdentifiersApi, AsyncUsersApi
+from .api_client import AsyncApiClient
+from .rest import DEFAULT_ASYNC_MAX_CONNECTIONS, AsyncRESTClientObject, AsyncRESTResponse
+
+__all__ = [
+    "DEFAULT_ASYNC_MAX_CONNECTIONS",
+    "AsyncApiClient",
+    "AsyncIdentifiersApi",
+    "AsyncRESTClientObject",
+    "AsyncRESTResponse",
+    "AsyncUsersApi",
+]
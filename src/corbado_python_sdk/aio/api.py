@@ -0,0 +1,175 @@
+from typing import List, Optional
+
+from corbado_python_sdk.generated.api import IdentifiersApi, UsersApi
+from corbado_python_sdk.generated.models import (
+    GenericRsp,
+    Identifier,
+    IdentifierCreateReq,
+    IdentifierList,
+    IdentifierUpdateReq,
+    User,
+    UserCreateReq,
+)
+
+from .api_client import AsyncApiClient
+
+
+class AsyncUsersApi:
+    """Async counterpart of the generated UsersApi (for the operations used by AsyncUserService).
+
+    Requests are built by the serializers of the generated API, so both stay in sync with the OpenAPI document.
+    """
+
+    def __init__(self, api_client: AsyncApiClient) -> None:
+        """Initialize a new instance of the AsyncUsersApi class.
+
+        Args:
+            api_client (AsyncApiClient): Async API client.
+        """
+        self.api_client: AsyncApiClient = api_client
+        self._serializer: UsersApi = UsersApi(api_client=api_client)
+
+    async def user_create(self, user_create_req: UserCreateReq) -> User:
+        """Create a new user.
+
+        Args:
+            user_create_req (UserCreateReq): Request.
+
+        Returns:
+            User: Created user.
+        """
+        serialized = self._serializer._user_create_serialize(
+            user_create_req=user_create_req, _request_auth=None, _content_type=None, _headers=None, _host_index=0
+        )
+        return await self.api_client.request(serialized, {"200": "User"})  # type: ignore[no-any-return]
+
+    async def user_get(self, user_id: str) -> User:
+        """Retrieve a user.
+
+        Args:
+            user_id (str): ID of user.
+
+        Returns:
+            User: User.
+        """
+        serialized = self._serializer._user_get_serialize(
+            user_id=user_id, _request_auth=None, _content_type=None, _headers=None, _host_index=0
+        )
+        return await self.api_client.request(serialized, {"200": "User"})  # type: ignore[no-any-return]
+
+    async def user_delete(self, user_id: str) -> GenericRsp:
+        """Delete a user.
+
+        Args:
+            user_id (str): ID of user.
+
+        Returns:
+            GenericRsp: Response.
+        """
+        serialized = self._serializer._user_delete_serialize(
+            user_id=user_id, _request_auth=None, _content_type=None, _headers=None, _host_index=0
+        )
+        return await self.api_client.request(serialized, {"200": "GenericRsp"})  # type: ignore[no-any-return]
+
+
+class AsyncIdentifiersApi:
+    """Async counterpart of the generated IdentifiersApi.
+
+    Requests are built by the serializers of the generated API, so both stay in sync with the OpenAPI document.
+    """
+
+    def __init__(self, api_client: AsyncApiClient) -> None:
+        """Initialize a new instance of the AsyncIdentifiersApi class.
+
+        Args:
+            api_client (AsyncApiClient): Async API client.
+        """
+        self.api_client: AsyncApiClient = api_client
+        self._serializer: IdentifiersApi = IdentifiersApi(api_client=api_client)
+
+    async def identifier_create(self, user_id: str, identifier_create_req: IdentifierCreateReq) -> Identifier:
+        """Create a new login identifier.
+
+        Args:
+            user_id (str): ID of user.
+            identifier_create_req (IdentifierCreateReq): Request.
+
+        Returns:
+            Identifier: Created identifier.
+        """
+        serialized = self._serializer._identifier_create_serialize(
+            user_id=user_id,
+            identifier_create_req=identifier_create_req,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self.api_client.request(serialized, {"200": "Identifier"})  # type: ignore[no-any-return]
+
+    async def identifier_list(
+        self,
+        sort: Optional[str] = None,
+        filter: Optional[List[str]] = None,  # noqa: A002
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> IdentifierList:
+        """List login identifiers.
+
+        Args:
+            sort (Optional[str]): Field sorting. Defaults to None.
+            filter (Optional[List[str]]): Field filtering. Defaults to None.
+            page (Optional[int]): Page number. Defaults to None.
+            page_size (Optional[int]): Number of items per page. Defaults to None.
+
+        Returns:
+            IdentifierList: Identifiers.
+        """
+        serialized = self._serializer._identifier_list_serialize(
+            sort=sort,
+            filter=filter,
+            page=page,
+            page_size=page_size,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self.api_client.request(serialized, {"200": "IdentifierList"})  # type: ignore[no-any-return]
+
+    async def identifier_update(self, user_id: str, identifier_id: str, identifier_update_req: IdentifierUpdateReq) -> Identifier:
+        """Update a login identifier.
+
+        Args:
+            user_id (str): ID of user.
+            identifier_id (str): ID of login identifier.
+            identifier_update_req (IdentifierUpdateReq): Request.
+
+        Returns:
+            Identifier: Updated identifier.
+        """
+        serialized = self._serializer._identifier_update_serialize(
+            user_id=user_id,
+            identifier_id=identifier_id,
+            identifier_update_req=identifier_update_req,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self.api_client.request(serialized, {"200": "Identifier"})  # type: ignore[no-any-return]
+
+    async def identifier_delete(self, user_id: str, identifier_id: str) -> GenericRsp:
+        """Delete a login identifier.
+
+        Args:
+            user_id (str): ID of user.
+            identifier_id (str): ID of login identifier.
+
+        Returns:
+            GenericRsp: Response.
+        """
+        serialized = self._serializer._identifier_delete_serialize(
+            user_id=user_id, identifier_id=identifier_id, _request_auth=None, _content_type=None, _headers=None, _host_index=0
+        )
+        return await self.api_client.request(serialized, {"200": "GenericRsp"})  # type: ignore[no-any-return]
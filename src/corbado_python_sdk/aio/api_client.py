@@ -0,0 +1,199 @@
+import asyncio
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+from corbado_python_sdk.generated.api_client import ApiResponse, RequestSerialized
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    RateLimiter,
+    ResilientApiClient,
+    RetryPolicy,
+)
+from corbado_python_sdk.resilience.api_client import ApiCall, RequestTimeout
+
+from .rest import (
+    DEFAULT_ASYNC_MAX_CONNECTIONS,
+    AsyncRESTClientObject,
+    AsyncRESTResponse,
+)
+
+
+class AsyncApiClient(ResilientApiClient):
+    """ApiClient performing requests with the async transport.
+
+    Serialization, authentication and deserialization are inherited from the generated ApiClient, only sending
+    the request (including the waits of the retry policy) is awaited. Close it with close() or use it as an
+    async context manager.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        header_name: Optional[str] = None,
+        header_value: Optional[str] = None,
+        cookie: Optional[str] = None,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        """Initialize a new instance of the AsyncApiClient class.
+
+        Args:
+            configuration (Optional[Configuration]): Configuration (generated class). Defaults to the default one.
+            header_name (Optional[str]): Name of a default header. Defaults to None.
+            header_value (Optional[str]): Value of the default header. Defaults to None.
+            cookie (Optional[str]): Cookie to send. Defaults to None.
+            max_connections (int): Maximum number of open connections. Defaults to DEFAULT_ASYNC_MAX_CONNECTIONS.
+            retry_policy (Optional[RetryPolicy]): Retry policy, None disables retries. Defaults to None.
+            circuit_breaker (Optional[CircuitBreaker]): Circuit breaker, None disables it. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): Rate limiter, None disables it. Defaults to None.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive limit of concurrent requests, None
+                disables it. Defaults to None.
+        """
+        self.max_connections: int = max_connections
+        super().__init__(
+            configuration=configuration,
+            header_name=header_name,
+            header_value=header_value,
+            cookie=cookie,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+        )
+        self.rest_client: AsyncRESTClientObject  # type: ignore[assignment]
+
+    def _create_rest_client(self) -> AsyncRESTClientObject:  # type: ignore[override]
+        """Create the async REST client sending the requests, called once by __init__().
+
+        Returns:
+            AsyncRESTClientObject: REST client with at most max_connections open connections.
+        """
+        return AsyncRESTClientObject(self.configuration, max_connections=self.max_connections, concurrency_limiter=self.concurrency_limiter)
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        """Enter the async context.
+
+        Returns:
+            AsyncApiClient: This client.
+        """
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], traceback: Optional[TracebackType]
+    ) -> None:
+        """Exit the async context, closing the connections.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): Exception type.
+            exc_value (Optional[BaseException]): Exception.
+            traceback (Optional[TracebackType]): Traceback.
+        """
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        await self.rest_client.close()
+
+    def _is_connection_error(self, error: BaseException) -> bool:
+        """Check if an attempt failed on the connection level (and can be retried).
+
+        Args:
+            error (BaseException): Error of the attempt.
+
+        Returns:
+            bool: True, if it is a connection error or timeout.
+        """
+        import aiohttp
+
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def call_api(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        header_params: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> AsyncRESTResponse:
+        """Perform the request (asynchronous), retrying it according to the retry policy.
+
+        Each attempt first waits for the rate limiter. If no request timeout is given, each attempt is limited to
+        the time left of the retry deadline.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            header_params (Optional[Dict[str, str]]): Request headers. Defaults to None.
+            body (Any): Request body. Defaults to None.
+            post_params (Any): Form parameters. Defaults to None.
+            _request_timeout (RequestTimeout): Total timeout or (connect, read) timeouts. Defaults to None.
+
+        Raises:
+            CircuitOpenException: If the circuit of the operation is open.
+            RateLimitException: If the rate limiter allows no attempt within its timeout.
+            ConcurrencyLimitException: If the concurrency limiter has no free slot within its timeout.
+            BaseException: Error of the last attempt, if it failed without a response (e.g. a connection error).
+
+        Returns:
+            AsyncRESTResponse: Response (already read) of the last attempt.
+
+        # noqa: DAR402 CircuitOpenException RateLimitException ConcurrencyLimitException
+        """
+        call = ApiCall(method, url, header_params)
+        while True:
+            wait: float = self._throttle(call)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            timeout: RequestTimeout = self._before_attempt(call, _request_timeout)
+            try:
+                response: AsyncRESTResponse = await self.rest_client.request(
+                    method, url, headers=header_params, body=body, post_params=post_params, _request_timeout=timeout
+                )
+            except BaseException as error:
+                delay: Optional[float] = self._after_attempt(call, error=error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._after_attempt(call, status=response.status, retry_after=response.getheader("Retry-After"))
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+    async def response_deserialize(  # type: ignore[override]
+        self, response_data: AsyncRESTResponse, response_types_map: Optional[Dict[str, Any]] = None
+    ) -> ApiResponse[Any]:
+        """Deserialize the response into an object (asynchronous).
+
+        Args:
+            response_data (AsyncRESTResponse): Response.
+            response_types_map (Optional[Dict[str, Any]]): Response types by status code. Defaults to None.
+
+        Returns:
+            ApiResponse[Any]: Deserialized response.
+        """
+        return super().response_deserialize(response_data=response_data, response_types_map=response_types_map)  # type: ignore[arg-type]
+
+    async def request(
+        self,
+        serialized: RequestSerialized,
+        response_types_map: Dict[str, Optional[str]],
+        _request_timeout: RequestTimeout = None,
+    ) -> Any:
+        """Send a request serialized by a generated API and return the deserialized response data.
+
+        Args:
+            serialized (RequestSerialized): Request as returned by the _*_serialize() methods of the generated APIs.
+            response_types_map (Dict[str, Optional[str]]): Response types by status code.
+            _request_timeout (RequestTimeout): Total timeout or (connect, read) timeouts. Defaults to None.
+
+        Returns:
+            Any: Deserialized response data.
+        """
+        response_data = await self.call_api(*serialized, _request_timeout=_request_timeout)
+        return (await self.response_deserialize(response_data=response_data, response_types_map=response_types_map)).data
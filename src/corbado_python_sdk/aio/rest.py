@@ -0,0 +1,241 @@
+import json
+import re
+import ssl
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Union
+
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.generated.exceptions import ApiException, ApiValueError
+from corbado_python_sdk.resilience.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+
+_METHODS = frozenset({"GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"})
+
+
+class AsyncRESTResponse:
+    """Fully read response of the async transport.
+
+    Offers the interface of rest.RESTResponse, so the generated deserialization and ApiException can be used.
+
+    Attributes:
+        status (int): HTTP status code.
+        reason (Optional[str]): HTTP reason phrase.
+        data (bytes): Response body.
+    """
+
+    __slots__ = ("status", "reason", "data", "_headers")
+
+    def __init__(self, status: int, reason: Optional[str], headers: Mapping[str, str], data: bytes) -> None:
+        """Initialize a new instance of the AsyncRESTResponse class.
+
+        Args:
+            status (int): HTTP status code.
+            reason (Optional[str]): HTTP reason phrase.
+            headers (Mapping[str, str]): Response headers.
+            data (bytes): Response body.
+        """
+        self.status: int = status
+        self.reason: Optional[str] = reason
+        self.data: bytes = data
+        self._headers: Mapping[str, str] = headers
+
+    def read(self) -> bytes:
+        """Return the response body.
+
+        Returns:
+            bytes: Response body.
+        """
+        return self.data
+
+    def getheaders(self) -> Mapping[str, str]:
+        """Return the response headers.
+
+        Returns:
+            Mapping[str, str]: Response headers.
+        """
+        return self._headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a response header.
+
+        Args:
+            name (str): Header name (case insensitive).
+            default (Optional[str]): Value if the header is missing. Defaults to None.
+
+        Returns:
+            Optional[str]: Header value.
+        """
+        return self._headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+    """Async counterpart of rest.RESTClientObject, sending requests over a pooled aiohttp session.
+
+    The session is created on the first request, so it belongs to the event loop running the requests. Requires
+    the optional aiohttp dependency (pip install passkeys[async]).
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        """Initialize a new instance of the AsyncRESTClientObject class.
+
+        Args:
+            configuration (Configuration): Configuration (generated class).
+            max_connections (int): Maximum number of open connections, requests beyond it wait for a free
+                connection. Defaults to DEFAULT_ASYNC_MAX_CONNECTIONS.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive limit of concurrent requests, None
+                to only limit them by max_connections. Defaults to None.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+            ValueError: If max_connections is not positive.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise ImportError("The async client requires aiohttp, install it with: pip install passkeys[async]") from None
+        if max_connections < 1:
+            raise ValueError("max_connections must be positive")
+
+        self.configuration: Configuration = configuration
+        self.max_connections: int = max_connections
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = concurrency_limiter
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _create_ssl_context(self) -> Union[ssl.SSLContext, bool]:
+        """Create the SSL context from the configuration.
+
+        Returns:
+            Union[ssl.SSLContext, bool]: SSL context or False, if certificates are not verified.
+        """
+        if not self.configuration.verify_ssl:
+            return False
+        context = ssl.create_default_context(cafile=self.configuration.ssl_ca_cert, cadata=self.configuration.ca_cert_data)
+        if self.configuration.cert_file:
+            context.load_cert_chain(self.configuration.cert_file, keyfile=self.configuration.key_file)
+        return context
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Session.
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ssl=self._create_ssl_context())
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @staticmethod
+    def _create_timeout(request_timeout: Union[None, float, Tuple[float, float]]) -> "Optional[aiohttp.ClientTimeout]":
+        """Translate a request timeout of the generated client.
+
+        Args:
+            request_timeout (Union[None, float, Tuple[float, float]]): Total timeout or (connect, read) timeouts.
+
+        Returns:
+            Optional[aiohttp.ClientTimeout]: Timeout or None for the session default.
+        """
+        import aiohttp
+
+        if isinstance(request_timeout, (int, float)):
+            return aiohttp.ClientTimeout(total=request_timeout)
+        if isinstance(request_timeout, tuple) and len(request_timeout) == 2:
+            return aiohttp.ClientTimeout(connect=request_timeout[0], sock_read=request_timeout[1])
+        return None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Union[None, float, Tuple[float, float]] = None,
+    ) -> AsyncRESTResponse:
+        """Perform a request and read the response, once a concurrency slot is free.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            headers (Optional[Dict[str, str]]): Request headers. Defaults to None.
+            body (Any): Request body, serialized to JSON for JSON content types. Defaults to None.
+            post_params (Any): Form parameters for application/x-www-form-urlencoded. Defaults to None.
+            _request_timeout (Union[None, float, Tuple[float, float]]): Total timeout or (connect, read)
+                timeouts. Defaults to None.
+
+        Raises:
+            ApiValueError: If both body and post_params are given.
+            ApiException: If the request can not be prepared or fails with an SSL error.
+            ConcurrencyLimitException: If no slot frees up within the timeout of the concurrency limiter.
+            BaseException: Error of the request (e.g. aiohttp.ClientConnectionError).
+
+        Returns:
+            AsyncRESTResponse: Response.
+
+        # noqa: DAR402 ConcurrencyLimitException
+        """
+        import aiohttp
+
+        method = method.upper()
+        if method not in _METHODS:
+            raise ApiValueError(f"Unsupported HTTP method: {method}")
+        if post_params and body:
+            raise ApiValueError("body parameter cannot be used with post_params parameter.")
+
+        headers = dict(headers or {})
+        data: Any = None
+        if method not in ("GET", "HEAD"):
+            content_type = headers.get("Content-Type")
+            if not content_type or re.search("json", content_type, re.IGNORECASE):
+                data = json.dumps(body) if body is not None else None
+            elif content_type == "application/x-www-form-urlencoded":
+                data = post_params or {}
+            elif isinstance(body, (str, bytes)):
+                data = body
+            else:
+                raise ApiException(status=0, reason="Cannot prepare a request message for provided arguments.")
+
+        limiter: Optional[AdaptiveConcurrencyLimiter] = self.concurrency_limiter
+        started: float = await limiter.acquire_async() if limiter is not None else 0.0
+        success: Optional[bool] = None
+        try:
+            try:
+                async with self._get_session().request(
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=self._create_timeout(_request_timeout),
+                    proxy=self.configuration.proxy,
+                    proxy_headers=self.configuration.proxy_headers,
+                ) as response:
+                    result = AsyncRESTResponse(
+                        status=response.status, reason=response.reason, headers=response.headers, data=await response.read()
+                    )
+            except aiohttp.ClientSSLError as e:
+                raise ApiException(status=0, reason=f"{type(e).__name__}\n{e}")
+            success = result.status < 500 and result.status != 429
+            return result
+        except BaseException as error:
+            # not counted if cancelled
+            success = False if isinstance(error, Exception) else None
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release(started, success)
+
+    async def close(self) -> None:
+        """Close the session and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
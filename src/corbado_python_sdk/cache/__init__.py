@@ -0,0 +1,47 @@
+from .jwks_cache import (
+    DEFAULT_JWKS_LIFESPAN,
+    DEFAULT_JWKS_MAX_STALE,
+    DEFAULT_JWKS_MAX_UNKNOWN_KIDS,
+    DEFAULT_JWKS_MIN_REFRESH_INTERVAL,
+    DEFAULT_JWKS_REFRESH_AHEAD,
+    DEFAULT_JWKS_UNKNOWN_KID_TTL,
+    JWKSCache,
+)
+from .key_store import FileKeyStore, KeyStore, StoredKeySet
+from .revocation_filter import (
+    DEFAULT_REVOCATION_PAGE_SIZE,
+    DEFAULT_REVOCATION_REFRESH_INTERVAL,
+    DEFAULT_REVOCATION_RETENTION,
+    DEFAULT_SESSION_ID_CLAIM,
+    RevocationFilter,
+)
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+from .user_status_cache import (
+    DEFAULT_USER_STATUS_CACHE_SIZE,
+    DEFAULT_USER_STATUS_TTL,
+    UserStatusCache,
+)
+
+__all__ = [
+    "DEFAULT_JWKS_LIFESPAN",
+    "DEFAULT_JWKS_MAX_STALE",
+    "DEFAULT_JWKS_MAX_UNKNOWN_KIDS",
+    "DEFAULT_JWKS_MIN_REFRESH_INTERVAL",
+    "DEFAULT_JWKS_REFRESH_AHEAD",
+    "DEFAULT_JWKS_UNKNOWN_KID_TTL",
+    "DEFAULT_REVOCATION_PAGE_SIZE",
+    "DEFAULT_REVOCATION_REFRESH_INTERVAL",
+    "DEFAULT_REVOCATION_RETENTION",
+    "DEFAULT_SESSION_ID_CLAIM",
+    "DEFAULT_USER_STATUS_CACHE_SIZE",
+    "DEFAULT_USER_STATUS_TTL",
+    "FileKeyStore",
+    "JWKSCache",
+    "KeyStore",
+    "RevocationFilter",
+    "SingleFlight",
+    "StoredKeySet",
+    "TTLCache",
+    "UserStatusCache",
+]
@@ -0,0 +1,500 @@
+import json
+import threading
+import time
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Union
+
+from jwt import PyJWK, PyJWKClient, PyJWKClientError, PyJWKSet, get_unverified_header
+
+from .key_store import KeyStore, StoredKeySet
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+
+DEFAULT_JWKS_LIFESPAN = 300
+DEFAULT_JWKS_REFRESH_AHEAD = 60
+DEFAULT_JWKS_MAX_STALE = 3600
+DEFAULT_JWKS_MIN_REFRESH_INTERVAL = 30
+DEFAULT_JWKS_UNKNOWN_KID_TTL = 300
+DEFAULT_JWKS_MAX_UNKNOWN_KIDS = 1024
+
+_EMPTY_KEYS: Mapping[str, PyJWK] = MappingProxyType({})
+
+
+class _KeySnapshot(NamedTuple):
+    """Immutable state of the cached key set, replaced as a whole on every refresh."""
+
+    keys: Mapping[str, PyJWK]
+    document: Optional[Dict[str, Any]]
+    fetched_at: Optional[float]
+
+
+class JWKSCache:
+    """In-memory cache for the JSON Web Key Set (JWKS) of a Corbado project.
+
+    The key set is fetched once and then served from memory. As soon as it is older than
+    ``lifespan - refresh_ahead`` seconds, a refresh is started in a background thread while
+    callers keep using the last good key set (stale-while-revalidate). If refreshing keeps
+    failing, the stale key set is served for up to ``max_stale`` seconds after it expired and a
+    background refresh is retried at most every ``min_refresh_interval`` seconds.
+    Only afterwards (or if no key set was fetched yet) lookups fetch synchronously.
+
+    Concurrent fetches are coalesced: all threads that need a fresh key set at the same time
+    (e.g. after a key rotation) wait for one shared request to the JWKS endpoint.
+
+    Tokens with an unknown kid can force a refresh at most every ``min_refresh_interval`` seconds.
+    Kids that are still unknown after a refresh are remembered in a bounded negative cache for
+    ``unknown_kid_ttl`` seconds and rejected without any refresh, so that tokens with random kids
+    cannot be used to flood the JWKS endpoint.
+
+    Lookups never take a lock: the key set is kept in an immutable snapshot (keys, document and
+    fetch time) that refreshes build completely and then swap in with a single assignment, so
+    readers in any number of threads always see a consistent key set without serializing. In the
+    refresh window, only the lookup that starts the background refresh takes the lock to claim it.
+
+    Optionally, a key store shares the key set between processes: a refresh first checks the store
+    for a key set that is still fresh and newer than the cached one (and, for a refresh forced by an
+    unknown kid, contains that kid), and only fetches the key set (and saves it to the store) otherwise.
+
+    For environments without network access (and tests), the key set can be given as document or as
+    path of a local file instead. The cache then never contacts the JWKS endpoint, a refresh re-reads
+    the file.
+
+    Attributes:
+        uri (str): URI of the JWKS endpoint.
+        lifespan (float): Time in seconds after which the key set is considered expired.
+        refresh_ahead (float): Time in seconds before expiry at which a background refresh starts.
+        max_stale (float): Time in seconds an expired key set may still be served while refreshing fails.
+        min_refresh_interval (float): Minimum time in seconds between refreshes forced by unknown kids, and between
+            background refreshes.
+        document_path (Optional[str]): Path of a local JWKS file used instead of the JWKS endpoint.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        lifespan: float = DEFAULT_JWKS_LIFESPAN,
+        refresh_ahead: float = DEFAULT_JWKS_REFRESH_AHEAD,
+        max_stale: float = DEFAULT_JWKS_MAX_STALE,
+        min_refresh_interval: float = DEFAULT_JWKS_MIN_REFRESH_INTERVAL,
+        unknown_kid_ttl: float = DEFAULT_JWKS_UNKNOWN_KID_TTL,
+        max_unknown_kids: int = DEFAULT_JWKS_MAX_UNKNOWN_KIDS,
+        key_store: Optional[KeyStore] = None,
+        document: Optional[Dict[str, Any]] = None,
+        document_path: Optional[str] = None,
+        timeout: int = 30,
+    ) -> None:
+        """Initialize a new instance of the JWKSCache class.
+
+        Args:
+            uri (str): URI of the JWKS endpoint.
+            lifespan (float): Lifespan of the key set in seconds. Defaults to DEFAULT_JWKS_LIFESPAN.
+            refresh_ahead (float): Seconds before expiry to start a background refresh.
+                Defaults to DEFAULT_JWKS_REFRESH_AHEAD.
+            max_stale (float): Seconds an expired key set may be served. Defaults to DEFAULT_JWKS_MAX_STALE.
+            min_refresh_interval (float): Minimum seconds between refreshes forced by unknown kids, and between
+                background refreshes. Defaults to DEFAULT_JWKS_MIN_REFRESH_INTERVAL.
+            unknown_kid_ttl (float): Seconds an unknown kid is rejected without refresh.
+                Defaults to DEFAULT_JWKS_UNKNOWN_KID_TTL.
+            max_unknown_kids (int): Maximum number of remembered unknown kids. Defaults to DEFAULT_JWKS_MAX_UNKNOWN_KIDS.
+            key_store (Optional[KeyStore], optional): Store to share the key set with other processes. Defaults to None.
+            document (Optional[Dict[str, Any]], optional): Static key set used instead of the JWKS endpoint.
+                Defaults to None.
+            document_path (Optional[str], optional): Path of a local JWKS file used instead of the JWKS endpoint.
+                Defaults to None.
+            timeout (int): Timeout in seconds for fetching the key set. Defaults to 30.
+
+        Raises:
+            ValueError: If the time windows are inconsistent or both document and document_path are given.
+        """
+        if lifespan <= 0:
+            raise ValueError(f'Lifespan must be greater than 0, the input is "{lifespan}"')
+        if refresh_ahead < 0 or refresh_ahead >= lifespan:
+            raise ValueError(f'Refresh ahead must be within [0, lifespan), the input is "{refresh_ahead}"')
+        if max_stale < 0:
+            raise ValueError(f'Max stale must not be negative, the input is "{max_stale}"')
+        if min_refresh_interval < 0:
+            raise ValueError(f'Min refresh interval must not be negative, the input is "{min_refresh_interval}"')
+        if document is not None and document_path is not None:
+            raise ValueError("Only one of document and document_path can be given")
+
+        self.uri: str = uri
+        self.lifespan: float = lifespan
+        self.refresh_ahead: float = refresh_ahead
+        self.max_stale: float = max_stale
+        self.min_refresh_interval: float = min_refresh_interval
+        self.document_path: Optional[str] = document_path
+
+        # PyJWKClient is only used for fetching, caching is done here
+        self._client = PyJWKClient(uri=uri, cache_jwk_set=False, timeout=timeout)
+        self._key_store: Optional[KeyStore] = key_store
+        self._static_document: Optional[Dict[str, Any]] = document
+        self._lock = threading.Lock()
+        self._single_flight: SingleFlight[Mapping[str, PyJWK]] = SingleFlight()
+        # read without lock, only ever replaced (under the lock) and never mutated
+        self._snapshot: _KeySnapshot = _KeySnapshot(keys=_EMPTY_KEYS, document=None, fetched_at=None)
+        self._stored_at: Optional[float] = None
+        self._refreshing: bool = False
+        self._background_refresh_at: Optional[float] = None
+        self._refresh_success_count: int = 0
+        self._refresh_failure_count: int = 0
+        self._last_refresh_error: Optional[Exception] = None
+        self._unknown_kids: TTLCache[str, bool] = TTLCache(max_size=max_unknown_kids, ttl=unknown_kid_ttl)
+        self._rejected_kid_count: int = 0
+        self._key_store_hit_count: int = 0
+
+    # --------- Properties ----------#
+    @property
+    def refresh_success_count(self) -> int:
+        """Get number of successful key set fetches.
+
+        Returns:
+            int: Number of successful fetches.
+        """
+        return self._refresh_success_count
+
+    @property
+    def refresh_failure_count(self) -> int:
+        """Get number of failed key set fetches.
+
+        Returns:
+            int: Number of failed fetches.
+        """
+        return self._refresh_failure_count
+
+    @property
+    def rejected_kid_count(self) -> int:
+        """Get number of lookups rejected because of an unknown (or missing) kid.
+
+        Returns:
+            int: Number of rejected lookups.
+        """
+        return self._rejected_kid_count
+
+    @property
+    def offline(self) -> bool:
+        """Check whether the key set is given locally, so the JWKS endpoint is never contacted.
+
+        Returns:
+            bool: True if offline.
+        """
+        return self._static_document is not None or self.document_path is not None
+
+    @property
+    def key_store_hit_count(self) -> int:
+        """Get number of refreshes served from the key store instead of the JWKS endpoint.
+
+        Returns:
+            int: Number of key store hits.
+        """
+        return self._key_store_hit_count
+
+    @property
+    def document(self) -> Optional[Dict[str, Any]]:
+        """Get the cached key set as JSON document, as returned by the JWKS endpoint.
+
+        Returns:
+            Optional[Dict[str, Any]]: Key set or None, if nothing was fetched yet.
+        """
+        return self._snapshot.document
+
+    @property
+    def last_refresh_error(self) -> Optional[Exception]:
+        """Get the error of the last failed fetch, reset by the next successful fetch.
+
+        Returns:
+            Optional[Exception]: Last error or None.
+        """
+        return self._last_refresh_error
+
+    # --------- Core methods ----------#
+    def get_signing_key_from_jwt(self, token: Union[str, bytes]) -> PyJWK:
+        """Get the signing key for the kid given in the (unverified) header of a JWT.
+
+        Args:
+            token (Union[str, bytes]): JWT.
+
+        Returns:
+            PyJWK: Signing key.
+        """
+        header: Dict[str, Any] = get_unverified_header(token)
+        return self.get_signing_key(kid=header.get("kid"))
+
+    def get_signing_key(self, kid: Optional[str]) -> PyJWK:
+        """Get the signing key for the given kid.
+
+        An unknown kid forces a synchronous refresh, since it usually means that keys were rotated.
+        The refresh is skipped if another caller already replaced the key set in the meantime, if the
+        last refresh is less than min_refresh_interval seconds ago or if the kid is known to be unknown.
+
+        Args:
+            kid (Optional[str]): Key id.
+
+        Raises:
+            PyJWKClientError: If no signing key matches the kid.
+
+        Returns:
+            PyJWK: Signing key.
+        """
+        snapshot: _KeySnapshot = self._snapshot
+        keys: Mapping[str, PyJWK] = snapshot.keys
+        fetched_at: Optional[float] = snapshot.fetched_at
+        refreshed = False
+
+        if fetched_at is None:
+            keys = self._refresh_if_unchanged(fetched_at=fetched_at)
+            refreshed = True
+        else:
+            age: float = time.monotonic() - fetched_at
+            if age >= self.lifespan + self.max_stale:
+                keys = self._refresh_if_unchanged(fetched_at=fetched_at)
+                refreshed = True
+            elif age >= self.lifespan - self.refresh_ahead:
+                self._refresh_in_background()
+
+        signing_key: Optional[PyJWK] = keys.get(kid) if kid is not None else None
+        if signing_key is not None:
+            return signing_key
+
+        if kid is not None and self._unknown_kids.get(kid) is None:
+            if not refreshed and (fetched_at is None or time.monotonic() - fetched_at >= self.min_refresh_interval):
+                keys = self._refresh_if_unchanged(fetched_at=fetched_at, kid=kid)
+                refreshed = True
+                signing_key = keys.get(kid)
+                if signing_key is not None:
+                    return signing_key
+            if refreshed:
+                self._unknown_kids.put(kid, True)
+
+        with self._lock:
+            self._rejected_kid_count += 1
+        raise PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+
+    def get_cached_signing_key(self, kid: Optional[str]) -> Optional[PyJWK]:
+        """Get the signing key for the given kid from memory, without ever fetching synchronously.
+
+        Like get_signing_key(), a background refresh is started if the key set is about to expire.
+        This allows callers that must not block (e.g. on an asyncio event loop) to only delegate
+        lookups that need a fetch to a thread.
+
+        Args:
+            kid (Optional[str]): Key id.
+
+        Returns:
+            Optional[PyJWK]: Signing key or None, if the kid is not in the cached key set or
+                the key set needs to be fetched first.
+        """
+        snapshot: _KeySnapshot = self._snapshot
+        fetched_at: Optional[float] = snapshot.fetched_at
+
+        if fetched_at is None or kid is None:
+            return None
+        age: float = time.monotonic() - fetched_at
+        if age >= self.lifespan + self.max_stale:
+            return None
+        if age >= self.lifespan - self.refresh_ahead:
+            self._refresh_in_background()
+        return snapshot.keys.get(kid)
+
+    def refresh(self) -> Mapping[str, PyJWK]:
+        """Fetch the key set synchronously and replace the cached one.
+
+        If a fetch is already in flight, its result is awaited and shared instead of fetching again.
+
+        Returns:
+            Mapping[str, PyJWK]: Signing keys by kid (read-only).
+        """
+        return self._single_flight.do(self.uri, self._refresh)
+
+    def seed(self, document: Dict[str, Any]) -> Mapping[str, PyJWK]:
+        """Replace the cached key set with the given JWKS document without fetching it.
+
+        Args:
+            document (Dict[str, Any]): Key set as JSON document.
+
+        Returns:
+            Mapping[str, PyJWK]: Signing keys by kid (read-only).
+        """
+        keys: Mapping[str, PyJWK] = self._parse(document=document)
+        with self._lock:
+            self._snapshot = _KeySnapshot(keys=keys, document=document, fetched_at=time.monotonic())
+            self._stored_at = time.time()
+        return keys
+
+    # --------- Private methods ----------#
+    def _refresh(self, kid: Optional[str] = None) -> Mapping[str, PyJWK]:
+        """Load the key set from the key store or fetch it, and replace the cached one.
+
+        Args:
+            kid (Optional[str]): Unknown kid that forced the refresh, a stored key set without it is not used.
+                Defaults to None.
+
+        Raises:
+            Exception: Any error raised while fetching or parsing the key set.
+
+        Returns:
+            Mapping[str, PyJWK]: Signing keys by kid.
+        """
+        stored_keys: Optional[Mapping[str, PyJWK]] = self._load_from_key_store(kid=kid)
+        if stored_keys is not None:
+            return stored_keys
+
+        try:
+            document: Dict[str, Any] = self._fetch_document()
+            keys: Mapping[str, PyJWK] = self._parse(document=document)
+        except Exception as error:
+            with self._lock:
+                self._refresh_failure_count += 1
+                self._last_refresh_error = error
+            raise
+
+        with self._lock:
+            self._snapshot = _KeySnapshot(keys=keys, document=document, fetched_at=time.monotonic())
+            self._refresh_success_count += 1
+            self._last_refresh_error = None
+
+        if self._key_store is not None and not self.offline:
+            try:
+                self._key_store.save(document=document)
+            except Exception:  # noqa: S110 - sharing is best effort, the fetched keys are used anyway
+                pass
+        # set after saving, so the own key set in the store never counts as newer
+        with self._lock:
+            self._stored_at = time.time()
+        return keys
+
+    def _load_from_key_store(self, kid: Optional[str] = None) -> Optional[Mapping[str, PyJWK]]:
+        """Load the key set from the key store, if it is fresh and newer than the cached one.
+
+        Args:
+            kid (Optional[str]): Kid the key set must contain, e.g. because a token with this kid forced the refresh.
+                Defaults to None.
+
+        Returns:
+            Optional[Mapping[str, PyJWK]]: Signing keys by kid or None, if the key set must be fetched.
+        """
+        if self._key_store is None or self.offline:
+            return None
+        try:
+            stored: Optional[StoredKeySet] = self._key_store.load()
+        except Exception:
+            return None
+        if stored is None:
+            return None
+
+        age: float = max(0.0, time.time() - stored.stored_at)
+        with self._lock:
+            stored_at: Optional[float] = self._stored_at
+        if age >= self.lifespan - self.refresh_ahead or (stored_at is not None and stored.stored_at <= stored_at):
+            return None
+
+        try:
+            keys: Mapping[str, PyJWK] = self._parse(document=stored.document)
+        except Exception:
+            return None
+        if kid is not None and kid not in keys:
+            # e.g. saved by another process before the keys were rotated
+            return None
+
+        with self._lock:
+            self._snapshot = _KeySnapshot(keys=keys, document=stored.document, fetched_at=time.monotonic() - age)
+            self._stored_at = stored.stored_at
+            self._key_store_hit_count += 1
+        return keys
+
+    def _refresh_if_unchanged(self, fetched_at: Optional[float], kid: Optional[str] = None) -> Mapping[str, PyJWK]:
+        """Refresh the key set unless it was replaced after the given fetch time.
+
+        Args:
+            fetched_at (Optional[float]): Fetch time of the key set the caller has seen.
+            kid (Optional[str]): Unknown kid that forces the refresh. Defaults to None.
+
+        Returns:
+            Mapping[str, PyJWK]: Signing keys by kid.
+        """
+        snapshot: _KeySnapshot = self._snapshot
+        if snapshot.fetched_at != fetched_at:
+            return snapshot.keys
+        if kid is None:
+            return self.refresh()
+        return self._single_flight.do(self.uri, partial(self._refresh, kid=kid))
+
+    def _fetch_document(self) -> Dict[str, Any]:
+        """Fetch the key set from the JWKS endpoint, or read it from the local document or file.
+
+        Raises:
+            PyJWKClientError: If the local file could not be read.
+
+        Returns:
+            Dict[str, Any]: Key set as JSON document.
+        """
+        if self._static_document is not None:
+            return self._static_document
+        if self.document_path is not None:
+            try:
+                with open(self.document_path, encoding="utf-8") as document_file:
+                    document: Any = json.load(document_file)
+            except (OSError, ValueError) as error:
+                raise PyJWKClientError(f'Failed to read JWKS file "{self.document_path}": {error}') from error
+            if not isinstance(document, dict):
+                raise PyJWKClientError(f'JWKS file "{self.document_path}" does not contain a JSON object')
+            return document
+
+        fetched: Dict[str, Any] = self._client.fetch_data()
+        return fetched
+
+    @staticmethod
+    def _parse(document: Dict[str, Any]) -> Mapping[str, PyJWK]:
+        """Parse the signing keys of a key set.
+
+        Args:
+            document (Dict[str, Any]): Key set as JSON document.
+
+        Raises:
+            PyJWKClientError: If the key set does not contain any signing keys.
+
+        Returns:
+            Mapping[str, PyJWK]: Signing keys by kid (read-only).
+        """
+        jwk_set: PyJWKSet = PyJWKSet.from_dict(document)
+        keys: Dict[str, PyJWK] = {
+            key.key_id: key for key in jwk_set.keys if key.public_key_use in ("sig", None) and key.key_id
+        }
+        if not keys:
+            raise PyJWKClientError("The JWKS endpoint did not contain any signing keys")
+        return MappingProxyType(keys)
+
+    def _refresh_in_background(self) -> None:
+        """Start a background refresh unless one is already running or the last one started less than min_refresh_interval seconds ago."""
+        # checked without the lock first, so lookups in the refresh window do not serialize
+        if not self._background_refresh_due():
+            return
+        with self._lock:
+            if not self._background_refresh_due():
+                return
+            self._refreshing = True
+            self._background_refresh_at = time.monotonic()
+
+        threading.Thread(target=self._run_background_refresh, name="corbado-jwks-refresh", daemon=True).start()
+
+    def _background_refresh_due(self) -> bool:
+        """Check whether a background refresh may be started, i.e. none is running and the last one is long enough ago.
+
+        Returns:
+            bool: True, if a background refresh may be started.
+        """
+        # after a failed refresh, the stale key set is served until the next try is due
+        background_refresh_at: Optional[float] = self._background_refresh_at
+        return not self._refreshing and (
+            background_refresh_at is None or time.monotonic() - background_refresh_at >= self.min_refresh_interval
+        )
+
+    def _run_background_refresh(self) -> None:
+        """Refresh the key set, errors are recorded in the failure counter."""
+        try:
+            self.refresh()
+        except Exception:  # noqa: S110 - failure is counted, stale keys keep being served
+            pass
+        finally:
+            with self._lock:
+                self._refreshing = False
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+
+class StoredKeySet(NamedTuple):
+    """Key set loaded from a key store.
+
+    Attributes:
+        document (Dict[str, Any]): Key set as JSON document.
+        stored_at (float): Time (seconds since the epoch) the key set was stored.
+    """
+
+    document: Dict[str, Any]
+    stored_at: float
+
+
+class KeyStore(ABC):
+    """Store to share the JSON Web Key Set (JWKS) between processes.
+
+    The JWKSCache of the first process that fetches the key set saves it to the store, the
+    caches of all other processes load it from there instead of fetching it themselves.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[StoredKeySet]:
+        """Load the key set.
+
+        Returns:
+            Optional[StoredKeySet]: Key set or None, if nothing was stored yet.
+        """
+
+    @abstractmethod
+    def save(self, document: Dict[str, Any]) -> None:
+        """Save the key set.
+
+        Args:
+            document (Dict[str, Any]): Key set as JSON document.
+        """
+
+
+class FileKeyStore(KeyStore):
+    """Key store keeping the key set in a JSON file, e.g. for the workers of a pre-fork server.
+
+    Writes go to a temporary file which atomically replaces the key set file, so readers never
+    see partial writes. The modification time of the file is used as storage time, the file is
+    only read again if it changed. Put the file on a memory-backed file system (like /dev/shm)
+    to avoid disk I/O.
+
+    Attributes:
+        path (str): Path of the key set file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize a new instance of the FileKeyStore class.
+
+        Args:
+            path (str): Path of the key set file, its directory must exist.
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._loaded: Optional[Tuple[Tuple[int, int], StoredKeySet]] = None
+
+    def load(self) -> Optional[StoredKeySet]:
+        """Load the key set from the file.
+
+        Returns:
+            Optional[StoredKeySet]: Key set or None, if the file does not exist or is invalid.
+        """
+        try:
+            stat: os.stat_result = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        version: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if self._loaded is not None and self._loaded[0] == version:
+                return self._loaded[1]
+
+        try:
+            with open(self.path, encoding="utf-8") as key_set_file:
+                document: Any = json.load(key_set_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict):
+            return None
+
+        stored: StoredKeySet = StoredKeySet(document=document, stored_at=stat.st_mtime)
+        with self._lock:
+            self._loaded = (version, stored)
+        return stored
+
+    def save(self, document: Dict[str, Any]) -> None:
+        """Save the key set to the file, atomically replacing the existing one.
+
+        Args:
+            document (Dict[str, Any]): Key set as JSON document.
+        """
+        directory: str = os.path.dirname(os.path.abspath(self.path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".jwks-", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                json.dump(document, temp_file)
+            os.chmod(temp_path, 0o644)  # noqa: S103 - public keys only
+            os.replace(temp_path, self.path)
+        finally:
+            # only left over if writing failed
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
@@ -0,0 +1,280 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from corbado_python_sdk.exceptions.server_exception import ServerException
+from corbado_python_sdk.generated.api import SessionsApi
+from corbado_python_sdk.generated.exceptions import ApiException
+from corbado_python_sdk.generated.models.session_list import SessionList
+
+from .single_flight import SingleFlight
+
+DEFAULT_REVOCATION_REFRESH_INTERVAL = 30
+DEFAULT_REVOCATION_RETENTION = 3600
+DEFAULT_REVOCATION_PAGE_SIZE = 100
+DEFAULT_SESSION_ID_CLAIM = "sid"
+
+# incremental syncs start slightly before the previous one, so clock skew between the
+# SDK and the Backend API never makes a revocation fall between two syncs
+_SYNC_OVERLAP = 60
+
+
+class RevocationFilter:
+    """In-memory set of revoked session ids, kept up to date from the Backend API.
+
+    Checking a session id is a set lookup, the set is synced incrementally (only sessions revoked
+    since the previous sync are listed) in a background thread started by is_revoked() once the
+    last sync is older than refresh_interval. Only the very first sync blocks (check initial_sync_pending
+    to run it off an event loop, or sync at startup with refresh()). If a sync fails,
+    the known revocations keep being used. Revocations done via revoke() take effect immediately,
+    entries are dropped retention seconds after they were added.
+
+    Attributes:
+        client (SessionsApi): Sessions API client.
+        refresh_interval (float): Time in seconds between syncs.
+        retention (float): Time in seconds a revoked session id is kept, should cover the lifetime of session tokens.
+        page_size (int): Number of sessions requested per page.
+        session_id_claim (str): Claim of the session token holding the session id.
+    """
+
+    def __init__(
+        self,
+        client: SessionsApi,
+        refresh_interval: float = DEFAULT_REVOCATION_REFRESH_INTERVAL,
+        retention: float = DEFAULT_REVOCATION_RETENTION,
+        page_size: int = DEFAULT_REVOCATION_PAGE_SIZE,
+        session_id_claim: str = DEFAULT_SESSION_ID_CLAIM,
+    ) -> None:
+        """Initialize a new instance of the RevocationFilter class.
+
+        Args:
+            client (SessionsApi): Sessions API client.
+            refresh_interval (float): Time in seconds between syncs. Defaults to DEFAULT_REVOCATION_REFRESH_INTERVAL.
+            retention (float): Time in seconds a revoked session id is kept. Defaults to DEFAULT_REVOCATION_RETENTION.
+            page_size (int): Number of sessions requested per page. Defaults to DEFAULT_REVOCATION_PAGE_SIZE.
+            session_id_claim (str): Claim of the session token holding the session id. Defaults to DEFAULT_SESSION_ID_CLAIM.
+
+        Raises:
+            ValueError: If refresh_interval, retention or page_size are not positive.
+        """
+        if refresh_interval <= 0:
+            raise ValueError(f'Refresh interval must be greater than 0, the input is "{refresh_interval}"')
+        if retention <= 0:
+            raise ValueError(f'Retention must be greater than 0, the input is "{retention}"')
+        if page_size <= 0:
+            raise ValueError(f'Page size must be greater than 0, the input is "{page_size}"')
+
+        self.client: SessionsApi = client
+        self.refresh_interval: float = refresh_interval
+        self.retention: float = retention
+        self.page_size: int = page_size
+        self.session_id_claim: str = session_id_claim
+
+        self._lock = threading.Lock()
+        self._single_flight: SingleFlight[int] = SingleFlight()
+        # replaced as a whole on sync, so lookups never need the lock
+        self._revoked: Dict[str, float] = {}
+        self._synced_until: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._refreshing: bool = False
+        self._refresh_success_count: int = 0
+        self._refresh_failure_count: int = 0
+        self._rejected_count: int = 0
+        self._last_refresh_error: Optional[Exception] = None
+
+    # --------- Properties ----------#
+    @property
+    def refresh_success_count(self) -> int:
+        """Get number of successful syncs.
+
+        Returns:
+            int: Number of successful syncs.
+        """
+        return self._refresh_success_count
+
+    @property
+    def refresh_failure_count(self) -> int:
+        """Get number of failed syncs.
+
+        Returns:
+            int: Number of failed syncs.
+        """
+        return self._refresh_failure_count
+
+    @property
+    def rejected_count(self) -> int:
+        """Get number of lookups of revoked session ids.
+
+        Returns:
+            int: Number of rejected lookups.
+        """
+        return self._rejected_count
+
+    @property
+    def last_refresh_error(self) -> Optional[Exception]:
+        """Get error of the last sync, if it failed.
+
+        Returns:
+            Optional[Exception]: Error or None, if the last sync succeeded.
+        """
+        return self._last_refresh_error
+
+    @property
+    def initial_sync_pending(self) -> bool:
+        """Get whether no sync was started yet, the next is_revoked() then blocks until the first sync finished.
+
+        Returns:
+            bool: True, if is_revoked() would sync synchronously.
+        """
+        return self._attempted_at is None
+
+    # --------- Core methods ----------#
+    def is_revoked(self, session_id: str) -> bool:
+        """Check whether the session has been revoked, starts a sync if due.
+
+        Args:
+            session_id (str): Session ID.
+
+        Returns:
+            bool: True if revoked.
+        """
+        attempted_at: Optional[float] = self._attempted_at
+        if attempted_at is None:
+            try:
+                self.refresh()
+            except Exception:  # noqa: S110 - failure is counted, the next sync runs in the background
+                pass
+        elif time.monotonic() - attempted_at >= self.refresh_interval:
+            self._refresh_in_background()
+
+        if session_id in self._revoked:
+            with self._lock:
+                self._rejected_count += 1
+            return True
+        return False
+
+    def revoke(self, session_id: str) -> None:
+        """Revoke the session via the Backend API, it is rejected locally right away.
+
+        Args:
+            session_id (str): Session ID.
+
+        Raises:
+            ServerException: If the session could not be revoked.
+        """
+        try:
+            self.client.session_revoke(session_id=session_id)
+        except ApiException as e:
+            raise ServerException(e)
+        self.add(session_id=session_id)
+
+    def add(self, session_id: str) -> None:
+        """Add a revoked session id, e.g. from a webhook handler.
+
+        Args:
+            session_id (str): Session ID.
+        """
+        with self._lock:
+            revoked: Dict[str, float] = dict(self._revoked)
+            revoked[session_id] = time.monotonic()
+            self._revoked = revoked
+
+    def refresh(self) -> int:
+        """Sync the revoked sessions synchronously.
+
+        If a sync is already in flight, its result is awaited and shared instead of syncing again.
+
+        Returns:
+            int: Number of revoked session ids.
+        """
+        return self._single_flight.do("sync", self._refresh)
+
+    def __len__(self) -> int:
+        """Get number of revoked session ids.
+
+        Returns:
+            int: Number of revoked session ids.
+        """
+        return len(self._revoked)
+
+    # --------- Private methods ----------#
+    def _refresh(self) -> int:
+        """List the sessions revoked since the previous sync and merge them into the set.
+
+        Raises:
+            ServerException: If the sessions could not be listed.
+
+        Returns:
+            int: Number of revoked session ids.
+        """
+        started_at: float = time.time()
+        with self._lock:
+            self._attempted_at = time.monotonic()
+            since: float = (self._synced_until if self._synced_until is not None else started_at - self.retention) - _SYNC_OVERLAP
+
+        try:
+            session_ids: List[str] = self._list_revoked(since=since)
+        except Exception as error:
+            with self._lock:
+                self._refresh_failure_count += 1
+                self._last_refresh_error = error
+            if isinstance(error, ApiException):
+                raise ServerException(error)
+            raise
+
+        with self._lock:
+            now: float = time.monotonic()
+            revoked: Dict[str, float] = {
+                session_id: added_at for session_id, added_at in self._revoked.items() if now - added_at < self.retention
+            }
+            for session_id in session_ids:
+                revoked.setdefault(session_id, now)
+            self._revoked = revoked
+            self._synced_until = started_at
+            self._refresh_success_count += 1
+            self._last_refresh_error = None
+            return len(revoked)
+
+    def _list_revoked(self, since: float) -> List[str]:
+        """List the ids of all sessions revoked since the given time.
+
+        Args:
+            since (float): Time (seconds since the epoch).
+
+        Returns:
+            List[str]: Session IDs.
+        """
+        updated_after: str = datetime.fromtimestamp(since, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        session_ids: List[str] = []
+        page: int = 1
+        while True:
+            session_list: SessionList = self.client.session_list(
+                sort="updated:asc",
+                filter=["status:eq:revoked", f"updated:gt:{updated_after}"],
+                page=page,
+                page_size=self.page_size,
+            )
+            session_ids.extend(session.session_id for session in session_list.sessions)
+            if page >= session_list.paging.total_pages:
+                return session_ids
+            page += 1
+
+    def _refresh_in_background(self) -> None:
+        """Start a background sync unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        threading.Thread(target=self._run_background_refresh, name="corbado-revocation-refresh", daemon=True).start()
+
+    def _run_background_refresh(self) -> None:
+        """Sync the revoked sessions, errors are recorded in the failure counter."""
+        try:
+            self.refresh()
+        except Exception:  # noqa: S110 - failure is counted, known revocations keep being used
+            pass
+        finally:
+            with self._lock:
+                self._refreshing = False
@@ -0,0 +1,69 @@
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """In-flight call shared by all callers of the same key."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        """Initialize a new in-flight call."""
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller of a key executes the function, all callers arriving while it is running
+    wait for it and share its result (or its exception). As soon as the call finished, the next
+    caller of the key executes the function again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the SingleFlight class."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Execute fn for the key, or wait for the execution already in flight.
+
+        Args:
+            key (Hashable): Key identifying the call.
+            fn (Callable[[], T]): Function to execute.
+
+        Raises:
+            BaseException: Any error raised by fn, for the executing caller.
+            error: The same error, for all waiting callers.
+
+        Returns:
+            T: Result of fn.
+        """
+        with self._lock:
+            call: Optional[_Call[T]] = self._calls.get(key)
+            leader: bool = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            error: Optional[BaseException] = call.error
+            if error is not None:
+                raise error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as fn_error:
+            call.error = fn_error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
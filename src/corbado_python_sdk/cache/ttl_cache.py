@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe, size-bounded LRU cache whose entries expire after a time to live (TTL).
+
+    If the cache is full, the least recently used entry is evicted. Expired entries are
+    dropped lazily on access.
+
+    Attributes:
+        max_size (int): Maximum number of entries.
+        ttl (float): Default time to live of an entry in seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize a new instance of the TTLCache class.
+
+        Args:
+            max_size (int): Maximum number of entries.
+            ttl (float): Default time to live of an entry in seconds.
+
+        Raises:
+            ValueError: If max_size or ttl are not positive.
+        """
+        if max_size <= 0:
+            raise ValueError(f'Max size must be greater than 0, the input is "{max_size}"')
+        if ttl <= 0:
+            raise ValueError(f'TTL must be greater than 0, the input is "{ttl}"')
+
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    # --------- Properties ----------#
+    @property
+    def hits(self) -> int:
+        """Get number of cache hits.
+
+        Returns:
+            int: Number of hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of cache misses, expired entries count as misses.
+
+        Returns:
+            int: Number of misses.
+        """
+        return self._misses
+
+    # --------- Core methods ----------#
+    def get(self, key: K) -> Optional[V]:
+        """Get the value for the key.
+
+        Args:
+            key (K): Key.
+
+        Returns:
+            Optional[V]: Value or None, if the key is unknown or expired.
+        """
+        with self._lock:
+            entry: Optional[Tuple[float, V]] = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store the value for the key.
+
+        Args:
+            key (K): Key.
+            value (V): Value.
+            ttl (Optional[float], optional): Time to live in seconds, overrides the default TTL. Defaults to None.
+        """
+        expires_at: float = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Remove the entry for the key, if any.
+
+        Args:
+            key (K): Key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get number of entries (including expired entries not dropped yet).
+
+        Returns:
+            int: Number of entries.
+        """
+        return len(self._entries)
@@ -0,0 +1,169 @@
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+from corbado_python_sdk.exceptions.server_exception import ServerException
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.exceptions import ApiException, NotFoundException
+from corbado_python_sdk.generated.models.user import User
+from corbado_python_sdk.generated.models.user_status import UserStatus
+
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+
+DEFAULT_USER_STATUS_CACHE_SIZE = 10_000
+DEFAULT_USER_STATUS_TTL = 60
+
+
+class _StatusEntry(NamedTuple):
+    """Cached user status, status None means the user does not exist."""
+
+    status: Optional[UserStatus]
+
+
+class UserStatusCache:
+    """Cache for the status of users, so session validation can reject disabled or deleted users.
+
+    Statuses are retrieved from the Backend API and cached for ttl seconds, users that do not
+    exist (anymore) for not_found_ttl seconds. Concurrent lookups of the same uncached user share
+    one request. Call invalidate() when a user changed, e.g. from user.updated and user.deleted
+    webhook handlers.
+
+    Attributes:
+        client (UsersApi): Users API client.
+        ttl (float): Time in seconds a status is cached.
+        not_found_ttl (float): Time in seconds a not existing user is cached.
+    """
+
+    def __init__(
+        self,
+        client: UsersApi,
+        max_size: int = DEFAULT_USER_STATUS_CACHE_SIZE,
+        ttl: float = DEFAULT_USER_STATUS_TTL,
+        not_found_ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize a new instance of the UserStatusCache class.
+
+        Args:
+            client (UsersApi): Users API client.
+            max_size (int): Maximum number of cached users. Defaults to DEFAULT_USER_STATUS_CACHE_SIZE.
+            ttl (float): Time in seconds a status is cached. Defaults to DEFAULT_USER_STATUS_TTL.
+            not_found_ttl (Optional[float], optional): Time in seconds a not existing user is cached.
+                Defaults to None (same as ttl).
+
+        Raises:
+            ValueError: If not_found_ttl is not positive.
+        """
+        if not_found_ttl is not None and not_found_ttl <= 0:
+            raise ValueError(f'Not found TTL must be greater than 0, the input is "{not_found_ttl}"')
+
+        self.client: UsersApi = client
+        self.ttl: float = ttl
+        self.not_found_ttl: float = ttl if not_found_ttl is None else not_found_ttl
+        self._entries: TTLCache[str, _StatusEntry] = TTLCache(max_size=max_size, ttl=ttl)
+        self._single_flight: SingleFlight[Optional[UserStatus]] = SingleFlight()
+        self._lock = threading.Lock()
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    # --------- Properties ----------#
+    @property
+    def hits(self) -> int:
+        """Get number of lookups answered from the cache.
+
+        Returns:
+            int: Number of hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of lookups that needed a request to the Backend API (or waited for one).
+
+        Returns:
+            int: Number of misses.
+        """
+        return self._misses
+
+    # --------- Core methods ----------#
+    def get_status(self, user_id: str) -> Optional[UserStatus]:
+        """Get the status of the user, retrieving it from the Backend API if not cached.
+
+        Args:
+            user_id (str): User ID.
+
+        Returns:
+            Optional[UserStatus]: Status or None, if the user does not exist.
+        """
+        found, status = self.get_cached_status(user_id=user_id)
+        if found:
+            return status
+
+        with self._lock:
+            self._misses += 1
+        return self._single_flight.do(user_id, lambda: self._load(user_id=user_id))
+
+    def get_cached_status(self, user_id: str) -> Tuple[bool, Optional[UserStatus]]:
+        """Get the status of the user from the cache, never sends a request.
+
+        Args:
+            user_id (str): User ID.
+
+        Returns:
+            Tuple[bool, Optional[UserStatus]]: Whether the user is cached and its status (None, if the user does not exist).
+        """
+        entry: Optional[_StatusEntry] = self._entries.get(user_id)
+        if entry is None:
+            return False, None
+
+        with self._lock:
+            self._hits += 1
+        return True, entry.status
+
+    def invalidate(self, user_id: str) -> None:
+        """Remove the user from the cache, e.g. after a user.updated or user.deleted webhook.
+
+        Args:
+            user_id (str): User ID.
+        """
+        with self._lock:
+            self._generation += 1
+        self._entries.invalidate(user_id)
+
+    def clear(self) -> None:
+        """Remove all users from the cache."""
+        with self._lock:
+            self._generation += 1
+        self._entries.clear()
+
+    # --------- Private methods ----------#
+    def _load(self, user_id: str) -> Optional[UserStatus]:
+        """Retrieve the status of the user from the Backend API and cache it.
+
+        Args:
+            user_id (str): User ID.
+
+        Raises:
+            ServerException: If the status could not be retrieved.
+
+        Returns:
+            Optional[UserStatus]: Status or None, if the user does not exist.
+        """
+        with self._lock:
+            generation: int = self._generation
+
+        status: Optional[UserStatus]
+        try:
+            user: User = self.client.user_get(user_id=user_id)
+            status = user.status
+        except NotFoundException:
+            status = None
+        except ApiException as e:
+            raise ServerException(e)
+
+        # an invalidation while the request was in flight might have been caused by a change the
+        # response does not reflect yet, so the result is not cached then
+        with self._lock:
+            if generation == self._generation:
+                self._entries.put(user_id, _StatusEntry(status=status), ttl=self.ttl if status is not None else self.not_found_ttl)
+        return status
@@ -1,6 +1,41 @@
-from pydantic import BaseModel, ConfigDict, StringConstraints, field_validator
-from typing_extensions import Annotated, Optional
+import json
 
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Annotated, Any, Dict, List, Optional
+
+from corbado_python_sdk.aio import DEFAULT_ASYNC_MAX_CONNECTIONS
+from corbado_python_sdk.cache import (
+    DEFAULT_JWKS_LIFESPAN,
+    DEFAULT_JWKS_MAX_STALE,
+    DEFAULT_JWKS_MAX_UNKNOWN_KIDS,
+    DEFAULT_JWKS_MIN_REFRESH_INTERVAL,
+    DEFAULT_JWKS_REFRESH_AHEAD,
+    DEFAULT_JWKS_UNKNOWN_KID_TTL,
+    DEFAULT_REVOCATION_REFRESH_INTERVAL,
+    DEFAULT_SESSION_ID_CLAIM,
+    DEFAULT_USER_STATUS_TTL,
+)
+from corbado_python_sdk.resilience import (
+    DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_OPEN_TIMEOUT,
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+    DEFAULT_CONCURRENCY_MAX_LIMIT,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_DEADLINE,
+    DEFAULT_RETRY_MAX_DELAY,
+)
 from corbado_python_sdk.utils import validators
 
 
@@ -18,6 +53,54 @@ class Config(BaseModel):
         api_secret (str): The secret key used to authenticate API requests.
         frontend_api (str): The base URL for the frontend API.
         backend_api (str): The base URL for the backend API.
+        extra_issuers (List[str]): Further accepted session token issuers, e.g. if the project is reachable via
+            several CNAMEs.
+        jwks_refresh_ahead (int): Seconds before expiry of the cached JWKS at which it is refreshed in the background.
+        jwks_max_stale (int): Seconds an expired JWKS is still served while refreshing fails.
+        jwks_min_refresh_interval (int): Minimum seconds between JWKS refreshes forced by tokens with an unknown kid.
+        jwks_unknown_kid_ttl (int): Seconds a kid that is not in the JWKS is rejected without refreshing the JWKS.
+        jwks_max_unknown_kids (int): Maximum number of remembered unknown kids.
+        jwks_store_path (Optional[str]): Path of a file to share the JWKS between processes (e.g. workers of a
+            pre-fork server). Preferably on a memory-backed file system like /dev/shm.
+        jwks (Optional[Dict[str, Any]]): Static JWKS document (or its JSON string) for environments without
+            network access, the JWKS endpoint is then never contacted.
+        jwks_path (Optional[str]): Path of a local JWKS file, the JWKS endpoint is then never contacted.
+        token_cache_size (int): Maximum number of validated session tokens to cache, 0 disables the cache.
+        omit_token_in_errors (bool): Never put the raw session token into a TokenValidationException.
+        user_status_cache_size (int): Maximum number of cached user statuses. If greater than 0, session validation
+            rejects tokens of disabled or deleted users (retrieving statuses from the Backend API), 0 disables it.
+        user_status_ttl (int): Seconds a user status is cached.
+        revocation_check (bool): Reject session tokens of revoked sessions, using a set of revoked session ids synced
+            from the Backend API in the background.
+        revocation_refresh_interval (int): Seconds between syncs of the revoked sessions.
+        session_id_claim (str): Claim of the session token holding the session id.
+        async_max_connections (int): Maximum number of open connections of the async API client.
+        retry_max_attempts (int): Maximum number of attempts of a Backend API call, 1 (the default) disables retries.
+            If greater than 1, connection errors and 429/502/503/504 responses of idempotent requests are retried with
+            backoff, and the connection retries of urllib3 are turned off for all requests (including POST and PATCH).
+        retry_base_delay (float): Backoff in seconds of the first retry, doubled for each further retry (with full jitter).
+        retry_max_delay (float): Maximum backoff in seconds (a Retry-After header is honored instead).
+        retry_deadline (float): Seconds all attempts of a Backend API call have to fit in, 10 by default. If retries are
+            enabled, it is also the timeout of every call without an explicit _request_timeout.
+        circuit_breaker (bool): Fail Backend API calls fast with a CircuitOpenException while the Backend API is
+            failing, instead of waiting for timeouts (one circuit per host and operation).
+        circuit_failure_threshold (int): Consecutive failures that open a circuit.
+        circuit_error_rate_threshold (float): Failure rate (0 to 1) over recent calls that opens a circuit.
+        circuit_open_timeout (float): Seconds a circuit stays open before probe requests are let through.
+        rate_limit_reads (Optional[float]): Maximum read (GET) requests per second to the Backend API, None for no limit.
+        rate_limit_writes (Optional[float]): Maximum write (POST, PATCH, PUT, DELETE) requests per second to the Backend
+            API, None for no limit.
+        rate_limit_burst (Optional[int]): Requests that can be sent at once after being idle, None for one second of
+            requests.
+        rate_limit_timeout (Optional[float]): Maximum seconds a request waits for the rate limit before failing with a
+            RateLimitException, None to wait as long as needed.
+        adaptive_concurrency (bool): Adapt the number of concurrent Backend API requests to the observed latency and
+            errors (AIMD), instead of only limiting it by the connection pool size.
+        concurrency_initial_limit (int): Number of concurrent requests the adaptive limit starts with (at most
+            concurrency_max_limit).
+        concurrency_max_limit (int): Highest adaptive limit, also used as connection pool size.
+        concurrency_timeout (Optional[float]): Maximum seconds a request waits for a free slot before failing with a
+            ConcurrencyLimitException, None to wait as long as needed.
     """
 
     # Make sure that field assignments are also validated, use "set_assignment_validation(False)"
@@ -32,6 +115,40 @@ class Config(BaseModel):
 
     cname: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
 
+    extra_issuers: List[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = Field(default_factory=list)
+    jwks_refresh_ahead: Annotated[int, Field(ge=0, lt=DEFAULT_JWKS_LIFESPAN)] = DEFAULT_JWKS_REFRESH_AHEAD
+    jwks_max_stale: NonNegativeInt = DEFAULT_JWKS_MAX_STALE
+    jwks_min_refresh_interval: NonNegativeInt = DEFAULT_JWKS_MIN_REFRESH_INTERVAL
+    jwks_unknown_kid_ttl: PositiveInt = DEFAULT_JWKS_UNKNOWN_KID_TTL
+    jwks_max_unknown_kids: PositiveInt = DEFAULT_JWKS_MAX_UNKNOWN_KIDS
+    jwks_store_path: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
+    jwks: Optional[Dict[str, Any]] = None
+    jwks_path: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
+    token_cache_size: NonNegativeInt = 0
+    omit_token_in_errors: bool = False
+    user_status_cache_size: NonNegativeInt = 0
+    user_status_ttl: PositiveInt = DEFAULT_USER_STATUS_TTL
+    revocation_check: bool = False
+    revocation_refresh_interval: PositiveInt = DEFAULT_REVOCATION_REFRESH_INTERVAL
+    session_id_claim: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)] = DEFAULT_SESSION_ID_CLAIM
+    async_max_connections: PositiveInt = DEFAULT_ASYNC_MAX_CONNECTIONS
+    retry_max_attempts: PositiveInt = 1
+    retry_base_delay: PositiveFloat = DEFAULT_RETRY_BASE_DELAY
+    retry_max_delay: PositiveFloat = DEFAULT_RETRY_MAX_DELAY
+    retry_deadline: PositiveFloat = DEFAULT_RETRY_DEADLINE
+    circuit_breaker: bool = False
+    circuit_failure_threshold: PositiveInt = DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+    circuit_error_rate_threshold: Annotated[float, Field(gt=0, le=1)] = DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD
+    circuit_open_timeout: PositiveFloat = DEFAULT_CIRCUIT_OPEN_TIMEOUT
+    rate_limit_reads: Optional[PositiveFloat] = None
+    rate_limit_writes: Optional[PositiveFloat] = None
+    rate_limit_burst: Optional[PositiveInt] = None
+    rate_limit_timeout: Optional[NonNegativeFloat] = None
+    adaptive_concurrency: bool = False
+    concurrency_initial_limit: PositiveInt = DEFAULT_CONCURRENCY_INITIAL_LIMIT
+    concurrency_max_limit: PositiveInt = DEFAULT_CONCURRENCY_MAX_LIMIT
+    concurrency_timeout: Optional[NonNegativeFloat] = None
+
     _issuer: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
 
     @field_validator(
@@ -106,6 +223,43 @@ class Config(BaseModel):
             raise ValueError(f'Invalid API Secret "{api_secret}" given, needs to start with "corbado1_"')
         return api_secret
 
+    @field_validator("jwks", mode="before")
+    @classmethod
+    def jwks_validator(cls, jwks: Any) -> Any:
+        """Field validator for jwks, decodes a JWKS given as JSON string.
+
+        Args:
+            jwks (Any): JWKS document or its JSON string
+
+        Raises:
+            ValueError: Raises ValueError if jwks is not valid JSON or has no "keys"
+
+        Returns:
+            Any: JWKS document
+        """
+        if isinstance(jwks, str):
+            try:
+                jwks = json.loads(jwks)
+            except ValueError as error:
+                raise ValueError(f"Invalid JWKS given, not valid JSON: {error}")
+        if isinstance(jwks, dict) and not isinstance(jwks.get("keys"), list):
+            raise ValueError('Invalid JWKS given, needs to contain a "keys" list')
+        return jwks
+
+    @model_validator(mode="after")
+    def jwks_source_validator(self) -> "Config":
+        """Model validator making sure only one static JWKS source is given.
+
+        Raises:
+            ValueError: Raises ValueError if both jwks and jwks_path are set
+
+        Returns:
+            Config: validated config
+        """
+        if self.jwks is not None and self.jwks_path is not None:
+            raise ValueError("Only one of jwks and jwks_path can be set")
+        return self
+
     # --------- Properties ----------#
     @property
     def issuer(self) -> str:
@@ -3,14 +3,28 @@ import json
 import platform
 from importlib.metadata import version
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 from typing_extensions import Dict, Optional
 
 from corbado_python_sdk import Config
-from corbado_python_sdk.generated.api import IdentifiersApi, UsersApi
+from corbado_python_sdk.aio import AsyncApiClient, AsyncIdentifiersApi, AsyncUsersApi
+from corbado_python_sdk.cache import FileKeyStore, RevocationFilter, UserStatusCache
+from corbado_python_sdk.generated.api import IdentifiersApi, SessionsApi, UsersApi
 from corbado_python_sdk.generated.api_client import ApiClient
 from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    READ_GROUP,
+    WRITE_GROUP,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    RateLimit,
+    RateLimiter,
+    ResilientApiClient,
+    RetryPolicy,
+)
 from corbado_python_sdk.services.implementation import (
+    AsyncIdentifierService,
+    AsyncUserService,
     IdentifierService,
     SessionService,
     UserService,
@@ -31,16 +45,42 @@ class CorbadoSDK(BaseModel):
         api_client (ApiClient): The API client used to make requests to the backend API.
         sessions (SessionService): The session service service.
         users (UserService): The user service.
+        async_api_client (AsyncApiClient): The asyncio API client (requires aiohttp).
+        async_users (AsyncUserService): The asyncio user service.
+        async_identifiers (AsyncIdentifierService): The asyncio identifier service.
+        retry_policy (Optional[RetryPolicy]): The retry policy of the API clients, with per-operation counters.
+        circuit_breaker (Optional[CircuitBreaker]): The circuit breaker of the API clients, with the state of each circuit.
+        rate_limiter (Optional[RateLimiter]): The rate limiter of the API clients, created from the config if not given.
+            Pass the same instance to several CorbadoSDK instances to limit their requests together.
+        concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): The adaptive concurrency limit of the API clients.
     """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
     config: Config
+    rate_limiter: Optional[RateLimiter] = None
     _api_client: Optional[ApiClient] = None
     _sessions: Optional[SessionService] = None
     _users: Optional[UserService] = None
     _identifiers: Optional[IdentifierService] = None
+    _async_api_client: Optional[AsyncApiClient] = None
+    _async_users: Optional[AsyncUserService] = None
+    _async_identifiers: Optional[AsyncIdentifierService] = None
+    _retry_policy: Optional[RetryPolicy] = None
+    _circuit_breaker: Optional[CircuitBreaker] = None
+    _concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
+    @model_validator(mode="after")
+    def rate_limiter_validator(self) -> "CorbadoSDK":
+        """Model validator creating the rate limiter from the config, if none is given.
+
+        Returns:
+            CorbadoSDK: validated SDK
+        """
+        if self.rate_limiter is None:
+            self.rate_limiter = self._create_rate_limiter()
+        return self
 
     @property
     def api_client(self) -> ApiClient:
@@ -50,16 +90,84 @@ class CorbadoSDK(BaseModel):
             ApiClient: ApiClient object.
         """
         if not self._api_client:
-            self._api_client = ApiClient(configuration=self._create_generated_configuration())
-            python_version: str = platform.python_version()
-            data: Dict[str, str] = {
-                "name": "Python SDK",
-                "sdkVersion": version(distribution_name="passkeys"),
-                "languageVersion": python_version,
-            }
-            self._api_client.set_default_header(header_name=CORBADO_HEADER_NAME, header_value=json.dumps(data))  # type: ignore
+            self._api_client = ResilientApiClient(
+                configuration=self._create_generated_configuration(),
+                retry_policy=self.retry_policy,
+                circuit_breaker=self.circuit_breaker,
+                rate_limiter=self.rate_limiter,
+                concurrency_limiter=self.concurrency_limiter,
+            )
+            self._api_client.set_default_header(header_name=CORBADO_HEADER_NAME, header_value=self._create_sdk_header())  # type: ignore
         return self._api_client
 
+    @property
+    def async_api_client(self) -> AsyncApiClient:
+        """Get AsyncApiClient.
+
+        The client keeps a pool of connections, close it with aclose() when done.
+
+        Returns:
+            AsyncApiClient: AsyncApiClient object.
+        """
+        if not self._async_api_client:
+            self._async_api_client = AsyncApiClient(
+                configuration=self._create_generated_configuration(),
+                # the adaptive limit decides how many connections are used
+                max_connections=self.config.concurrency_max_limit if self.concurrency_limiter else self.config.async_max_connections,
+                retry_policy=self.retry_policy,
+                circuit_breaker=self.circuit_breaker,
+                rate_limiter=self.rate_limiter,
+                concurrency_limiter=self.concurrency_limiter,
+            )
+            self._async_api_client.set_default_header(header_name=CORBADO_HEADER_NAME, header_value=self._create_sdk_header())  # type: ignore
+        return self._async_api_client
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Get the retry policy of the API clients, enabled with Config.retry_max_attempts greater than 1.
+
+        Returns:
+            Optional[RetryPolicy]: RetryPolicy object or None, if retries are disabled (the default).
+        """
+        if not self._retry_policy and self.config.retry_max_attempts > 1:
+            self._retry_policy = RetryPolicy(
+                max_attempts=self.config.retry_max_attempts,
+                base_delay=self.config.retry_base_delay,
+                max_delay=self.config.retry_max_delay,
+                deadline=self.config.retry_deadline,
+            )
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker of the API clients.
+
+        Returns:
+            Optional[CircuitBreaker]: CircuitBreaker object or None, if disabled.
+        """
+        if not self._circuit_breaker and self.config.circuit_breaker:
+            self._circuit_breaker = CircuitBreaker(
+                failure_threshold=self.config.circuit_failure_threshold,
+                error_rate_threshold=self.config.circuit_error_rate_threshold,
+                open_timeout=self.config.circuit_open_timeout,
+            )
+        return self._circuit_breaker
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Get the adaptive concurrency limit of the API clients, shared by the sync and the async client.
+
+        Returns:
+            Optional[AdaptiveConcurrencyLimiter]: AdaptiveConcurrencyLimiter object or None, if disabled.
+        """
+        if not self._concurrency_limiter and self.config.adaptive_concurrency:
+            self._concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=min(self.config.concurrency_initial_limit, self.config.concurrency_max_limit),
+                max_limit=self.config.concurrency_max_limit,
+                timeout=self.config.concurrency_timeout,
+            )
+        return self._concurrency_limiter
+
     # --------- Services ---------------#
     @property
     def sessions(self) -> SessionService:
@@ -71,8 +179,21 @@ class CorbadoSDK(BaseModel):
         if not self._sessions:
             self._sessions = SessionService(
                 issuer=self.config.issuer,
+                extra_issuers=self.config.extra_issuers,
                 jwks_uri=self.config.frontend_api + "/.well-known/jwks",
                 project_id=self.config.project_id,
+                jwks_refresh_ahead=self.config.jwks_refresh_ahead,
+                jwks_max_stale=self.config.jwks_max_stale,
+                jwks_min_refresh_interval=self.config.jwks_min_refresh_interval,
+                jwks_unknown_kid_ttl=self.config.jwks_unknown_kid_ttl,
+                jwks_max_unknown_kids=self.config.jwks_max_unknown_kids,
+                jwks_key_store=FileKeyStore(path=self.config.jwks_store_path) if self.config.jwks_store_path else None,
+                jwks=self.config.jwks,
+                jwks_path=self.config.jwks_path,
+                token_cache_size=self.config.token_cache_size,
+                omit_token_in_errors=self.config.omit_token_in_errors,
+                user_status_cache=self._create_user_status_cache(),
+                revocation_filter=self._create_revocation_filter(),
             )
 
         return self._sessions
@@ -103,7 +224,99 @@ class CorbadoSDK(BaseModel):
 
         return self._identifiers
 
+    @property
+    def async_users(self) -> AsyncUserService:
+        """Get asyncio user service.
+
+        Returns:
+            AsyncUserService: AsyncUserService object.
+        """
+        if not self._async_users:
+            self._async_users = AsyncUserService(client=AsyncUsersApi(api_client=self.async_api_client))
+
+        return self._async_users
+
+    @property
+    def async_identifiers(self) -> AsyncIdentifierService:
+        """Get asyncio identifier service.
+
+        Returns:
+            AsyncIdentifierService: AsyncIdentifierService object.
+        """
+        if not self._async_identifiers:
+            self._async_identifiers = AsyncIdentifierService(client=AsyncIdentifiersApi(api_client=self.async_api_client))
+
+        return self._async_identifiers
+
     # ----------- Functions ----------#
+    def warm_up(self) -> None:
+        """Load the JWKS eagerly, so the first request does not pay for fetching it.
+
+        Call it at application startup (e.g. before a pre-fork server forks its workers), so
+        configuration and connectivity errors surface before serving traffic.
+        """
+        self.sessions.warm_up()
+
+    async def aclose(self) -> None:
+        """Close the connections of the asyncio API client, if it was used."""
+        if self._async_api_client:
+            await self._async_api_client.close()
+
+    def _create_user_status_cache(self) -> Optional[UserStatusCache]:
+        """Create user status cache, if enabled.
+
+        Returns:
+            Optional[UserStatusCache]: UserStatusCache object or None, if disabled.
+        """
+        if self.config.user_status_cache_size == 0:
+            return None
+        return UserStatusCache(
+            client=UsersApi(api_client=self.api_client),
+            max_size=self.config.user_status_cache_size,
+            ttl=self.config.user_status_ttl,
+        )
+
+    def _create_revocation_filter(self) -> Optional[RevocationFilter]:
+        """Create revocation filter, if enabled.
+
+        Returns:
+            Optional[RevocationFilter]: RevocationFilter object or None, if disabled.
+        """
+        if not self.config.revocation_check:
+            return None
+        return RevocationFilter(
+            client=SessionsApi(api_client=self.api_client),
+            refresh_interval=self.config.revocation_refresh_interval,
+            session_id_claim=self.config.session_id_claim,
+        )
+
+    def _create_rate_limiter(self) -> Optional[RateLimiter]:
+        """Create rate limiter, if a rate limit is configured.
+
+        Returns:
+            Optional[RateLimiter]: RateLimiter object or None, if no rate limit is configured.
+        """
+        limits: Dict[str, RateLimit] = {}
+        if self.config.rate_limit_reads is not None:
+            limits[READ_GROUP] = RateLimit(rate=self.config.rate_limit_reads, burst=self.config.rate_limit_burst)
+        if self.config.rate_limit_writes is not None:
+            limits[WRITE_GROUP] = RateLimit(rate=self.config.rate_limit_writes, burst=self.config.rate_limit_burst)
+        if not limits:
+            return None
+        return RateLimiter(limits=limits, timeout=self.config.rate_limit_timeout)
+
+    def _create_sdk_header(self) -> str:
+        """Create the value of the SDK header.
+
+        Returns:
+            str: JSON with SDK name and versions.
+        """
+        data: Dict[str, str] = {
+            "name": "Python SDK",
+            "sdkVersion": version(distribution_name="passkeys"),
+            "languageVersion": platform.python_version(),
+        }
+        return json.dumps(data)
 
     def _create_generated_configuration(self) -> Configuration:
         """Create configuration (generated class).
@@ -111,13 +324,19 @@ class CorbadoSDK(BaseModel):
         Returns:
             Configuration: Configuration object.
         """
-        return Configuration(
+        configuration = Configuration(
             host=self.config.backend_api,
             username=self.config.project_id,
             password=self.config.api_secret,
             access_token=None,
             api_key={"projectID": self.config.project_id},
+            # if enabled, the retry policy retries connection errors with backoff, otherwise urllib3 does
+            retries=False if self.retry_policy else None,
         )
+        if self.concurrency_limiter:
+            # the adaptive limit decides how many connections are used
+            configuration.connection_pool_maxsize = self.config.concurrency_max_limit
+        return configuration
 
     def _generate_basic_auth_header(self, username: str, password: str) -> str:
         """Generate basic auth header.
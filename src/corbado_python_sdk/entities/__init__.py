@@ -1,5 +1,6 @@
 from corbado_python_sdk.generated import UserStatus
 
 from .user_entity import UserEntity as UserEntity
+from .validated_session import ValidatedSession as ValidatedSession
 
-__all__ = ["UserEntity", "UserStatus"]
+__all__ = ["UserEntity", "UserStatus", "ValidatedSession"]
@@ -1,4 +1,5 @@
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
@@ -7,15 +8,43 @@ from corbado_python_sdk.generated.models.user_status import UserStatus
 
 
 class UserEntity(BaseModel):
-    """Represents a user entity."""
+    """Represents a user entity.
+
+    Entities returned by SessionService.validate_token() carry all verified claims of the session
+    token, see claims.
+    """
 
     user_id: StrictStr = Field(alias="userID")
     full_name: Optional[StrictStr] = Field(default=None, alias="fullName")
     status: UserStatus
     explicit_webauthn_id: Optional[StrictStr] = Field(default=None, alias="explicitWebauthnID")
+    _claims: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(populate_by_name=True, from_attributes=True, arbitrary_types_allowed=True)
 
+    @property
+    def claims(self) -> Mapping[str, Any]:
+        """Get all verified claims of the session token (e.g. orig, exp or custom claims), read-only.
+
+        Returns:
+            Mapping[str, Any]: Claims (a read-only view without copying), empty if the entity was not
+                created from a session token.
+        """
+        return MappingProxyType(self._claims if self._claims is not None else {})
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the fields of two entities, the claims of the session token are not part of the comparison.
+
+        Args:
+            other (object): Object to compare with.
+
+        Returns:
+            bool: True, if other is a UserEntity with the same fields.
+        """
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return self.__class__ is other.__class__ and self.__dict__ == other.__dict__
+
     @classmethod
     def from_user(cls, user: User) -> "UserEntity":
         """Create a UserEntity instance from a User.
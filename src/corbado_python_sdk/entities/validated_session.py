@@ -0,0 +1,79 @@
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from corbado_python_sdk.generated.models.user_status import UserStatus
+
+from .user_entity import UserEntity
+
+
+class ValidatedSession:
+    """Represents a validated session token, a lightweight alternative to UserEntity.
+
+    Plain slotted object without pydantic validation, returned by SessionService.validate_session()
+    for hot paths. Converts to a UserEntity on demand, the entity is created only once.
+    Instances are shared by the token cache and must not be modified.
+
+    Attributes:
+        user_id (str): User ID (sub claim).
+        full_name (Optional[str]): Full name of the user (name claim).
+        status (UserStatus): Status of the user.
+    """
+
+    __slots__ = ("user_id", "full_name", "status", "_claims", "_user_entity")
+
+    def __init__(self, user_id: str, full_name: Optional[str], status: UserStatus, claims: Dict[str, Any]) -> None:
+        """Initialize a new instance of the ValidatedSession class.
+
+        Args:
+            user_id (str): User ID (sub claim).
+            full_name (Optional[str]): Full name of the user (name claim).
+            status (UserStatus): Status of the user.
+            claims (Dict[str, Any]): All claims of the session token.
+        """
+        self.user_id: str = user_id
+        self.full_name: Optional[str] = full_name
+        self.status: UserStatus = status
+        self._claims: Dict[str, Any] = claims
+        self._user_entity: Optional[UserEntity] = None
+
+    @property
+    def claims(self) -> Mapping[str, Any]:
+        """Get all verified claims of the session token (e.g. orig, exp or custom claims), read-only.
+
+        Returns:
+            Mapping[str, Any]: Claims, a read-only view without copying.
+        """
+        return MappingProxyType(self._claims)
+
+    def with_status(self, status: UserStatus) -> "ValidatedSession":
+        """Get the validated session with the given user status.
+
+        Args:
+            status (UserStatus): Status of the user.
+
+        Returns:
+            ValidatedSession: This instance if the status is unchanged, a copy otherwise.
+        """
+        if status == self.status:
+            return self
+        return ValidatedSession(user_id=self.user_id, full_name=self.full_name, status=status, claims=self._claims)
+
+    def to_user_entity(self) -> UserEntity:
+        """Convert to UserEntity, the entity is created on first call and reused afterwards.
+
+        Returns:
+            UserEntity: User Entity.
+        """
+        if self._user_entity is None:
+            user_entity: UserEntity = UserEntity(userID=self.user_id, fullName=self.full_name, status=self.status)
+            user_entity._claims = self._claims
+            self._user_entity = user_entity
+        return self._user_entity
+
+    def __repr__(self) -> str:
+        """Return a string representation of the validated session.
+
+        Returns:
+            str: String representation.
+        """
+        return f"ValidatedSession(user_id={self.user_id!r}, full_name={self.full_name!r}, status={self.status!r})"
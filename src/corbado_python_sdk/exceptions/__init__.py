@@ -1,5 +1,16 @@
+from .circuit_open_exception import CircuitOpenException as CircuitOpenException
+from .concurrency_limit_exception import ConcurrencyLimitException as ConcurrencyLimitException
+from .rate_limit_exception import RateLimitException as RateLimitException
 from .server_exception import ServerException as ServerException
 from .standard_exception import StandardException as StandardException
 from .token_validation_exception import TokenValidationException, ValidationErrorType
 
-__all__ = ["ServerException", "StandardException", "TokenValidationException", "ValidationErrorType"]
+__all__ = [
+    "CircuitOpenException",
+    "ConcurrencyLimitException",
+    "RateLimitException",
+    "ServerException",
+    "StandardException",
+    "TokenValidationException",
+    "ValidationErrorType",
+]
@@ -0,0 +1,30 @@
+from .standard_exception import StandardException
+
+
+class CircuitOpenException(StandardException):
+    """Raised instead of sending a Backend API request while its circuit breaker is open.
+
+    Attributes:
+        circuit (str): Circuit (host and operation) that is open.
+        retry_after (float): Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        """Initialize a new instance of the CircuitOpenException class.
+
+        Args:
+            circuit (str): Circuit (host and operation) that is open.
+            retry_after (float): Seconds until the circuit lets a probe request through.
+        """
+        # all constructor arguments are passed on, so the exception can be pickled and copied
+        super().__init__(circuit, retry_after)
+        self.circuit: str = circuit
+        self.retry_after: float = retry_after
+
+    def __str__(self) -> str:
+        """Return the error message.
+
+        Returns:
+            str: Error message.
+        """
+        return f"Circuit {self.circuit} is open, the Backend API is considered unavailable (retry in {self.retry_after:.1f}s)"
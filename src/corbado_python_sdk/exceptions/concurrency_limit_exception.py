@@ -0,0 +1,30 @@
+from .standard_exception import StandardException
+
+
+class ConcurrencyLimitException(StandardException):
+    """Raised instead of sending a Backend API request if no concurrency slot frees up within the timeout.
+
+    Attributes:
+        limit (int): Concurrency limit at the time of the rejection.
+        timeout (float): Seconds the request waited for a slot.
+    """
+
+    def __init__(self, limit: int, timeout: float) -> None:
+        """Initialize a new instance of the ConcurrencyLimitException class.
+
+        Args:
+            limit (int): Concurrency limit at the time of the rejection.
+            timeout (float): Seconds the request waited for a slot.
+        """
+        # all constructor arguments are passed on, so the exception can be pickled and copied
+        super().__init__(limit, timeout)
+        self.limit: int = limit
+        self.timeout: float = timeout
+
+    def __str__(self) -> str:
+        """Return the error message.
+
+        Returns:
+            str: Error message.
+        """
+        return f"No Backend API request slot freed up within {self.timeout:.2f}s (concurrency limit {self.limit})"
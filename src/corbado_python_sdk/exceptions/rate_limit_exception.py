@@ -0,0 +1,30 @@
+from .standard_exception import StandardException
+
+
+class RateLimitException(StandardException):
+    """Raised instead of sending a Backend API request if the client-side rate limit allows none within the timeout.
+
+    Attributes:
+        group (str): Operation group (e.g. "write") that is rate limited.
+        retry_after (float): Seconds until a request of the group would be allowed.
+    """
+
+    def __init__(self, group: str, retry_after: float) -> None:
+        """Initialize a new instance of the RateLimitException class.
+
+        Args:
+            group (str): Operation group (e.g. "write") that is rate limited.
+            retry_after (float): Seconds until a request of the group would be allowed.
+        """
+        # all constructor arguments are passed on, so the exception can be pickled and copied
+        super().__init__(group, retry_after)
+        self.group: str = group
+        self.retry_after: float = retry_after
+
+    def __str__(self) -> str:
+        """Return the error message.
+
+        Returns:
+            str: Error message.
+        """
+        return f"Rate limit of {self.group} requests exceeded (retry in {self.retry_after:.2f}s)"
@@ -1,6 +1,8 @@
 from enum import Enum
 
-from typing_extensions import Optional
+from typing_extensions import Any, Dict, Optional, Tuple
+
+OMITTED_SESSION_TOKEN = "<omitted>"  # noqa s105
 
 
 class ValidationErrorType(Enum):
@@ -19,6 +21,10 @@ class ValidationErrorType(Enum):
         CODE_JWT_BEFORE (str):Token is not yet valid.
         CODE_JWT_EXPIRED (str): Token expired.
         CODE_JWT_INVALID_SIGNATURE (str): Invalid Signature.
+        CODE_JWT_USER_DISABLED (str): The user of the token is disabled (only with user status check).
+        CODE_JWT_USER_NOT_FOUND (str): The user of the token does not exist (only with user status check).
+        CODE_JWT_USER_STATUS_ERROR (str): The user status could not be retrieved. More information in 'original_exception'.
+        CODE_JWT_SESSION_REVOKED (str): The session of the token has been revoked (only with revocation check).
 
 
     """
@@ -31,6 +37,10 @@ class ValidationErrorType(Enum):
     CODE_JWT_BEFORE = "Token is not yet valid"
     CODE_JWT_EXPIRED = "Token expired"
     CODE_JWT_INVALID_SIGNATURE = "Invalid Signature"
+    CODE_JWT_USER_DISABLED = "User is disabled"
+    CODE_JWT_USER_NOT_FOUND = "User does not exist"
+    CODE_JWT_USER_STATUS_ERROR = "Could not retrieve user status"
+    CODE_JWT_SESSION_REVOKED = "Session has been revoked"
 
 
 class TokenValidationException(Exception):
@@ -39,25 +49,110 @@ class TokenValidationException(Exception):
     This exception wraps around other exceptions to provide additional context
     regarding validation failures.
 
+    If created with lazy=True, the message is a str.format() template which is only formatted when
+    the message is accessed. Rejecting a token is then cheap, even if nobody looks at the message.
+    Besides message_args, the template can use {session_token}, {error} (the original exception) and
+    {error_type} (the value of the error type).
+
     Attributes:
         message (str): The custom error message describing the validation error.
         error_type (ValidationErrorType): Enum value indicating the type of validation error.
         original_exception (Optional[Exception]): The original exception that caused this error, if any.
+        session_token (Optional[str]): The rejected session token, None if omitted.
     """
 
-    def __init__(self, message: str, error_type: ValidationErrorType, original_exception: Optional[Exception] = None):
+    def __init__(
+        self,
+        message: str,
+        error_type: ValidationErrorType,
+        original_exception: Optional[Exception] = None,
+        session_token: Optional[str] = None,
+        lazy: bool = False,
+        message_args: Optional[Dict[str, Any]] = None,
+    ):
         """Initialize ValidationError with message, error type, and optional original exception.
 
         Args:
-            message (str): A description of the error.
+            message (str): A description of the error, or its template if lazy.
             error_type (ValidationErrorType): The specific type of validation error.
             original_exception (Optional[Exception], optional): The original exception that caused
                 this error, if available. Defaults to None.
+            session_token (Optional[str], optional): The rejected session token, None to omit it. Defaults to None.
+            lazy (bool): Whether message is a template, formatted on first access of the message. Defaults to False.
+            message_args (Optional[Dict[str, Any]], optional): Further arguments of the template, if lazy.
+                Defaults to None.
+
+        Raises:
+            ValueError: If message_args are given without lazy.
         """
-        super().__init__(message)
-        self.message: str = message
+        if message_args is not None and not lazy:
+            raise ValueError("Message args require lazy=True")
+        super().__init__()
         self.error_type: ValidationErrorType = error_type
         self.original_exception: Optional[Exception] = original_exception
+        self.session_token: Optional[str] = session_token
+        self._message: Optional[str] = None if lazy else message
+        self._template: str = message
+        self._message_args: Dict[str, Any] = dict(message_args or {})
+
+    @property
+    def message(self) -> str:
+        """Get the error message, formatting it on first access.
+
+        Returns:
+            str: Error message.
+        """
+        if self._message is None:
+            self._message = self._template.format(
+                session_token=self.session_token if self.session_token is not None else OMITTED_SESSION_TOKEN,
+                error=self.original_exception,
+                error_type=self.error_type.value,
+                **self._message_args,
+            )
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        """Set the error message, replacing a message that is not formatted yet.
+
+        Args:
+            message (str): Error message.
+        """
+        self._message = message
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        """Get the arguments of the exception, the (formatted) message.
+
+        Returns:
+            Tuple[Any, ...]: Message.
+        """
+        return (self.message,)
+
+    @args.setter
+    def args(self, args: Tuple[Any, ...]) -> None:
+        """Set the arguments of the exception, the first one replaces the message.
+
+        Args:
+            args (Tuple[Any, ...]): Arguments.
+        """
+        self.message = str(args[0]) if args else ""
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling, e.g. to pass validation results between processes.
+
+        Returns:
+            Tuple[Any, ...]: Class and constructor arguments.
+        """
+        return self.__class__, (self.message, self.error_type, self.original_exception, self.session_token)
+
+    def __repr__(self) -> str:
+        """Return a representation like the one of Exception, with the formatted message.
+
+        Returns:
+            str: Representation.
+        """
+        return f"{self.__class__.__name__}({self.message!r})"
 
     def __str__(self) -> str:
         """Return a string representation of the validation error.
@@ -0,0 +1,17 @@
+from .asgi import CorbadoASGIMiddleware as CorbadoASGIMiddleware
+from .session_token import (
+    SESSION_ERROR_KEY,
+    SESSION_KEY,
+    SESSION_TOKEN_COOKIE,
+    extract_session_token,
+)
+from .wsgi import CorbadoWSGIMiddleware as CorbadoWSGIMiddleware
+
+__all__ = [
+    "CorbadoASGIMiddleware",
+    "CorbadoWSGIMiddleware",
+    "SESSION_ERROR_KEY",
+    "SESSION_KEY",
+    "SESSION_TOKEN_COOKIE",
+    "extract_session_token",
+]
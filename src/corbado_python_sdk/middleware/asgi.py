@@ -0,0 +1,120 @@
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+
+from corbado_python_sdk.entities import ValidatedSession
+from corbado_python_sdk.exceptions.token_validation_exception import (
+    TokenValidationException,
+)
+from corbado_python_sdk.services.implementation import SessionService
+
+from .session_token import (
+    SESSION_ERROR_KEY,
+    SESSION_KEY,
+    SESSION_TOKEN_COOKIE,
+    extract_session_token,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApplication = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_UNAUTHORIZED_START: Dict[str, Any] = {
+    "type": "http.response.start",
+    "status": 401,
+    "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"www-authenticate", b"Bearer")],
+}
+_UNAUTHORIZED_BODY: Dict[str, Any] = {"type": "http.response.body", "body": b"Unauthorized"}
+# closing before accepting makes the server reject the WebSocket handshake with 403
+_WEBSOCKET_CLOSE: Dict[str, Any] = {"type": "websocket.close", "code": 1008}
+
+
+class CorbadoASGIMiddleware:
+    """ASGI middleware validating the session token of each HTTP or WebSocket connection once.
+
+    Works like CorbadoWSGIMiddleware: the validated session (ValidatedSession, None if the
+    connection carries no valid token) is put into the scope under SESSION_KEY, the validation
+    error (if any) under SESSION_ERROR_KEY. Tokens are validated with avalidate_session(), so
+    fetching the JWKS never blocks the event loop.
+
+    Attributes:
+        app (ASGIApplication): Wrapped ASGI application.
+        session_service (SessionService): Session service validating the tokens.
+        required (bool): Reject connections without valid session token (HTTP 401, WebSocket 403).
+        cookie_name (str): Name of the session token cookie.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApplication,
+        session_service: SessionService,
+        required: bool = False,
+        cookie_name: str = SESSION_TOKEN_COOKIE,
+    ) -> None:
+        """Initialize a new instance of the CorbadoASGIMiddleware class.
+
+        Args:
+            app (ASGIApplication): ASGI application to wrap.
+            session_service (SessionService): Session service validating the tokens.
+            required (bool): Reject connections without valid session token. Defaults to False.
+            cookie_name (str): Name of the session token cookie. Defaults to SESSION_TOKEN_COOKIE.
+        """
+        self.app: ASGIApplication = app
+        self.session_service: SessionService = session_service
+        self.required: bool = required
+        self.cookie_name: str = cookie_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate the session token of the connection and call the wrapped application.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive callable.
+            send (Send): ASGI send callable.
+        """
+        scope_type: str = scope["type"]
+        if scope_type != "http" and scope_type != "websocket":
+            await self.app(scope, receive, send)
+            return
+
+        if SESSION_KEY not in scope:
+            await self._validate(scope=scope)
+
+        if self.required and scope[SESSION_KEY] is None:
+            if scope_type == "http":
+                await send(_UNAUTHORIZED_START)
+                await send(_UNAUTHORIZED_BODY)
+            else:
+                await send(_WEBSOCKET_CLOSE)
+            return
+        await self.app(scope, receive, send)
+
+    async def _validate(self, scope: Scope) -> None:
+        """Validate the session token of the connection and put the result into the scope.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+        """
+        authorization: Optional[bytes] = None
+        cookie: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+            elif name == b"cookie":
+                # HTTP/2 allows splitting the Cookie header
+                cookie = value if cookie is None else cookie + b"; " + value
+
+        validated_session: Optional[ValidatedSession] = None
+        error: Optional[TokenValidationException] = None
+        session_token: Optional[str] = extract_session_token(
+            authorization=authorization.decode("latin-1") if authorization is not None else None,
+            cookie=cookie.decode("latin-1") if cookie is not None else None,
+            cookie_name=self.cookie_name,
+        )
+        if session_token is not None:
+            try:
+                validated_session = await self.session_service.avalidate_session(session_token=session_token)
+            except TokenValidationException as e:
+                error = e
+        scope[SESSION_KEY] = validated_session
+        scope[SESSION_ERROR_KEY] = error
@@ -0,0 +1,40 @@
+from typing import Optional
+
+SESSION_TOKEN_COOKIE = "cbo_session_token"  # noqa: S105
+SESSION_KEY = "corbado.session"
+SESSION_ERROR_KEY = "corbado.session_error"
+
+_BEARER_PREFIX_LENGTH = len("Bearer ")
+
+
+def extract_session_token(authorization: Optional[str], cookie: Optional[str], cookie_name: str = SESSION_TOKEN_COOKIE) -> Optional[str]:
+    """Extract the session token from the Authorization header (Bearer scheme) or the session token cookie.
+
+    The header takes precedence. Only the session token cookie is looked up, the Cookie header is not
+    parsed as a whole.
+
+    Args:
+        authorization (Optional[str]): Value of the Authorization header.
+        cookie (Optional[str]): Value of the Cookie header.
+        cookie_name (str): Name of the session token cookie. Defaults to SESSION_TOKEN_COOKIE.
+
+    Returns:
+        Optional[str]: Session token or None, if the request does not carry one.
+    """
+    if authorization and authorization[:_BEARER_PREFIX_LENGTH].lower() == "bearer ":
+        token: str = authorization[_BEARER_PREFIX_LENGTH:].strip()
+        if token:
+            return token
+
+    if not cookie:
+        return None
+    prefix: str = cookie_name + "="
+    start: int = cookie.find(prefix)
+    while start != -1:
+        # make sure to match the whole cookie name, not the end of another one
+        if start == 0 or cookie[start - 1] in " ;":
+            end: int = cookie.find(";", start)
+            value: str = cookie[start + len(prefix):end] if end != -1 else cookie[start + len(prefix):]
+            return value.strip() or None
+        start = cookie.find(prefix, start + 1)
+    return None
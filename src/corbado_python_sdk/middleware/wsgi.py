@@ -0,0 +1,91 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from corbado_python_sdk.entities import ValidatedSession
+from corbado_python_sdk.exceptions.token_validation_exception import (
+    TokenValidationException,
+)
+from corbado_python_sdk.services.implementation import SessionService
+
+from .session_token import (
+    SESSION_ERROR_KEY,
+    SESSION_KEY,
+    SESSION_TOKEN_COOKIE,
+    extract_session_token,
+)
+
+WSGIEnvironment = Dict[str, Any]
+StartResponse = Callable[..., Any]
+WSGIApplication = Callable[[WSGIEnvironment, StartResponse], Iterable[bytes]]
+
+_UNAUTHORIZED_HEADERS: List[Tuple[str, str]] = [
+    ("Content-Type", "text/plain; charset=utf-8"),
+    ("WWW-Authenticate", "Bearer"),
+]
+
+
+class CorbadoWSGIMiddleware:
+    """WSGI middleware validating the session token of each request once.
+
+    The token is taken from the Authorization header (Bearer scheme) or the cbo_session_token
+    cookie. The validated session (ValidatedSession, None if the request carries no valid token)
+    is put into the WSGI environment under SESSION_KEY, the validation error (if any) under
+    SESSION_ERROR_KEY. Requests already validated by another instance are not validated again.
+
+    Pass the SessionService of the CorbadoSDK (sdk.sessions), so all middleware instances share
+    its key and token caches.
+
+    Attributes:
+        app (WSGIApplication): Wrapped WSGI application.
+        session_service (SessionService): Session service validating the tokens.
+        required (bool): Reject requests without valid session token with 401 Unauthorized.
+        cookie_name (str): Name of the session token cookie.
+    """
+
+    def __init__(
+        self,
+        app: WSGIApplication,
+        session_service: SessionService,
+        required: bool = False,
+        cookie_name: str = SESSION_TOKEN_COOKIE,
+    ) -> None:
+        """Initialize a new instance of the CorbadoWSGIMiddleware class.
+
+        Args:
+            app (WSGIApplication): WSGI application to wrap.
+            session_service (SessionService): Session service validating the tokens.
+            required (bool): Reject requests without valid session token with 401 Unauthorized. Defaults to False.
+            cookie_name (str): Name of the session token cookie. Defaults to SESSION_TOKEN_COOKIE.
+        """
+        self.app: WSGIApplication = app
+        self.session_service: SessionService = session_service
+        self.required: bool = required
+        self.cookie_name: str = cookie_name
+
+    def __call__(self, environ: WSGIEnvironment, start_response: StartResponse) -> Iterable[bytes]:
+        """Validate the session token of the request and call the wrapped application.
+
+        Args:
+            environ (WSGIEnvironment): WSGI environment.
+            start_response (StartResponse): WSGI start_response callable.
+
+        Returns:
+            Iterable[bytes]: Response body.
+        """
+        if SESSION_KEY not in environ:
+            validated_session: Optional[ValidatedSession] = None
+            error: Optional[TokenValidationException] = None
+            session_token: Optional[str] = extract_session_token(
+                authorization=environ.get("HTTP_AUTHORIZATION"), cookie=environ.get("HTTP_COOKIE"), cookie_name=self.cookie_name
+            )
+            if session_token is not None:
+                try:
+                    validated_session = self.session_service.validate_session(session_token=session_token)
+                except TokenValidationException as e:
+                    error = e
+            environ[SESSION_KEY] = validated_session
+            environ[SESSION_ERROR_KEY] = error
+
+        if self.required and environ[SESSION_KEY] is None:
+            start_response("401 Unauthorized", _UNAUTHORIZED_HEADERS)
+            return [b"Unauthorized"]
+        return self.app(environ, start_response)
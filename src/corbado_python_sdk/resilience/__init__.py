@@ -0,0 +1,80 @@
+from .api_client import OPERATION_HEADER, ResilientApiClient
+from .circuit_breaker import (
+    DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS,
+    DEFAULT_CIRCUIT_MIN_CALLS,
+    DEFAULT_CIRCUIT_OPEN_TIMEOUT,
+    DEFAULT_CIRCUIT_WINDOW_SIZE,
+    CircuitBreaker,
+    CircuitSnapshot,
+    CircuitState,
+)
+from .concurrency_limiter import (
+    DEFAULT_CONCURRENCY_BACKOFF_RATIO,
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+    DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    DEFAULT_CONCURRENCY_MAX_LIMIT,
+    DEFAULT_CONCURRENCY_MIN_LATENCY_WINDOW,
+    DEFAULT_CONCURRENCY_MIN_LIMIT,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencySnapshot,
+)
+from .rate_limiter import (
+    READ_GROUP,
+    READ_METHODS,
+    WRITE_GROUP,
+    RateLimit,
+    RateLimitCounters,
+    RateLimiter,
+)
+from .rest import LimitedRESTClientObject
+from .retry import (
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_DEADLINE,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_DELAY,
+    DEFAULT_RETRY_STATUSES,
+    IDEMPOTENT_METHODS,
+    RetryCounters,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+__all__ = [
+    "DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD",
+    "DEFAULT_CIRCUIT_FAILURE_THRESHOLD",
+    "DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS",
+    "DEFAULT_CIRCUIT_MIN_CALLS",
+    "DEFAULT_CIRCUIT_OPEN_TIMEOUT",
+    "DEFAULT_CIRCUIT_WINDOW_SIZE",
+    "DEFAULT_CONCURRENCY_BACKOFF_RATIO",
+    "DEFAULT_CONCURRENCY_INITIAL_LIMIT",
+    "DEFAULT_CONCURRENCY_LATENCY_TOLERANCE",
+    "DEFAULT_CONCURRENCY_MAX_LIMIT",
+    "DEFAULT_CONCURRENCY_MIN_LATENCY_WINDOW",
+    "DEFAULT_CONCURRENCY_MIN_LIMIT",
+    "DEFAULT_RETRY_BASE_DELAY",
+    "DEFAULT_RETRY_DEADLINE",
+    "DEFAULT_RETRY_MAX_ATTEMPTS",
+    "DEFAULT_RETRY_MAX_DELAY",
+    "DEFAULT_RETRY_STATUSES",
+    "IDEMPOTENT_METHODS",
+    "OPERATION_HEADER",
+    "READ_GROUP",
+    "READ_METHODS",
+    "WRITE_GROUP",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "CircuitSnapshot",
+    "CircuitState",
+    "ConcurrencySnapshot",
+    "LimitedRESTClientObject",
+    "RateLimit",
+    "RateLimitCounters",
+    "RateLimiter",
+    "ResilientApiClient",
+    "RetryCounters",
+    "RetryPolicy",
+    "parse_retry_after",
+]
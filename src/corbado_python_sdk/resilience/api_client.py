@@ -0,0 +1,262 @@
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import urllib3
+
+from corbado_python_sdk.exceptions import ConcurrencyLimitException
+from corbado_python_sdk.generated import rest
+from corbado_python_sdk.generated.api_client import ApiClient, RequestSerialized
+from corbado_python_sdk.generated.configuration import Configuration
+
+from .circuit_breaker import CircuitBreaker
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .rate_limiter import RateLimiter
+from .rest import LimitedRESTClientObject
+from .retry import RetryPolicy
+
+# carries the operation (method and resource path template) from param_serialize() to call_api(), it is
+# removed before the request is sent
+OPERATION_HEADER = "X-Corbado-Operation"
+
+RequestTimeout = Union[None, float, Tuple[float, float]]
+
+
+class ApiCall:
+    """State of one call_api() call across its attempts.
+
+    Attributes:
+        method (str): HTTP method.
+        operation (str): Operation (method and resource path template), retries are counted for.
+        circuit (str): Circuit (host and operation).
+        started (float): Start of the call (time.monotonic()), moved forward by the time waited for the rate limiter.
+        attempt (int): Number of the current attempt.
+    """
+
+    __slots__ = ("method", "operation", "circuit", "started", "attempt")
+
+    def __init__(self, method: str, url: str, header_params: Optional[Dict[str, str]]) -> None:
+        """Initialize a new instance of the ApiCall class, removing the operation from the headers.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            header_params (Optional[Dict[str, str]]): Request headers.
+        """
+        self.method: str = method
+        path_operation: Optional[str] = header_params.pop(OPERATION_HEADER, None) if header_params else None
+        split_url = urlsplit(url)
+        # requests not built by param_serialize() are counted by their path
+        self.operation: str = path_operation or f"{method} {split_url.path}"
+        self.circuit: str = f"{split_url.netloc} {self.operation}"
+        self.started: float = time.monotonic()
+        self.attempt: int = 0
+
+
+class ResilientApiClient(ApiClient):
+    """ApiClient retrying failed requests according to a RetryPolicy, failing fast with a CircuitBreaker and throttling with a RateLimiter.
+
+    Create the Configuration with retries=False, so urllib3 does not retry connection errors on its own. With an
+    AdaptiveConcurrencyLimiter, requests are sent through a LimitedRESTClientObject.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        header_name: Optional[str] = None,
+        header_value: Optional[str] = None,
+        cookie: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        """Initialize a new instance of the ResilientApiClient class.
+
+        Args:
+            configuration (Optional[Configuration]): Configuration (generated class). Defaults to the default one.
+            header_name (Optional[str]): Name of a default header. Defaults to None.
+            header_value (Optional[str]): Value of the default header. Defaults to None.
+            cookie (Optional[str]): Cookie to send. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): Retry policy, None disables retries. Defaults to None.
+            circuit_breaker (Optional[CircuitBreaker]): Circuit breaker, None disables it. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): Rate limiter, None disables it. Defaults to None.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive limit of concurrent requests, None
+                disables it. Defaults to None.
+        """
+        # same as ApiClient.__init__(), which is not called since it builds a RESTClientObject (and its urllib3
+        # pool manager) even if another REST client is used
+        self.configuration: Configuration = configuration if configuration is not None else Configuration.get_default()
+        self.default_headers: Dict[str, Optional[str]] = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.cookie: Optional[str] = cookie
+        self.user_agent = "OpenAPI-Generator/1.0.0/python"
+        self.client_side_validation: bool = self.configuration.client_side_validation
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = concurrency_limiter
+        self.rest_client = self._create_rest_client()
+
+    def _create_rest_client(self) -> rest.RESTClientObject:
+        """Create the REST client sending the requests, called once by __init__().
+
+        Returns:
+            rest.RESTClientObject: LimitedRESTClientObject with a concurrency limiter, otherwise RESTClientObject.
+        """
+        if self.concurrency_limiter is not None:
+            return LimitedRESTClientObject(self.configuration, self.concurrency_limiter)
+        return rest.RESTClientObject(self.configuration)
+
+    def param_serialize(self, method: str, resource_path: str, *args: Any, **kwargs: Any) -> RequestSerialized:
+        """Build the request, remembering the operation it belongs to.
+
+        Args:
+            method (str): HTTP method.
+            resource_path (str): Resource path template.
+            *args (Any): Further arguments of ApiClient.param_serialize().
+            **kwargs (Any): Further keyword arguments of ApiClient.param_serialize().
+
+        Returns:
+            RequestSerialized: Method, URL, headers, body and post parameters.
+        """
+        serialized: RequestSerialized = super().param_serialize(method, resource_path, *args, **kwargs)
+        serialized[2][OPERATION_HEADER] = f"{method} {resource_path}"
+        return serialized
+
+    def _throttle(self, call: ApiCall) -> float:
+        """Take a rate limiter token for the next attempt of a call.
+
+        The time waited for the token does not count towards the retry deadline.
+
+        Args:
+            call (ApiCall): Call.
+
+        Raises:
+            RateLimitException: If the attempt would have to wait longer than the rate limiter timeout.
+
+        Returns:
+            float: Seconds to wait before the attempt.
+
+        # noqa: DAR402 RateLimitException
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        wait: float = self.rate_limiter.reserve(call.operation, call.method)
+        call.started += wait
+        return wait
+
+    def _before_attempt(self, call: ApiCall, request_timeout: RequestTimeout) -> RequestTimeout:
+        """Start the next attempt of a call.
+
+        Args:
+            call (ApiCall): Call.
+            request_timeout (RequestTimeout): Request timeout given by the caller.
+
+        Raises:
+            CircuitOpenException: If the circuit of the call is open.
+
+        Returns:
+            RequestTimeout: Request timeout of the attempt, limited to the time left of the retry deadline if
+                the caller gave none.
+
+        # noqa: DAR402 CircuitOpenException
+        """
+        call.attempt += 1
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.acquire(call.circuit)
+        if request_timeout is None and self.retry_policy is not None:
+            return self.retry_policy.remaining(call.started)
+        return request_timeout
+
+    def _after_attempt(
+        self, call: ApiCall, status: Optional[int] = None, retry_after: Optional[str] = None, error: Optional[BaseException] = None
+    ) -> Optional[float]:
+        """Record the outcome of an attempt and decide if the call is retried.
+
+        Args:
+            call (ApiCall): Call.
+            status (Optional[int]): HTTP status of the response. Defaults to None.
+            retry_after (Optional[str]): Retry-After header of the response. Defaults to None.
+            error (Optional[BaseException]): Error of the attempt, if it failed without a response. Defaults to None.
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt or None, if the call is not retried.
+        """
+        if self.circuit_breaker is not None:
+            success: Optional[bool] = False
+            if error is None:
+                success = status is not None and status < 500
+            elif not isinstance(error, Exception) or isinstance(error, ConcurrencyLimitException):
+                # cancelled (e.g. asyncio.CancelledError) or never sent
+                success = None
+            self.circuit_breaker.record(call.circuit, success)
+        if self.retry_policy is None or (error is not None and not self._is_connection_error(error)):
+            return None
+        return self.retry_policy.next_delay(call.operation, call.method, call.attempt, call.started, status=status, retry_after=retry_after)
+
+    def _is_connection_error(self, error: BaseException) -> bool:
+        """Check if an attempt failed on the connection level (and can be retried).
+
+        Args:
+            error (BaseException): Error of the attempt.
+
+        Returns:
+            bool: True, if it is a connection error or timeout.
+        """
+        return isinstance(error, urllib3.exceptions.HTTPError)
+
+    def call_api(
+        self,
+        method: str,
+        url: str,
+        header_params: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> rest.RESTResponse:
+        """Perform the request, retrying it according to the retry policy.
+
+        Each attempt first waits for the rate limiter. If no request timeout is given, each attempt is limited to
+        the time left of the retry deadline.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            header_params (Optional[Dict[str, str]]): Request headers. Defaults to None.
+            body (Any): Request body. Defaults to None.
+            post_params (Any): Form parameters. Defaults to None.
+            _request_timeout (RequestTimeout): Total timeout or (connect, read) timeouts. Defaults to None.
+
+        Raises:
+            CircuitOpenException: If the circuit of the operation is open.
+            RateLimitException: If the rate limiter allows no attempt within its timeout.
+            ConcurrencyLimitException: If the concurrency limiter has no free slot within its timeout.
+            BaseException: Error of the last attempt, if it failed without a response (e.g. a connection error).
+
+        Returns:
+            rest.RESTResponse: Response of the last attempt.
+
+        # noqa: DAR402 CircuitOpenException RateLimitException ConcurrencyLimitException
+        """
+        call = ApiCall(method, url, header_params)
+        while True:
+            wait: float = self._throttle(call)
+            if wait > 0:
+                time.sleep(wait)
+            timeout: RequestTimeout = self._before_attempt(call, _request_timeout)
+            try:
+                response: rest.RESTResponse = super().call_api(method, url, header_params, body, post_params, timeout)
+            except BaseException as error:
+                delay: Optional[float] = self._after_attempt(call, error=error)
+                if delay is None:
+                    raise
+            else:
+                retry_after: Optional[str] = response.getheader("Retry-After")  # type: ignore[no-untyped-call]
+                delay = self._after_attempt(call, status=response.status, retry_after=retry_after)
+                if delay is None:
+                    return response
+                # release the connection to the pool
+                response.read()  # type: ignore[no-untyped-call]
+            time.sleep(delay)
@@ -0,0 +1,250 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, NamedTuple, Optional
+
+from corbado_python_sdk.exceptions import CircuitOpenException
+
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD = 0.5
+DEFAULT_CIRCUIT_WINDOW_SIZE = 20
+DEFAULT_CIRCUIT_MIN_CALLS = 10
+DEFAULT_CIRCUIT_OPEN_TIMEOUT = 30.0
+DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS = 1
+
+
+class CircuitState(Enum):
+    """State of a circuit.
+
+    Attributes:
+        CLOSED (str): Requests pass, outcomes are counted.
+        OPEN (str): Requests fail fast with a CircuitOpenException.
+        HALF_OPEN (str): A limited number of probe requests pass to test whether the Backend API recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitSnapshot(NamedTuple):
+    """State of a circuit for monitoring.
+
+    Attributes:
+        state (CircuitState): Current state.
+        consecutive_failures (int): Failures since the last success.
+        error_rate (float): Failure rate over the window of recent calls.
+        calls (int): Number of calls in the window.
+        times_opened (int): Number of times the circuit opened.
+        rejected (int): Number of requests rejected while open.
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    error_rate: float
+    calls: int
+    times_opened: int
+    rejected: int
+
+
+class _Circuit:
+    """Mutable state of one circuit, guarded by the lock of the CircuitBreaker."""
+
+    __slots__ = ("state", "outcomes", "failures", "consecutive_failures", "opened_at", "probes", "times_opened", "rejected")
+
+    def __init__(self, window_size: int) -> None:
+        self.state: CircuitState = CircuitState.CLOSED
+        # True for a failure, the sum is kept in failures
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.failures: int = 0
+        self.consecutive_failures: int = 0
+        self.opened_at: float = 0.0
+        self.probes: int = 0
+        self.times_opened: int = 0
+        self.rejected: int = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker for Backend API requests, keeping one circuit per host and operation.
+
+    A closed circuit opens after failure_threshold consecutive failures or once the failure rate over the last
+    window_size calls (at least min_calls) reaches error_rate_threshold. Failures are connection errors, timeouts
+    and 5xx responses. While open, requests fail fast with a CircuitOpenException instead of waiting for
+    timeouts. After open_timeout seconds the circuit is half-open and lets up to half_open_max_calls probe
+    requests through: a successful probe closes it, a failed one opens it again.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open a circuit.
+        error_rate_threshold (float): Failure rate (0 to 1) over the window that opens a circuit.
+        window_size (int): Number of recent calls the failure rate is calculated over.
+        min_calls (int): Minimum number of calls in the window before the failure rate is considered.
+        open_timeout (float): Seconds a circuit stays open before probe requests are let through.
+        half_open_max_calls (int): Maximum number of concurrent probe requests of a half-open circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        error_rate_threshold: float = DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD,
+        window_size: int = DEFAULT_CIRCUIT_WINDOW_SIZE,
+        min_calls: int = DEFAULT_CIRCUIT_MIN_CALLS,
+        open_timeout: float = DEFAULT_CIRCUIT_OPEN_TIMEOUT,
+        half_open_max_calls: int = DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS,
+    ) -> None:
+        """Initialize a new instance of the CircuitBreaker class.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open a circuit. Defaults to DEFAULT_CIRCUIT_FAILURE_THRESHOLD.
+            error_rate_threshold (float): Failure rate (0 to 1) over the window that opens a circuit. Defaults to
+                DEFAULT_CIRCUIT_ERROR_RATE_THRESHOLD.
+            window_size (int): Number of recent calls the failure rate is calculated over. Defaults to
+                DEFAULT_CIRCUIT_WINDOW_SIZE.
+            min_calls (int): Minimum number of calls in the window before the failure rate is considered.
+                Defaults to DEFAULT_CIRCUIT_MIN_CALLS.
+            open_timeout (float): Seconds a circuit stays open before probe requests are let through. Defaults to
+                DEFAULT_CIRCUIT_OPEN_TIMEOUT.
+            half_open_max_calls (int): Maximum number of concurrent probe requests. Defaults to
+                DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if failure_threshold < 1 or window_size < 1 or half_open_max_calls < 1:
+            raise ValueError("Failure threshold, window size and half-open max calls must be at least 1")
+        if not 0 < error_rate_threshold <= 1:
+            raise ValueError(f'Error rate threshold must be greater than 0 and at most 1, the input is "{error_rate_threshold}"')
+        if not 1 <= min_calls <= window_size:
+            raise ValueError(f'Min calls must be between 1 and the window size, the input is "{min_calls}"')
+        if open_timeout <= 0:
+            raise ValueError(f'Open timeout must be greater than 0, the input is "{open_timeout}"')
+
+        self.failure_threshold: int = failure_threshold
+        self.error_rate_threshold: float = error_rate_threshold
+        self.window_size: int = window_size
+        self.min_calls: int = min_calls
+        self.open_timeout: float = open_timeout
+        self.half_open_max_calls: int = half_open_max_calls
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    # --------- Properties ----------#
+    @property
+    def circuits(self) -> Dict[str, CircuitSnapshot]:
+        """Get the state of all circuits by circuit (host and operation, e.g. "backendapi.cloud.corbado.io GET /users/{userID}").
+
+        Returns:
+            Dict[str, CircuitSnapshot]: Snapshot of the circuits.
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            return {key: self._snapshot(circuit, now) for key, circuit in self._circuits.items()}
+
+    # --------- Functions ----------#
+    def acquire(self, key: str) -> None:
+        """Let a request through or reject it. Every acquired request must be followed by record().
+
+        Args:
+            key (str): Circuit (host and operation).
+
+        Raises:
+            CircuitOpenException: If the circuit is open or the half-open circuit has enough probes in flight.
+        """
+        with self._lock:
+            circuit: Optional[_Circuit] = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit(window_size=self.window_size)
+            if circuit.state is CircuitState.CLOSED:
+                return
+
+            now: float = time.monotonic()
+            if circuit.state is CircuitState.OPEN and now - circuit.opened_at >= self.open_timeout:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes = 0
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probes < self.half_open_max_calls:
+                circuit.probes += 1
+                return
+            circuit.rejected += 1
+            retry_after: float = max(0.0, circuit.opened_at + self.open_timeout - now)
+        raise CircuitOpenException(circuit=key, retry_after=retry_after)
+
+    def record(self, key: str, success: Optional[bool]) -> None:
+        """Record the outcome of an acquired request.
+
+        Args:
+            key (str): Circuit (host and operation).
+            success (Optional[bool]): Whether the Backend API handled the request, None if the request was
+                aborted without an outcome (e.g. cancelled).
+        """
+        with self._lock:
+            circuit: Optional[_Circuit] = self._circuits.get(key)
+            if circuit is None:
+                return
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if success is None:
+                    return
+                if success:
+                    self._close(circuit)
+                else:
+                    self._open(circuit)
+                return
+            if success is None or circuit.state is CircuitState.OPEN:
+                # outcome of a request acquired before the circuit opened
+                return
+
+            if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                circuit.failures -= circuit.outcomes[0]
+            circuit.outcomes.append(not success)
+            if success:
+                circuit.consecutive_failures = 0
+                return
+            circuit.failures += 1
+            circuit.consecutive_failures += 1
+            if circuit.consecutive_failures >= self.failure_threshold or (
+                len(circuit.outcomes) >= self.min_calls and circuit.failures / len(circuit.outcomes) >= self.error_rate_threshold
+            ):
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        """Open a circuit.
+
+        Args:
+            circuit (_Circuit): Circuit.
+        """
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.times_opened += 1
+
+    def _close(self, circuit: _Circuit) -> None:
+        """Close a circuit, forgetting the failures.
+
+        Args:
+            circuit (_Circuit): Circuit.
+        """
+        circuit.state = CircuitState.CLOSED
+        circuit.outcomes.clear()
+        circuit.failures = 0
+        circuit.consecutive_failures = 0
+
+    def _snapshot(self, circuit: _Circuit, now: float) -> CircuitSnapshot:
+        """Create a snapshot of a circuit.
+
+        Args:
+            circuit (_Circuit): Circuit.
+            now (float): Current time (time.monotonic()).
+
+        Returns:
+            CircuitSnapshot: Snapshot.
+        """
+        state: CircuitState = circuit.state
+        if state is CircuitState.OPEN and now - circuit.opened_at >= self.open_timeout:
+            state = CircuitState.HALF_OPEN
+        return CircuitSnapshot(
+            state=state,
+            consecutive_failures=circuit.consecutive_failures,
+            error_rate=circuit.failures / len(circuit.outcomes) if circuit.outcomes else 0.0,
+            calls=len(circuit.outcomes),
+            times_opened=circuit.times_opened,
+            rejected=circuit.rejected,
+        )
@@ -0,0 +1,314 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, NamedTuple, Optional
+
+from corbado_python_sdk.exceptions import ConcurrencyLimitException
+
+DEFAULT_CONCURRENCY_INITIAL_LIMIT = 20
+DEFAULT_CONCURRENCY_MIN_LIMIT = 1
+DEFAULT_CONCURRENCY_MAX_LIMIT = 200
+DEFAULT_CONCURRENCY_LATENCY_TOLERANCE = 2.0
+DEFAULT_CONCURRENCY_BACKOFF_RATIO = 0.9
+DEFAULT_CONCURRENCY_MIN_LATENCY_WINDOW = 500
+
+
+class ConcurrencySnapshot(NamedTuple):
+    """State of an AdaptiveConcurrencyLimiter for monitoring.
+
+    Attributes:
+        limit (int): Current concurrency limit.
+        in_flight (int): Number of requests in flight.
+        queued (int): Number of requests waiting for a slot.
+        min_latency (Optional[float]): Observed minimum latency in seconds, None before the first sample.
+        decreases (int): Number of times the limit was cut.
+        rejected (int): Number of requests rejected, because no slot freed up within the timeout.
+    """
+
+    limit: int
+    in_flight: int
+    queued: int
+    min_latency: Optional[float]
+    decreases: int
+    rejected: int
+
+
+class _Waiter:
+    """Request waiting for a slot, woken up by the thread releasing a slot."""
+
+    __slots__ = ("loop", "event", "future", "granted")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.loop: Optional[asyncio.AbstractEventLoop] = loop
+        self.event: threading.Event = threading.Event()
+        self.future: Optional["asyncio.Future[None]"] = loop.create_future() if loop is not None else None
+        # set (under the lock of the limiter) once the slot is handed over
+        self.granted: bool = False
+
+    def wake(self) -> bool:
+        """Wake up the waiting request.
+
+        Returns:
+            bool: False, if the event loop of the request is already closed.
+        """
+        if self.loop is None or self.future is None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+        except RuntimeError:
+            return False
+        return True
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    """Resolve the future of a waiter, unless it was cancelled.
+
+    Args:
+        future (asyncio.Future[None]): Future.
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Adaptive limit of concurrent Backend API requests (additive increase, multiplicative decrease).
+
+    Each successful request whose latency stays within latency_tolerance times the observed minimum latency raises
+    the limit by 1 / limit (so by about 1 per limit requests), as long as the limit is actually used. Failed
+    requests (connection errors, timeouts, 429 and 5xx responses) and requests slower than the tolerance cut the
+    limit to backoff_ratio times its value, at most once per round trip. The minimum latency is taken over windows
+    of min_latency_window requests, so it follows lasting changes of the Backend API latency.
+
+    Requests beyond the limit wait for a slot in order. If no slot frees up within the timeout, a
+    ConcurrencyLimitException is raised instead. The limiter is thread-safe and can be shared by the sync and the
+    async API client, each request has to release its slot with release().
+
+    Attributes:
+        min_limit (int): Lowest concurrency limit.
+        max_limit (int): Highest concurrency limit.
+        latency_tolerance (float): Latency relative to the minimum latency above which the limit is cut.
+        backoff_ratio (float): Factor (between 0 and 1) the limit is cut by.
+        min_latency_window (int): Number of successful requests the minimum latency is taken over.
+        timeout (Optional[float]): Maximum seconds a request waits for a slot, None to wait as long as needed.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_CONCURRENCY_MIN_LIMIT,
+        max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT,
+        latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+        backoff_ratio: float = DEFAULT_CONCURRENCY_BACKOFF_RATIO,
+        min_latency_window: int = DEFAULT_CONCURRENCY_MIN_LATENCY_WINDOW,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize a new instance of the AdaptiveConcurrencyLimiter class.
+
+        Args:
+            initial_limit (int): Concurrency limit to start with. Defaults to DEFAULT_CONCURRENCY_INITIAL_LIMIT.
+            min_limit (int): Lowest concurrency limit. Defaults to DEFAULT_CONCURRENCY_MIN_LIMIT.
+            max_limit (int): Highest concurrency limit. Defaults to DEFAULT_CONCURRENCY_MAX_LIMIT.
+            latency_tolerance (float): Latency relative to the minimum latency above which the limit is cut. Defaults
+                to DEFAULT_CONCURRENCY_LATENCY_TOLERANCE.
+            backoff_ratio (float): Factor (between 0 and 1) the limit is cut by. Defaults to
+                DEFAULT_CONCURRENCY_BACKOFF_RATIO.
+            min_latency_window (int): Number of successful requests the minimum latency is taken over. Defaults to
+                DEFAULT_CONCURRENCY_MIN_LATENCY_WINDOW.
+            timeout (Optional[float]): Maximum seconds a request waits for a slot, 0 fails immediately and None waits
+                as long as needed. Defaults to None.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(f"Limits must be 1 <= min_limit <= initial_limit <= max_limit, the input is {min_limit}, {initial_limit}, {max_limit}")
+        if latency_tolerance <= 1:
+            raise ValueError(f'Latency tolerance must be greater than 1, the input is "{latency_tolerance}"')
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f'Backoff ratio must be between 0 and 1, the input is "{backoff_ratio}"')
+        if min_latency_window < 1:
+            raise ValueError(f'Min latency window must be at least 1, the input is "{min_latency_window}"')
+        if timeout is not None and timeout < 0:
+            raise ValueError(f'Timeout must not be negative, the input is "{timeout}"')
+
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.latency_tolerance: float = latency_tolerance
+        self.backoff_ratio: float = backoff_ratio
+        self.min_latency_window: int = min_latency_window
+        self.timeout: Optional[float] = timeout
+        self._lock = threading.Lock()
+        self._limit: float = float(initial_limit)
+        self._in_flight: int = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._min_latency: Optional[float] = None
+        self._window_min_latency: Optional[float] = None
+        self._window_samples: int = 0
+        self._last_decrease: float = float("-inf")
+        self._decreases: int = 0
+        self._rejected: int = 0
+
+    # --------- Properties ----------#
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit.
+
+        Returns:
+            int: Concurrency limit.
+        """
+        return int(self._limit)
+
+    @property
+    def snapshot(self) -> ConcurrencySnapshot:
+        """Get the state of the limiter.
+
+        Returns:
+            ConcurrencySnapshot: Snapshot.
+        """
+        with self._lock:
+            return ConcurrencySnapshot(
+                limit=int(self._limit),
+                in_flight=self._in_flight,
+                queued=len(self._waiters),
+                min_latency=self._min_latency,
+                decreases=self._decreases,
+                rejected=self._rejected,
+            )
+
+    # --------- Functions ----------#
+    def acquire(self) -> float:
+        """Take a slot for a request, waiting for one if the limit is reached.
+
+        Raises:
+            ConcurrencyLimitException: If no slot frees up within the timeout.
+
+        Returns:
+            float: Start of the request (time.monotonic()) to pass to release().
+        """
+        with self._lock:
+            if self._admit():
+                return time.monotonic()
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+
+        if not waiter.event.wait(self.timeout):
+            with self._lock:
+                granted: bool = waiter.granted
+                if not granted:
+                    self._reject(waiter)
+                limit: int = int(self._limit)
+            if not granted:
+                raise ConcurrencyLimitException(limit=limit, timeout=self.timeout or 0.0)
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """Take a slot for a request, waiting (asynchronously) for one if the limit is reached.
+
+        Raises:
+            ConcurrencyLimitException: If no slot frees up within the timeout.
+
+        Returns:
+            float: Start of the request (time.monotonic()) to pass to release().
+        """
+        with self._lock:
+            if self._admit():
+                return time.monotonic()
+            waiter = _Waiter(loop=asyncio.get_running_loop())
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter.future, self.timeout)  # type: ignore[arg-type]
+        except BaseException as error:
+            with self._lock:
+                granted: bool = waiter.granted
+                if not granted:
+                    self._reject(waiter, counted=isinstance(error, asyncio.TimeoutError))
+                limit: int = int(self._limit)
+            if granted and isinstance(error, asyncio.TimeoutError):
+                # the slot was handed over while timing out
+                return time.monotonic()
+            if granted:
+                self.release(time.monotonic(), None)
+            if isinstance(error, asyncio.TimeoutError):
+                raise ConcurrencyLimitException(limit=limit, timeout=self.timeout or 0.0) from None
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, success: Optional[bool]) -> None:
+        """Release the slot of a request and adapt the limit to its outcome.
+
+        Args:
+            started (float): Start of the request as returned by acquire().
+            success (Optional[bool]): Whether the Backend API handled the request, None if the request was aborted
+                without an outcome (e.g. cancelled), it is then not considered for the limit.
+        """
+        latency: float = time.monotonic() - started
+        with self._lock:
+            # the limit is only raised if it is used, otherwise it would grow without bounds while idle
+            utilized: bool = self._in_flight >= self._limit / 2
+            self._in_flight -= 1
+            if success is not None:
+                self._adapt(started, latency, success, utilized)
+            self._grant()
+
+    def _admit(self) -> bool:
+        """Take a slot without waiting, if one is free and nobody is waiting. Requires the lock.
+
+        Returns:
+            bool: True, if a slot was taken.
+        """
+        if not self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _grant(self) -> None:
+        """Hand free slots over to waiting requests in order. Requires the lock."""
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter: _Waiter = self._waiters.popleft()
+            if waiter.wake():
+                waiter.granted = True
+                self._in_flight += 1
+
+    def _reject(self, waiter: _Waiter, counted: bool = True) -> None:
+        """Remove a waiting request that gave up. Requires the lock.
+
+        Args:
+            waiter (_Waiter): Waiting request.
+            counted (bool): Whether it counts as rejected (timed out). Defaults to True.
+        """
+        self._waiters.remove(waiter)
+        if counted:
+            self._rejected += 1
+
+    def _adapt(self, started: float, latency: float, success: bool, utilized: bool) -> None:
+        """Adapt the limit to the outcome of a request. Requires the lock.
+
+        Args:
+            started (float): Start of the request.
+            latency (float): Latency of the request in seconds.
+            success (bool): Whether the Backend API handled the request.
+            utilized (bool): Whether at least half of the limit was in flight.
+        """
+        if success:
+            if self._min_latency is None or latency < self._min_latency:
+                self._min_latency = latency
+            if self._window_min_latency is None or latency < self._window_min_latency:
+                self._window_min_latency = latency
+            self._window_samples += 1
+            if self._window_samples >= self.min_latency_window:
+                # start over from the minimum of the last window, so a lasting latency change is followed
+                self._min_latency = self._window_min_latency
+                self._window_min_latency = None
+                self._window_samples = 0
+
+        if not success or (self._min_latency is not None and latency > self._min_latency * self.latency_tolerance):
+            # requests started before the last cut still see the congestion that caused it
+            if started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._last_decrease = time.monotonic()
+                self._decreases += 1
+        elif utilized:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
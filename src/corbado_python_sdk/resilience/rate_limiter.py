@@ -0,0 +1,165 @@
+import math
+import threading
+import time
+from typing import Dict, FrozenSet, Mapping, NamedTuple, Optional
+
+from corbado_python_sdk.exceptions import RateLimitException
+
+READ_GROUP = "read"
+WRITE_GROUP = "write"
+READ_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RateLimit(NamedTuple):
+    """Rate limit of one operation group.
+
+    Attributes:
+        rate (float): Sustained requests per second.
+        burst (Optional[int]): Requests that can be sent at once after being idle, None for one second of
+            requests (rate rounded up).
+    """
+
+    rate: float
+    burst: Optional[int] = None
+
+
+class RateLimitCounters(NamedTuple):
+    """Rate limiter counters of one operation group.
+
+    Attributes:
+        acquired (int): Number of requests let through.
+        delayed (int): Number of requests that had to wait.
+        rejected (int): Number of requests rejected, because they would have waited longer than the timeout.
+        waited (float): Total seconds requests waited.
+    """
+
+    acquired: int
+    delayed: int
+    rejected: int
+    waited: float
+
+
+class _TokenBucket:
+    """Token bucket of one operation group, guarded by the lock of the RateLimiter."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "acquired", "delayed", "rejected", "waited")
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.rate: float = limit.rate
+        self.capacity: float = float(limit.burst if limit.burst is not None else max(1, math.ceil(limit.rate)))
+        # negative while requests wait for tokens that are already reserved
+        self.tokens: float = self.capacity
+        self.updated: float = time.monotonic()
+        self.acquired: int = 0
+        self.delayed: int = 0
+        self.rejected: int = 0
+        self.waited: float = 0.0
+
+
+class RateLimiter:
+    """Client-side rate limiter for Backend API requests, keeping one token bucket per operation group.
+
+    Operations (method and resource path template, e.g. "POST /users") are grouped by the operations mapping
+    or otherwise by method into "read" (GET, HEAD, OPTIONS) and "write" requests. Groups without a limit are
+    not limited. A request takes a token of its group, if none is left it waits until one is refilled (tokens are
+    reserved in order, so waiting requests are served first come, first served). If the wait would be longer than
+    the timeout, a RateLimitException is raised instead.
+
+    The limiter is thread-safe and can be shared by several API clients (and CorbadoSDK instances), so that all of
+    them together stay within the rate.
+
+    Attributes:
+        limits (Dict[str, RateLimit]): Rate limits by operation group.
+        operations (Dict[str, str]): Operation group by operation, overriding the grouping by method.
+        timeout (Optional[float]): Maximum seconds a request waits for a token, None to wait as long as needed.
+    """
+
+    def __init__(self, limits: Mapping[str, RateLimit], operations: Optional[Mapping[str, str]] = None, timeout: Optional[float] = None) -> None:
+        """Initialize a new instance of the RateLimiter class.
+
+        Args:
+            limits (Mapping[str, RateLimit]): Rate limits by operation group, e.g. {"write": RateLimit(rate=10)}.
+            operations (Optional[Mapping[str, str]]): Operation group by operation (e.g. {"POST /users": "import"}),
+                overriding the grouping by method. Defaults to None.
+            timeout (Optional[float]): Maximum seconds a request waits for a token, 0 fails immediately and None waits
+                as long as needed. Defaults to None.
+
+        Raises:
+            ValueError: If a rate, burst or the timeout is out of range.
+        """
+        for group, limit in limits.items():
+            if limit.rate <= 0:
+                raise ValueError(f'Rate of group "{group}" must be greater than 0, the input is "{limit.rate}"')
+            if limit.burst is not None and limit.burst < 1:
+                raise ValueError(f'Burst of group "{group}" must be at least 1, the input is "{limit.burst}"')
+        if timeout is not None and timeout < 0:
+            raise ValueError(f'Timeout must not be negative, the input is "{timeout}"')
+
+        self.limits: Dict[str, RateLimit] = dict(limits)
+        self.operations: Dict[str, str] = dict(operations or {})
+        self.timeout: Optional[float] = timeout
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _TokenBucket] = {group: _TokenBucket(limit) for group, limit in self.limits.items()}
+
+    # --------- Properties ----------#
+    @property
+    def counters(self) -> Dict[str, RateLimitCounters]:
+        """Get rate limiter counters by operation group.
+
+        Returns:
+            Dict[str, RateLimitCounters]: Snapshot of the counters.
+        """
+        with self._lock:
+            return {
+                group: RateLimitCounters(acquired=bucket.acquired, delayed=bucket.delayed, rejected=bucket.rejected, waited=bucket.waited)
+                for group, bucket in self._buckets.items()
+            }
+
+    # --------- Functions ----------#
+    def group(self, operation: str, method: str) -> str:
+        """Get the operation group of an operation.
+
+        Args:
+            operation (str): Operation (method and resource path template).
+            method (str): HTTP method.
+
+        Returns:
+            str: Operation group.
+        """
+        group: Optional[str] = self.operations.get(operation)
+        if group is not None:
+            return group
+        return READ_GROUP if method.upper() in READ_METHODS else WRITE_GROUP
+
+    def reserve(self, operation: str, method: str) -> float:
+        """Take a token for a request, the request has to wait the returned time before it is sent.
+
+        Args:
+            operation (str): Operation (method and resource path template).
+            method (str): HTTP method.
+
+        Raises:
+            RateLimitException: If the request would have to wait longer than the timeout.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        group: str = self.group(operation, method)
+        bucket: Optional[_TokenBucket] = self._buckets.get(group)
+        if bucket is None:
+            return 0.0
+
+        with self._lock:
+            now: float = time.monotonic()
+            bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            wait: float = 0.0 if bucket.tokens >= 1 else (1 - bucket.tokens) / bucket.rate
+            if self.timeout is None or wait <= self.timeout:
+                bucket.tokens -= 1
+                bucket.acquired += 1
+                if wait > 0:
+                    bucket.delayed += 1
+                    bucket.waited += wait
+                return wait
+            bucket.rejected += 1
+        raise RateLimitException(group=group, retry_after=wait)
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional
+
+from corbado_python_sdk.generated import rest
+from corbado_python_sdk.generated.configuration import Configuration
+
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+class LimitedRESTClientObject(rest.RESTClientObject):
+    """RESTClientObject limiting concurrent requests with an AdaptiveConcurrencyLimiter.
+
+    The latency of a request is measured until the response headers arrived, the body is read by the caller.
+    """
+
+    def __init__(self, configuration: Configuration, concurrency_limiter: AdaptiveConcurrencyLimiter) -> None:
+        """Initialize a new instance of the LimitedRESTClientObject class.
+
+        Args:
+            configuration (Configuration): Configuration (generated class).
+            concurrency_limiter (AdaptiveConcurrencyLimiter): Concurrency limiter.
+        """
+        super().__init__(configuration)
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter = concurrency_limiter
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> rest.RESTResponse:
+        """Perform a request once a concurrency slot is free.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            headers (Optional[Dict[str, str]]): Request headers. Defaults to None.
+            body (Any): Request body. Defaults to None.
+            post_params (Any): Form parameters. Defaults to None.
+            _request_timeout (Any): Total timeout or (connect, read) timeouts. Defaults to None.
+
+        Raises:
+            ConcurrencyLimitException: If no slot frees up within the timeout of the limiter.
+            BaseException: Error of the request.
+
+        Returns:
+            rest.RESTResponse: Response.
+
+        # noqa: DAR402 ConcurrencyLimitException
+        """
+        started: float = self.concurrency_limiter.acquire()
+        success: Optional[bool] = None
+        try:
+            response: rest.RESTResponse = super().request(  # type: ignore[no-untyped-call]
+                method, url, headers=headers, body=body, post_params=post_params, _request_timeout=_request_timeout
+            )
+            success = response.status < 500 and response.status != 429
+            return response
+        except BaseException as error:
+            # not counted if interrupted (e.g. KeyboardInterrupt)
+            success = False if isinstance(error, Exception) else None
+            raise
+        finally:
+            self.concurrency_limiter.release(started, success)
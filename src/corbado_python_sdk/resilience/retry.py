@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.1
+DEFAULT_RETRY_MAX_DELAY = 2.0
+DEFAULT_RETRY_DEADLINE = 10.0
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryCounters(NamedTuple):
+    """Retry counters of one operation.
+
+    Attributes:
+        calls (int): Number of calls.
+        retries (int): Number of retried attempts.
+        exhausted (int): Number of calls that failed retryably, but were not retried anymore because the
+            attempts or the deadline were used up.
+    """
+
+    calls: int
+    retries: int
+    exhausted: int
+
+
+class RetryPolicy:
+    """Retry policy for Backend API requests, using exponential backoff with full jitter.
+
+    Only responses with a status in retry_statuses and connection errors are retried, and by default only for
+    idempotent methods. The n-th retry waits a random time between 0 and min(max_delay, base_delay * 2 ** (n - 1)),
+    so that clients that failed together do not retry in lockstep. A Retry-After header of the response is
+    honored instead. All attempts of a call, including the waits, have to fit into the deadline (DEFAULT_RETRY_DEADLINE,
+    10 seconds, by default), so ResilientApiClient uses the rest of it as timeout of attempts without a request timeout.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts per call, 1 disables retries.
+        base_delay (float): Backoff of the first retry in seconds.
+        max_delay (float): Maximum backoff in seconds (Retry-After is only limited by the deadline).
+        deadline (float): Seconds all attempts of a call have to fit in.
+        retry_statuses (FrozenSet[int]): HTTP statuses to retry.
+        methods (FrozenSet[str]): HTTP methods to retry.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        deadline: float = DEFAULT_RETRY_DEADLINE,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+    ) -> None:
+        """Initialize a new instance of the RetryPolicy class.
+
+        Args:
+            max_attempts (int): Maximum number of attempts per call, 1 disables retries. Defaults to
+                DEFAULT_RETRY_MAX_ATTEMPTS.
+            base_delay (float): Backoff of the first retry in seconds. Defaults to DEFAULT_RETRY_BASE_DELAY.
+            max_delay (float): Maximum backoff in seconds. Defaults to DEFAULT_RETRY_MAX_DELAY.
+            deadline (float): Seconds all attempts of a call have to fit in. Defaults to DEFAULT_RETRY_DEADLINE.
+            retry_statuses (Iterable[int]): HTTP statuses to retry. Defaults to DEFAULT_RETRY_STATUSES.
+            methods (Iterable[str]): HTTP methods to retry. Defaults to IDEMPOTENT_METHODS.
+
+        Raises:
+            ValueError: If max_attempts is less than 1 or a delay or the deadline are not positive.
+        """
+        if max_attempts < 1:
+            raise ValueError(f'Max attempts must be at least 1, the input is "{max_attempts}"')
+        if base_delay <= 0 or max_delay <= 0:
+            raise ValueError("Retry delays must be greater than 0")
+        if deadline <= 0:
+            raise ValueError(f'Deadline must be greater than 0, the input is "{deadline}"')
+
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.deadline: float = deadline
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, List[int]] = {}
+
+    # --------- Properties ----------#
+    @property
+    def counters(self) -> Dict[str, RetryCounters]:
+        """Get retry counters by operation (e.g. "GET /users/{userID}").
+
+        Returns:
+            Dict[str, RetryCounters]: Snapshot of the counters.
+        """
+        with self._lock:
+            return {operation: RetryCounters(*counts) for operation, counts in self._counters.items()}
+
+    # --------- Functions ----------#
+    def backoff(self, retry: int) -> float:
+        """Get a random delay before the given retry (full jitter).
+
+        Args:
+            retry (int): Number of the retry, starting at 1.
+
+        Returns:
+            float: Backoff in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))  # noqa: S311 - jitter only
+
+    def remaining(self, started: float) -> float:
+        """Get the seconds left of the deadline of a call.
+
+        Args:
+            started (float): Start of the call (time.monotonic()).
+
+        Returns:
+            float: Remaining seconds, can be negative.
+        """
+        return self.deadline - (time.monotonic() - started)
+
+    def next_delay(
+        self,
+        operation: str,
+        method: str,
+        attempt: int,
+        started: float,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Decide if a call is retried after an attempt and update the counters.
+
+        Args:
+            operation (str): Operation, the counters are kept for.
+            method (str): HTTP method.
+            attempt (int): Number of the finished attempt, starting at 1.
+            started (float): Start of the call (time.monotonic()).
+            status (Optional[int]): HTTP status of the response, None for a connection error. Defaults to None.
+            retry_after (Optional[str]): Retry-After header of the response. Defaults to None.
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt or None, if the call is not retried.
+        """
+        retryable: bool = method.upper() in self.methods and (status is None or status in self.retry_statuses)
+        delay: Optional[float] = None
+        if retryable and attempt < self.max_attempts:
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = self.backoff(attempt)
+            if delay >= self.remaining(started):
+                delay = None
+
+        with self._lock:
+            counts = self._counters.setdefault(operation, [0, 0, 0])
+            if attempt == 1:
+                counts[0] += 1
+            if delay is not None:
+                counts[1] += 1
+            elif retryable:
+                counts[2] += 1
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date).
+
+    Args:
+        value (Optional[str]): Header value.
+
+    Returns:
+        Optional[float]: Seconds to wait or None, if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None or retry_at.tzinfo is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
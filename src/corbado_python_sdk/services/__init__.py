@@ -1,3 +1,9 @@
-from .implementation import IdentifierService, SessionService, UserService
+from .implementation import (
+    AsyncIdentifierService,
+    AsyncUserService,
+    IdentifierService,
+    SessionService,
+    UserService,
+)
 
-__all__ = ["IdentifierService", "SessionService", "UserService"]
+__all__ = ["AsyncIdentifierService", "AsyncUserService", "IdentifierService", "SessionService", "UserService"]
@@ -1,8 +1,12 @@
+from .async_identifier_service import AsyncIdentifierService
+from .async_user_service import AsyncUserService
 from .identifier_service import IdentifierService
 from .session_service import SessionService
 from .user_service import UserService
 
 __all__ = [
+    "AsyncIdentifierService",
+    "AsyncUserService",
     "IdentifierService",
     "UserService",
     "SessionService",
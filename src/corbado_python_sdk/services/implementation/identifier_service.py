@@ -17,6 +17,40 @@ from corbado_python_sdk.generated import (
 from corbado_python_sdk.generated.models.paging import Paging
 
 
+def build_identifier_filters(
+    filters: Optional[List[StrictStr]],
+    user_id: Optional[StrictStr],
+    identifier_type: Optional[IdentifierType],
+    identifier_value: Optional[StrictStr],
+) -> Optional[List[StrictStr]]:
+    """Add the filters for user ID, identifier type and identifier value to the given filters.
+
+    Args:
+        filters (Optional[List[StrictStr]]): Filters, extended in place if given.
+        user_id (Optional[StrictStr]): Filter by user ID.
+        identifier_type (Optional[IdentifierType]): Filter by identifier type.
+        identifier_value (Optional[StrictStr]): Filter by identifier value.
+
+    Returns:
+        Optional[List[StrictStr]]: Filters.
+    """
+    if user_id:
+        filters = filters or []
+        if user_id.startswith("usr-"):
+            user_id = user_id[4:]
+        filters.append(f"userID:eq:{user_id}")
+    if identifier_type:
+        filters = filters or []
+        encoded_type: StrictStr = urllib.parse.quote_plus(identifier_type)
+        filters.append(f"identifierType:eq:{encoded_type}")
+    if identifier_value:
+        # encoded_value: StrictStr = urllib.parse.quote_plus(identifier_value)
+        filters = filters or []
+        # only works when the identifier_value is not url encoded
+        filters.append(f"identifierValue:eq:{identifier_value}")
+    return filters
+
+
 class IdentifierService(BaseModel):
     """This class provides functionality for managing login identifiers."""
 
@@ -84,20 +118,9 @@ class IdentifierService(BaseModel):
         Returns:
             IdentifierList: A list of identifiers that match the criteria.
         """
-        if user_id:
-            filters = filters or []
-            if user_id.startswith("usr-"):
-                user_id = user_id[4:]
-            filters.append(f"userID:eq:{user_id}")
-        if identifier_type:
-            filters = filters or []
-            encoded_type: StrictStr = urllib.parse.quote_plus(identifier_type)
-            filters.append(f"identifierType:eq:{encoded_type}")
-        if identifier_value:
-            # encoded_value: StrictStr = urllib.parse.quote_plus(identifier_value)
-            filters = filters or []
-            # only works when the identifier_value is not url encoded
-            filters.append(f"identifierValue:eq:{identifier_value}")
+        filters = build_identifier_filters(
+            filters=filters, user_id=user_id, identifier_type=identifier_type, identifier_value=identifier_value
+        )
         try:
             return self.client.identifier_list(sort=sort, filter=filters, page=page, page_size=page_size)
         except ApiException as e:
@@ -1,22 +1,71 @@
+import asyncio
+import hashlib
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from time import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
+
 import jwt
 from jwt import (
+    DecodeError,
     ExpiredSignatureError,
     ImmatureSignatureError,
     InvalidAlgorithmError,
     InvalidSignatureError,
-    decode,
+    MissingRequiredClaimError,
+)
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveInt,
+    StrictStr,
+    StringConstraints,
+    ValidationError,
+    model_validator,
 )
-from jwt.jwks_client import PyJWKClient
-from pydantic import BaseModel, ConfigDict, StrictStr, StringConstraints
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Optional
 
-from corbado_python_sdk.entities import UserEntity, UserStatus
+from corbado_python_sdk.cache import (
+    DEFAULT_JWKS_LIFESPAN,
+    DEFAULT_JWKS_MAX_STALE,
+    DEFAULT_JWKS_MAX_UNKNOWN_KIDS,
+    DEFAULT_JWKS_MIN_REFRESH_INTERVAL,
+    DEFAULT_JWKS_REFRESH_AHEAD,
+    DEFAULT_JWKS_UNKNOWN_KID_TTL,
+    JWKSCache,
+    KeyStore,
+    RevocationFilter,
+    TTLCache,
+    UserStatusCache,
+)
+from corbado_python_sdk.entities import UserEntity, UserStatus, ValidatedSession
+from corbado_python_sdk.exceptions.standard_exception import StandardException
 from corbado_python_sdk.exceptions.token_validation_exception import (
     TokenValidationException,
     ValidationErrorType,
 )
+from corbado_python_sdk.utils.token_parser import ParsedToken, parse_token
+from corbado_python_sdk.utils.token_verifier import TokenVerifier
 
 DEFAULT_SESSION_TOKEN_LENGTH = 300
+DEFAULT_VALIDATION_CHUNK_SIZE = 64
+DEFAULT_STREAM_CHUNK_SIZE = 256
+DEFAULT_STREAM_PENDING_CHUNKS_PER_PROCESS = 4
 ALLOWED_ALGS = {"RS256"}
 
 
@@ -29,8 +78,27 @@ class SessionService(BaseModel):
         model_config (ConfigDict): Configuration dictionary for the model.
         issuer (str): Issuer of the session tokens.
         jwks_uri (str): URI of the JSON Web Key Set (JWKS) endpoint.
-        _jwk_client (PyJWKClient): JSON Web Key (JWK) client for handling JWKS.
+        extra_issuers (List[str]): Further accepted issuers, e.g. for projects reachable via several CNAMEs.
+        _jwks_cache (JWKSCache): Cache for the JSON Web Key Set (JWKS).
         project_id (str): Corbado Project Id.
+        jwks_refresh_ahead (int): Seconds before expiry of the cached JWKS at which it is refreshed in the background.
+        jwks_max_stale (int): Seconds an expired JWKS is still served while refreshing fails.
+        jwks_min_refresh_interval (int): Minimum seconds between JWKS refreshes forced by tokens with an unknown kid.
+        jwks_unknown_kid_ttl (int): Seconds a kid that is not in the JWKS is rejected without refreshing the JWKS.
+        jwks_max_unknown_kids (int): Maximum number of remembered unknown kids.
+        jwks_key_store (Optional[KeyStore]): Store to share the JWKS between processes (e.g. FileKeyStore).
+        jwks (Optional[Dict[str, Any]]): Static JWKS document, the JWKS endpoint is then never contacted.
+        jwks_path (Optional[str]): Path of a local JWKS file, the JWKS endpoint is then never contacted.
+        token_cache_size (int): Maximum number of validated tokens to cache, 0 disables the cache.
+        user_status_cache (Optional[UserStatusCache]): Cache for user statuses. If set, tokens of disabled or
+            deleted users are rejected and the actual user status is returned.
+        revocation_filter (Optional[RevocationFilter]): Set of revoked sessions. If set, tokens of revoked
+            sessions are rejected.
+        omit_token_in_errors (bool): Never put the raw session token into a TokenValidationException (e.g. to keep
+            tokens out of logs).
+        _token_cache (Optional[TTLCache[bytes, ValidatedSession]]): Cache of validated tokens (by token digest).
+        _accepted_issuers (FrozenSet[str]): Issuers accepted by _validate_issuer(), kept up to date by _update_accepted_issuers().
+        _verifiers (Dict[str, TokenVerifier]): Verifier of each signing key (by kid), rebuilt when the key is replaced.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
@@ -39,7 +107,23 @@ class SessionService(BaseModel):
     issuer: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     jwks_uri: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     project_id: str
-    _jwk_client: PyJWKClient
+    extra_issuers: List[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = Field(default_factory=list)
+    jwks_refresh_ahead: Annotated[int, Field(ge=0, lt=DEFAULT_JWKS_LIFESPAN)] = DEFAULT_JWKS_REFRESH_AHEAD
+    jwks_max_stale: NonNegativeInt = DEFAULT_JWKS_MAX_STALE
+    jwks_min_refresh_interval: NonNegativeInt = DEFAULT_JWKS_MIN_REFRESH_INTERVAL
+    jwks_unknown_kid_ttl: PositiveInt = DEFAULT_JWKS_UNKNOWN_KID_TTL
+    jwks_max_unknown_kids: PositiveInt = DEFAULT_JWKS_MAX_UNKNOWN_KIDS
+    jwks_key_store: Optional[KeyStore] = None
+    jwks: Optional[Dict[str, Any]] = None
+    jwks_path: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
+    token_cache_size: NonNegativeInt = 0
+    user_status_cache: Optional[UserStatusCache] = None
+    revocation_filter: Optional[RevocationFilter] = None
+    omit_token_in_errors: bool = False
+    _jwks_cache: JWKSCache
+    _token_cache: Optional[TTLCache[bytes, ValidatedSession]] = None
+    _accepted_issuers: FrozenSet[str] = frozenset()
+    _verifiers: Dict[str, TokenVerifier]
 
     # Constructor
     def __init__(self, **kwargs) -> None:  # type: ignore
@@ -49,22 +133,108 @@ class SessionService(BaseModel):
         Args:
             **kwargs: Additional keyword arguments to initialize the SessionService.
                 These keyword arguments should include values for the attributes defined in the class,
-                such as 'issuer', 'jwks_uri', 'cache_keys', 'cache_jwk_set' and 'session_token_cookie_length'.
+                such as 'issuer', 'jwks_uri', 'project_id', 'token_cache_size' and the 'jwks*' options.
 
         Raises:
             Any errors raised during the initialization process.
 
         """
         super().__init__(**kwargs)
-        self._jwk_client = PyJWKClient(
+        self._jwks_cache = JWKSCache(
             uri=self.jwks_uri,
             lifespan=DEFAULT_SESSION_TOKEN_LENGTH,
+            refresh_ahead=self.jwks_refresh_ahead,
+            max_stale=self.jwks_max_stale,
+            min_refresh_interval=self.jwks_min_refresh_interval,
+            unknown_kid_ttl=self.jwks_unknown_kid_ttl,
+            max_unknown_kids=self.jwks_max_unknown_kids,
+            key_store=self.jwks_key_store,
+            document=self.jwks,
+            document_path=self.jwks_path,
+        )
+        if self.token_cache_size > 0:
+            self._token_cache = TTLCache(max_size=self.token_cache_size, ttl=DEFAULT_SESSION_TOKEN_LENGTH)
+        self._verifiers = {}
+
+    # Validators
+    @model_validator(mode="after")
+    def _update_accepted_issuers(self) -> "SessionService":
+        """Compute the accepted issuers, on construction and whenever issuer, project_id or extra_issuers change.
+
+        Cached validation results are dropped if the accepted issuers change, since they were checked
+        against the old ones.
+
+        Returns:
+            SessionService: Validated instance.
+        """
+        accepted_issuers: FrozenSet[str] = frozenset(
+            [
+                # old Frontend API (without .cloud.)
+                f"https://{self.project_id}.frontendapi.corbado.io",
+                # new Frontend API (with .cloud.)
+                f"https://{self.project_id}.frontendapi.cloud.corbado.io",
+                # configured issuer (e.g., a custom domain or CNAME)
+                self.issuer,
+                *self.extra_issuers,
+            ]
         )
+        if accepted_issuers != self._accepted_issuers:
+            self._accepted_issuers = accepted_issuers
+            if self._token_cache is not None:
+                self._token_cache.clear()
+        return self
+
+    # Properties
+    @property
+    def jwks_cache(self) -> JWKSCache:
+        """Get JWKS cache, e.g. to read its refresh counters.
+
+        Returns:
+            JWKSCache: JWKS cache.
+        """
+        return self._jwks_cache
+
+    @property
+    def token_cache(self) -> Optional[TTLCache[bytes, ValidatedSession]]:
+        """Get cache of validated tokens, e.g. to read its hit and miss counters.
+
+        Returns:
+            Optional[TTLCache[bytes, ValidatedSession]]: Token cache or None, if disabled.
+        """
+        return self._token_cache
 
     # Core methods
+    def warm_up(self) -> int:
+        """Fetch (or read) and parse the JWKS (and sync the revoked sessions) eagerly, e.g. at application startup.
+
+        Without warm up, the first validated token pays for fetching the JWKS. Call it before
+        serving traffic to make configuration and connectivity errors surface at startup.
+
+        Raises:
+            StandardException: If the JWKS could not be fetched or parsed, or the revoked sessions not be synced.
+
+        Returns:
+            int: Number of loaded signing keys.
+        """
+        try:
+            num_keys: int = len(self._jwks_cache.refresh())
+        except Exception as error:
+            raise StandardException(f"Could not load JWKS: {str(error)}") from error
+
+        if self.revocation_filter is not None:
+            try:
+                self.revocation_filter.refresh()
+            except Exception as error:
+                raise StandardException(f"Could not load revoked sessions: {str(error)}") from error
+        return num_keys
+
     def validate_token(self, session_token: StrictStr) -> UserEntity:
         """Validate the given short-term session (represented as JWT) value.
 
+        If the token cache is enabled (token_cache_size > 0), the result for a valid token is cached until
+        the token expires, so revalidating it skips decoding and signature verification. Cached UserEntity
+        instances are shared between callers and must not be modified.
+
         Args:
             session_token (StrictStr): jwt
 
@@ -73,6 +243,84 @@ class SessionService(BaseModel):
 
         Returns:
             UserEntity: User Entity.
+
+        # noqa: DAR402 TokenValidationException
+        """
+        return self._to_user_entity(validated_session=self.validate_session(session_token=session_token), session_token=session_token)
+
+    def validate_session(self, session_token: StrictStr) -> ValidatedSession:
+        """Validate the given short-term session (represented as JWT) value, returning a lightweight result.
+
+        Works like validate_token(), but skips building the (pydantic) UserEntity. Use it on hot paths,
+        ValidatedSession.to_user_entity() converts the result on demand.
+
+        Args:
+            session_token (StrictStr): jwt
+
+        Raises:
+            TokenValidationException: If token is invalid.
+
+        Returns:
+            ValidatedSession: Validated session.
+        """
+        if not session_token:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN,
+                message=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN.name,
+            )
+
+        token_digest, validated_session = self._lookup_token_cache(session_token=session_token)
+        if validated_session is None:
+            # reject malformed tokens before any key lookup (which might hit the network)
+            token: ParsedToken = self._precheck_token(session_token=session_token)
+
+            signing_key: jwt.PyJWK = self._get_signing_key(session_token=session_token, kid=token.header["kid"])
+            validated_session = self._verify_token(
+                session_token=session_token, token=token, signing_key=signing_key, token_digest=token_digest
+            )
+
+        # checked for cached tokens, too, so revoked sessions and disabled users are caught right away
+        if self.revocation_filter is not None:
+            self._verify_not_revoked(claims=validated_session.claims, session_token=session_token)
+        if self.user_status_cache is not None:
+            status: UserStatus = self._get_user_status(user_id=validated_session.user_id, session_token=session_token)
+            validated_session = validated_session.with_status(status=status)
+        return validated_session  # noqa: R504
+
+    async def avalidate_token(self, session_token: StrictStr) -> UserEntity:
+        """Validate the given short-term session (represented as JWT) value without blocking the event loop.
+
+        Works like validate_token() and shares its caches. The signature is verified inline, only a lookup
+        that needs to fetch the JWKS (or the first sync of the revoked sessions) is delegated to the default
+        executor of the running event loop.
+
+        Args:
+            session_token (StrictStr): jwt
+
+        Raises:
+            TokenValidationException: If token is invalid.
+
+        Returns:
+            UserEntity: User Entity.
+
+        # noqa: DAR402 TokenValidationException
+        """
+        validated_session: ValidatedSession = await self.avalidate_session(session_token=session_token)
+        return self._to_user_entity(validated_session=validated_session, session_token=session_token)
+
+    async def avalidate_session(self, session_token: StrictStr) -> ValidatedSession:
+        """Validate the given short-term session (represented as JWT) value without blocking the event loop.
+
+        Async counterpart of validate_session(), see avalidate_token().
+
+        Args:
+            session_token (StrictStr): jwt
+
+        Raises:
+            TokenValidationException: If token is invalid.
+
+        Returns:
+            ValidatedSession: Validated session.
         """
         if not session_token:
             raise TokenValidationException(
@@ -80,41 +328,282 @@ class SessionService(BaseModel):
                 message=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN.name,
             )
 
-        # retrieve signing key
+        loop = asyncio.get_running_loop()
+        token_digest, validated_session = self._lookup_token_cache(session_token=session_token)
+        if validated_session is None:
+            token: ParsedToken = self._precheck_token(session_token=session_token)
+            kid: str = token.header["kid"]
+
+            signing_key: Optional[jwt.PyJWK] = self._jwks_cache.get_cached_signing_key(kid=kid)
+            if signing_key is None:
+                signing_key = await loop.run_in_executor(None, self._get_signing_key, session_token, kid)
+            validated_session = self._verify_token(
+                session_token=session_token, token=token, signing_key=signing_key, token_digest=token_digest
+            )
+
+        if self.revocation_filter is not None:
+            if self.revocation_filter.initial_sync_pending:
+                # the first sync lists the revoked sessions via the Backend API
+                await loop.run_in_executor(None, self._verify_not_revoked, validated_session.claims, session_token)
+            else:
+                self._verify_not_revoked(claims=validated_session.claims, session_token=session_token)
+        if self.user_status_cache is not None:
+            found, cached_status = self.user_status_cache.get_cached_status(user_id=validated_session.user_id)
+            status: UserStatus
+            if found:
+                status = self._verify_user_status(status=cached_status, session_token=session_token)
+            else:
+                status = await loop.run_in_executor(None, self._get_user_status, validated_session.user_id, session_token)
+            validated_session = validated_session.with_status(status=status)
+        return validated_session  # noqa: R504
+
+    def validate_tokens(
+        self,
+        session_tokens: Iterable[StrictStr],
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE,
+    ) -> List[Union[UserEntity, TokenValidationException]]:
+        """Validate many short-term sessions (represented as JWTs) at once.
+
+        Identical tokens are validated only once and the signing key of each distinct kid is looked up
+        only once. Signature verification can be spread over a ThreadPoolExecutor or ProcessPoolExecutor,
+        worker processes get the current JWKS passed and never fetch it themselves.
+
+        Args:
+            session_tokens (Iterable[StrictStr]): jwts
+            executor (Optional[Executor], optional): Executor to verify signatures with. If None, signatures
+                are verified in the calling thread. Defaults to None.
+            chunk_size (int): Number of tokens per task submitted to the executor.
+                Defaults to DEFAULT_VALIDATION_CHUNK_SIZE.
+
+        Returns:
+            List[Union[UserEntity, TokenValidationException]]: Result for each given token (in the same order),
+                either the User Entity or the exception describing why the token is invalid.
+        """
+        tokens: List[str] = list(session_tokens)
+        results: Dict[str, Union[UserEntity, TokenValidationException]] = {}
+        signing_keys: Dict[str, Union[jwt.PyJWK, TokenValidationException]] = {}
+        pending: List[Tuple[str, ParsedToken, Optional[bytes], jwt.PyJWK]] = []
+
+        # de-duplicate tokens and look up the signing key of each distinct kid once
+        for session_token in dict.fromkeys(tokens):
+            try:
+                if not session_token:
+                    raise TokenValidationException(
+                        error_type=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN,
+                        message=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN.name,
+                    )
+
+                token_digest, cached_session = self._lookup_token_cache(session_token=session_token)
+                if cached_session is not None:
+                    results[session_token] = self._to_user_entity(validated_session=cached_session, session_token=session_token)
+                    continue
+
+                token: ParsedToken = self._precheck_token(session_token=session_token)
+                kid: str = token.header["kid"]
+                if kid not in signing_keys:
+                    try:
+                        signing_keys[kid] = self._get_signing_key(session_token=session_token, kid=kid)
+                    except TokenValidationException as error:
+                        signing_keys[kid] = error
+
+                signing_key: Union[jwt.PyJWK, TokenValidationException] = signing_keys[kid]
+                if isinstance(signing_key, TokenValidationException):
+                    results[session_token] = signing_key
+                else:
+                    pending.append((session_token, token, token_digest, signing_key))
+            except TokenValidationException as error:
+                results[session_token] = error
+
+        # verify signatures and claims
+        chunks: List[List[Tuple[str, ParsedToken, Optional[bytes], jwt.PyJWK]]] = [
+            pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)
+        ]
+        verified: List[List[Union[UserEntity, TokenValidationException]]]
+        if executor is None:
+            verified = [self._verify_chunk(chunk=chunk) for chunk in chunks]
+        elif isinstance(executor, ProcessPoolExecutor):
+            settings: Dict[str, Any] = self._worker_settings()
+            settings["jwks"] = self._jwks_cache.document
+            futures = [executor.submit(_verify_chunk_in_process, settings, [item[0] for item in chunk]) for chunk in chunks]
+            verified = [future.result() for future in futures]
+        else:
+            verified = list(executor.map(self._verify_chunk, chunks))
+
+        for chunk, chunk_results in zip(chunks, verified):
+            for (session_token, _token, _token_digest, _signing_key), result in zip(chunk, chunk_results):
+                results[session_token] = result
+
+        # check revocations and user statuses (in this process, so all workers share the caches)
+        if self.revocation_filter is not None or self.user_status_cache is not None:
+            for session_token, result in results.items():
+                if isinstance(result, UserEntity):
+                    try:
+                        self._verify_not_revoked(claims=result.claims, session_token=session_token)
+                        status: UserStatus = self._get_user_status(user_id=result.user_id, session_token=session_token)
+                        if status != result.status:
+                            results[session_token] = result.model_copy(update={"status": status})
+                    except TokenValidationException as error:
+                        results[session_token] = error
+
+        return [results[session_token] for session_token in tokens]
+
+    def verify_stream(
+        self,
+        session_tokens: Iterable[str],
+        processes: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        max_pending_chunks: Optional[int] = None,
+        leeway: float = 0,
+    ) -> Iterator[Union[UserEntity, TokenValidationException]]:
+        """Verify a large stream of session tokens in a pool of worker processes, e.g. to audit archived tokens.
+
+        Tokens are read lazily, e.g. from an open file with one token per line (surrounding whitespace is
+        stripped), sent to the workers in chunks and the results are yielded in input order. At most
+        max_pending_chunks chunks are in flight, so memory stays bounded however many tokens are verified.
+
+        The workers are preloaded with the current JWKS and never contact the JWKS endpoint, tokens signed
+        with a key that is not in it are rejected. Only signature and claims are verified, the token cache,
+        the revocation filter and the user status cache are not used.
+
+        Args:
+            session_tokens (Iterable[str]): Session tokens, e.g. an open file.
+            processes (Optional[int], optional): Number of worker processes. Defaults to None (number of CPUs).
+            chunk_size (int): Number of tokens per task sent to a worker. Defaults to DEFAULT_STREAM_CHUNK_SIZE.
+            max_pending_chunks (Optional[int], optional): Maximum number of chunks in flight.
+                Defaults to None (DEFAULT_STREAM_PENDING_CHUNKS_PER_PROCESS per worker process).
+            leeway (float): Leeway in seconds for exp, nbf and iat, e.g. float("inf") to verify archived tokens
+                regardless of their expiry. Defaults to 0.
+
+        Raises:
+            ValueError: If processes, chunk_size or max_pending_chunks are not positive.
+
+        Returns:
+            Iterator[Union[UserEntity, TokenValidationException]]: Result for each token (in input order), either
+                the User Entity or the exception describing why the token is invalid.
+        """
+        if processes is not None and processes <= 0:
+            raise ValueError(f'Processes must be greater than 0, the input is "{processes}"')
+        if chunk_size <= 0:
+            raise ValueError(f'Chunk size must be greater than 0, the input is "{chunk_size}"')
+        if max_pending_chunks is None:
+            max_pending_chunks = DEFAULT_STREAM_PENDING_CHUNKS_PER_PROCESS * (processes or os.cpu_count() or 1)
+        elif max_pending_chunks <= 0:
+            raise ValueError(f'Max pending chunks must be greater than 0, the input is "{max_pending_chunks}"')
+
+        # fetched here once, workers get the JWKS passed instead of fetching it themselves
+        if self._jwks_cache.document is None:
+            self.warm_up()
+        settings: Dict[str, Any] = self._worker_settings()
+        settings["jwks"] = self._jwks_cache.document
+
+        return _stream_results(
+            settings=settings,
+            session_tokens=session_tokens,
+            processes=processes,
+            chunk_size=chunk_size,
+            max_pending_chunks=max_pending_chunks,
+            leeway=leeway,
+        )
+
+    def invalidate_token(self, session_token: StrictStr) -> None:
+        """Remove the given session token from the token cache, e.g. after logout.
+
+        Args:
+            session_token (StrictStr): jwt
+        """
+        if self._token_cache is not None:
+            self._token_cache.invalidate(self._token_digest(session_token=session_token))
+
+    def clear_token_cache(self) -> None:
+        """Remove all entries from the token cache."""
+        if self._token_cache is not None:
+            self._token_cache.clear()
+
+    def invalidate_user(self, user_id: StrictStr) -> None:
+        """Remove the cached status of the user, call it from user.updated and user.deleted webhook handlers.
+
+        Args:
+            user_id (StrictStr): User ID.
+        """
+        if self.user_status_cache is not None:
+            self.user_status_cache.invalidate(user_id=user_id)
+
+    # Private methods
+    def _get_signing_key(self, session_token: str, kid: str) -> jwt.PyJWK:
+        """Get signing key for the kid of the session token.
+
+        Args:
+            session_token (str): Session token.
+            kid (str): Key id.
+
+        Raises:
+            TokenValidationException: If no signing key could be retrieved.
+
+        Returns:
+            jwt.PyJWK: Signing key.
+        """
         try:
-            signing_key: jwt.PyJWK = self._jwk_client.get_signing_key_from_jwt(token=session_token)
+            return self._jwks_cache.get_signing_key(kid=kid)
         except Exception as error:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_SIGNING_KEY_ERROR,
-                message=f"Could not retrieve signing key: {session_token}. See  original_exception for further information: {str(error)}",
+                message="Could not retrieve signing key: {session_token}. See original_exception for further information: {error}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
                 original_exception=error,
             )
 
-        # decode short session (jwt) with signing key
+    def _verify_token(
+        self, session_token: str, token: ParsedToken, signing_key: jwt.PyJWK, token_digest: Optional[bytes], leeway: float = 0
+    ) -> ValidatedSession:
+        """Verify signature and claims of the session token.
+
+        Args:
+            session_token (str): Session token.
+            token (ParsedToken): Session token as parsed by _precheck_token().
+            signing_key (jwt.PyJWK): Signing key.
+            token_digest (Optional[bytes]): Digest of the session token, if the result should be cached.
+            leeway (float): Leeway in seconds for exp, nbf and iat. Defaults to 0.
+
+        Raises:
+            TokenValidationException: If token is invalid.
+
+        Returns:
+            ValidatedSession: Validated session.
+        """
+        # verify short session (jwt) with the verifier of the signing key
         try:
-            payload = decode(jwt=session_token, key=signing_key.key, algorithms=list(ALLOWED_ALGS))
+            payload: Any = self._get_verifier(kid=token.header["kid"], signing_key=signing_key).verify(token=token, leeway=leeway)
 
             # extract information from decoded payload
             token_issuer: str = payload.get("iss")
             sub: str = payload.get("sub")
             full_name: str = payload.get("name")
+            expires_at: Optional[int] = payload.get("exp")
         except ImmatureSignatureError as error:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_BEFORE,
-                message=f"Error occured during token decode: {session_token}. {ValidationErrorType.CODE_JWT_BEFORE.value}",
+                message="Error occured during token decode: {session_token}. {error_type}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
                 original_exception=error,
             )
         except ExpiredSignatureError as error:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_EXPIRED,
-                message=f"Error occured during token decode: {session_token}. {ValidationErrorType.CODE_JWT_EXPIRED.value}",
+                message="Error occured during token decode: {session_token}. {error_type}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
                 original_exception=error,
             )
 
         except InvalidSignatureError as error:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_INVALID_SIGNATURE,
-                message=f"Error occured during token decode: {session_token}. {ValidationErrorType.CODE_JWT_INVALID_SIGNATURE.value}",
+                message="Error occured during token decode: {session_token}. {error_type}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
                 original_exception=error,
             )
         except InvalidAlgorithmError as error:
@@ -127,16 +616,304 @@ class SessionService(BaseModel):
         except Exception as error:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_GENERAL,
-                message=f"Error occured during token decode: {session_token}. See  original_exception for further information: {str(error)}",
+                message="Error occured during token decode: {session_token}. See original_exception for further information: {error}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
                 original_exception=error,
             )
 
         # validate issuer
         self._validate_issuer(token_issuer=token_issuer, session_token=session_token)
-        # TODO: Retrieve user status
-        return UserEntity(fullName=full_name, userID=sub, status=UserStatus.ACTIVE)
+        # the actual user status is only known with a user status cache, see validate_session()
+        validated_session: ValidatedSession = ValidatedSession(
+            user_id=sub, full_name=full_name, status=UserStatus.ACTIVE, claims=payload
+        )
+
+        # cache result, but never beyond token expiry
+        if self._token_cache is not None and token_digest is not None and expires_at is not None:
+            ttl: float = expires_at - time()
+            if ttl > 0:
+                self._token_cache.put(token_digest, validated_session, ttl=min(ttl, self._token_cache.ttl))
+        return validated_session
+
+    def _verify_chunk(
+        self, chunk: List[Tuple[str, ParsedToken, Optional[bytes], jwt.PyJWK]]
+    ) -> List[Union[UserEntity, TokenValidationException]]:
+        """Verify a chunk of session tokens, see validate_tokens().
+
+        Args:
+            chunk (List[Tuple[str, ParsedToken, Optional[bytes], jwt.PyJWK]]): Session tokens with parsed token,
+                digest and signing key.
+
+        Returns:
+            List[Union[UserEntity, TokenValidationException]]: Result for each token.
+        """
+        results: List[Union[UserEntity, TokenValidationException]] = []
+        for session_token, token, token_digest, signing_key in chunk:
+            try:
+                validated_session: ValidatedSession = self._verify_token(
+                    session_token=session_token, token=token, signing_key=signing_key, token_digest=token_digest
+                )
+                results.append(self._to_user_entity(validated_session=validated_session, session_token=session_token))
+            except TokenValidationException as error:
+                results.append(error)
+        return results
+
+    def _to_user_entity(self, validated_session: ValidatedSession, session_token: str) -> UserEntity:
+        """Convert a validated session to a UserEntity.
+
+        Args:
+            validated_session (ValidatedSession): Validated session.
+            session_token (str): Session token.
+
+        Raises:
+            TokenValidationException: If the claims of the session token are no valid user (e.g. sub is missing).
+
+        Returns:
+            UserEntity: User Entity.
+        """
+        try:
+            return validated_session.to_user_entity()
+        except ValidationError as error:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_GENERAL,
+                message="Invalid user claims in session token: {session_token}. See original_exception for further information: {error}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+                original_exception=error,
+            )
+
+    def _verify_stream_chunk(self, session_tokens: List[str], leeway: float) -> List[Union[UserEntity, TokenValidationException]]:
+        """Verify signature and claims of a chunk of session tokens, see verify_stream().
+
+        Args:
+            session_tokens (List[str]): Session tokens.
+            leeway (float): Leeway in seconds for exp, nbf and iat.
+
+        Returns:
+            List[Union[UserEntity, TokenValidationException]]: Result for each token.
+        """
+        results: List[Union[UserEntity, TokenValidationException]] = []
+        for session_token in session_tokens:
+            try:
+                if not session_token:
+                    raise TokenValidationException(
+                        error_type=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN,
+                        message=ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN.name,
+                    )
+                token: ParsedToken = self._precheck_token(session_token=session_token)
+                signing_key: jwt.PyJWK = self._get_signing_key(session_token=session_token, kid=token.header["kid"])
+                validated_session: ValidatedSession = self._verify_token(
+                    session_token=session_token, token=token, signing_key=signing_key, token_digest=None, leeway=leeway
+                )
+                results.append(self._to_user_entity(validated_session=validated_session, session_token=session_token))
+            except TokenValidationException as error:
+                results.append(error)
+        return results
+
+    def _worker_settings(self) -> Dict[str, Any]:
+        """Get the fields a SessionService in a worker process is created with.
+
+        Returns:
+            Dict[str, Any]: Fields.
+        """
+        return self.model_dump(include={"issuer", "jwks_uri", "project_id", "extra_issuers", "omit_token_in_errors"})
+
+    def _get_verifier(self, kid: str, signing_key: jwt.PyJWK) -> TokenVerifier:
+        """Get the verifier of a signing key, building it on first use.
+
+        Verifiers are kept by kid and rebuilt once the JWKS cache replaced the key (e.g. after a refresh).
+
+        Args:
+            kid (str): Key id.
+            signing_key (jwt.PyJWK): Signing key.
+
+        Returns:
+            TokenVerifier: Verifier.
+        """
+        verifier: Optional[TokenVerifier] = self._verifiers.get(kid)
+        if verifier is None or verifier.signing_key is not signing_key:
+            verifier = TokenVerifier(signing_key=signing_key, algorithms=ALLOWED_ALGS)
+            self._verifiers[kid] = verifier
+        return verifier
+
+    @staticmethod
+    def _precheck_token(session_token: str) -> ParsedToken:
+        """Check structure, algorithm and required claims of a session token without verifying it.
+
+        This is cheap compared to key lookup and signature verification and rejects garbage tokens
+        without touching the JWKS cache.
+
+        Args:
+            session_token (str): Session token.
+
+        Raises:
+            TokenValidationException: If token is malformed.
+
+        Returns:
+            ParsedToken: Parsed (not yet verified) token, with a string kid in its header.
+        """
+        try:
+            token: ParsedToken = parse_token(token=session_token)
+        except DecodeError as error:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_GENERAL,
+                message="Malformed session token: {error}",
+                lazy=True,
+                original_exception=error,
+            )
+
+        if token.header.get("alg") not in ALLOWED_ALGS:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_INVALID_SIGNATURE,
+                message="Algorithm not allowed",
+                original_exception=InvalidAlgorithmError("The specified alg value is not allowed"),
+            )
+        if not token.signature:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_INVALID_SIGNATURE,
+                message="Session token has no signature",
+            )
+
+        kid = token.header.get("kid")
+        if not kid or not isinstance(kid, str):
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_SIGNING_KEY_ERROR,
+                message="Session token has no key id (kid)",
+            )
+
+        if "exp" not in token.payload:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_GENERAL,
+                message="Session token has no expiration time (exp)",
+                original_exception=MissingRequiredClaimError("exp"),
+            )
+        if not token.payload.get("iss"):
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_ISSUER_EMPTY,
+                message="Issuer is empty",
+            )
+        return token
+
+    def _verify_not_revoked(self, claims: Mapping[str, Any], session_token: str) -> None:
+        """Verify that the session of a session token has not been revoked.
+
+        Tokens without session id claim can not be checked and pass.
+
+        Args:
+            claims (Mapping[str, Any]): Claims of the session token.
+            session_token (str): Session token.
+
+        Raises:
+            TokenValidationException: If the session has been revoked.
+        """
+        if self.revocation_filter is None:
+            return
+        session_id: Any = claims.get(self.revocation_filter.session_id_claim)
+        if isinstance(session_id, str) and self.revocation_filter.is_revoked(session_id=session_id):
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_SESSION_REVOKED,
+                message="Session {session_id} has been revoked: {session_token}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+                message_args={"session_id": session_id},
+            )
+
+    def _get_user_status(self, user_id: str, session_token: str) -> UserStatus:
+        """Get status of the user of a session token from the user status cache.
+
+        Args:
+            user_id (str): User ID.
+            session_token (str): Session token.
+
+        Raises:
+            TokenValidationException: If the status could not be retrieved.
+
+        Returns:
+            UserStatus: Status of the user.
+        """
+        if self.user_status_cache is None:
+            return UserStatus.ACTIVE
+        try:
+            status: Optional[UserStatus] = self.user_status_cache.get_status(user_id=user_id)
+        except Exception as error:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_USER_STATUS_ERROR,
+                message="Could not retrieve status of user {user_id}. See original_exception for further information: {error}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+                original_exception=error,
+                message_args={"user_id": user_id},
+            )
+        return self._verify_user_status(status=status, session_token=session_token)
+
+    def _verify_user_status(self, status: Optional[UserStatus], session_token: str) -> UserStatus:
+        """Verify that the user of a session token exists and is not disabled.
+
+        Args:
+            status (Optional[UserStatus]): Status of the user, None if the user does not exist.
+            session_token (str): Session token.
+
+        Raises:
+            TokenValidationException: If the user does not exist or is disabled.
+
+        Returns:
+            UserStatus: Status of the user.
+        """
+        if status is None:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_USER_NOT_FOUND,
+                message="User of session token does not exist: {session_token}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+            )
+        if status == UserStatus.DISABLED:
+            raise TokenValidationException(
+                error_type=ValidationErrorType.CODE_JWT_USER_DISABLED,
+                message="User of session token is disabled: {session_token}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+            )
+        return status
+
+    def _lookup_token_cache(self, session_token: str) -> Tuple[Optional[bytes], Optional[ValidatedSession]]:
+        """Look up session token in token cache.
+
+        Args:
+            session_token (str): Session token.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[ValidatedSession]]: Digest of the session token (None, if the token cache
+                is disabled) and the cached validated session (None, if not cached).
+        """
+        if self._token_cache is None:
+            return None, None
+        token_digest: bytes = self._token_digest(session_token=session_token)
+        return token_digest, self._token_cache.get(token_digest)
+
+    def _error_session_token(self, session_token: str) -> Optional[str]:
+        """Get the session token to put into a TokenValidationException.
+
+        Args:
+            session_token (str): Session token.
+
+        Returns:
+            Optional[str]: Session token, None if omit_token_in_errors is set.
+        """
+        return None if self.omit_token_in_errors else session_token
+
+    @staticmethod
+    def _token_digest(session_token: str) -> bytes:
+        """Get digest of session token, used as key in token cache.
+
+        Args:
+            session_token (str): Session token.
+
+        Returns:
+            bytes: SHA-256 digest.
+        """
+        return hashlib.sha256(session_token.encode()).digest()
 
-    # Private methods
     def _validate_issuer(self, token_issuer: str, session_token: str) -> None:
         """Validate issuer.
 
@@ -151,22 +928,138 @@ class SessionService(BaseModel):
         if not token_issuer:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_ISSUER_EMPTY,
-                message=f"Issuer is empty. Session token: {session_token}"
+                message="Issuer is empty. Session token: {session_token}",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
             )
 
-        # Check for old Frontend API (without .cloud.)
-        expected_old: StrictStr = f"https://{self.project_id}.frontendapi.corbado.io"
-        if token_issuer == expected_old:
-            return
-
-        # Check for new Frontend API (with .cloud.)
-        expected_new: StrictStr = f"https://{self.project_id}.frontendapi.cloud.corbado.io"
-        if token_issuer == expected_new:
-            return
-
-        # Check against the configured issuer (e.g., a custom domain or CNAME)
-        if token_issuer != self.issuer:
+        # one hash lookup, the accepted issuers are precomputed (the type check guards against unhashable claims)
+        if not isinstance(token_issuer, str) or token_issuer not in self._accepted_issuers:
             raise TokenValidationException(
                 error_type=ValidationErrorType.CODE_JWT_ISSUER_MISSMATCH,
-                message=f"Issuer mismatch (configured via FrontendAPI: '{self.issuer}', JWT issuer: '{token_issuer}')",
+                message="Issuer mismatch (configured via FrontendAPI: '{issuer}', JWT issuer: '{token_issuer}')",
+                lazy=True,
+                session_token=self._error_session_token(session_token=session_token),
+                message_args={"issuer": self.issuer, "token_issuer": token_issuer},
             )
+
+
+# SessionService of a worker process of validate_tokens() and the settings it was created with,
+# created by _get_validation_worker() for the first chunk and reused for all further chunks
+_validation_worker: Optional[Tuple[Dict[str, Any], SessionService]] = None
+
+
+def _get_validation_worker(settings: Dict[str, Any]) -> SessionService:
+    """Get the SessionService of a worker process of validate_tokens(), creating it on first use.
+
+    The executor is passed in by the caller, so the service cannot be created by an initializer of the pool.
+    It is created once per worker process instead and only created again if the settings (e.g. the JWKS) changed.
+
+    Args:
+        settings (Dict[str, Any]): Fields of the calling SessionService, including the JWKS.
+
+    Returns:
+        SessionService: Session service of the worker process.
+    """
+    global _validation_worker
+    if _validation_worker is None or _validation_worker[0] != settings:
+        _validation_worker = (settings, SessionService(**settings))
+    return _validation_worker[1]
+
+
+def _verify_chunk_in_process(settings: Dict[str, Any], session_tokens: List[str]) -> List[Union[UserEntity, TokenValidationException]]:
+    """Validate a chunk of session tokens in a worker process, see SessionService.validate_tokens().
+
+    Args:
+        settings (Dict[str, Any]): Fields of the calling SessionService, including the JWKS.
+        session_tokens (List[str]): Session tokens.
+
+    Returns:
+        List[Union[UserEntity, TokenValidationException]]: Result for each token.
+    """
+    session_service: SessionService = _get_validation_worker(settings=settings)
+
+    results: List[Union[UserEntity, TokenValidationException]] = []
+    for session_token in session_tokens:
+        try:
+            results.append(session_service.validate_token(session_token=session_token))
+        except TokenValidationException as error:
+            results.append(error)
+    return results
+
+
+# SessionService of a worker process of verify_stream(), created once by _init_stream_worker()
+_stream_worker_session_service: Optional[SessionService] = None
+
+
+def _stream_results(
+    settings: Dict[str, Any],
+    session_tokens: Iterable[str],
+    processes: Optional[int],
+    chunk_size: int,
+    max_pending_chunks: int,
+    leeway: float,
+) -> Iterator[Union[UserEntity, TokenValidationException]]:
+    """Verify session tokens in a pool of worker processes and yield the results in order, see SessionService.verify_stream().
+
+    The pool is only started once the first result is requested and shut down when the iterator is exhausted or closed.
+
+    Args:
+        settings (Dict[str, Any]): Fields of the SessionService of the workers, including the JWKS.
+        session_tokens (Iterable[str]): Session tokens.
+        processes (Optional[int]): Number of worker processes.
+        chunk_size (int): Number of tokens per task.
+        max_pending_chunks (int): Maximum number of tasks in flight.
+        leeway (float): Leeway in seconds for exp, nbf and iat.
+
+    Yields:
+        Union[UserEntity, TokenValidationException]: Result for each token.
+    """
+    tokens: Iterator[str] = iter(session_tokens)
+    executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_stream_worker, initargs=(settings,))
+    pending: Deque["Future[List[Union[UserEntity, TokenValidationException]]]"] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_pending_chunks:
+                chunk: List[str] = [session_token.strip() for session_token in islice(tokens, chunk_size)]
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.append(executor.submit(_verify_stream_chunk_in_worker, chunk, leeway))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _init_stream_worker(settings: Dict[str, Any]) -> None:
+    """Create the SessionService of a worker process of verify_stream(), preloaded with the JWKS.
+
+    Args:
+        settings (Dict[str, Any]): Fields of the SessionService, including the JWKS.
+    """
+    global _stream_worker_session_service
+    _stream_worker_session_service = SessionService(**settings)
+    _stream_worker_session_service.warm_up()
+
+
+def _verify_stream_chunk_in_worker(session_tokens: List[str], leeway: float) -> List[Union[UserEntity, TokenValidationException]]:
+    """Verify a chunk of session tokens in a worker process of verify_stream().
+
+    Args:
+        session_tokens (List[str]): Session tokens.
+        leeway (float): Leeway in seconds for exp, nbf and iat.
+
+    Raises:
+        RuntimeError: If the worker process was not initialized.
+
+    Returns:
+        List[Union[UserEntity, TokenValidationException]]: Result for each token.
+    """
+    if _stream_worker_session_service is None:
+        raise RuntimeError("Worker process was not initialized")
+    return _stream_worker_session_service._verify_stream_chunk(session_tokens=session_tokens, leeway=leeway)
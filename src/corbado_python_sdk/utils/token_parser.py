@@ -0,0 +1,99 @@
+import base64
+import json
+import re
+from typing import Any, Dict, NamedTuple
+
+from jwt import DecodeError
+
+_BASE64URL_SEGMENT = re.compile(r"[A-Za-z0-9_-]*")
+
+
+class ParsedToken(NamedTuple):
+    """Structurally parsed, but not yet verified, JWT.
+
+    Attributes:
+        header (Dict[str, Any]): Decoded JOSE header.
+        payload (Dict[str, Any]): Decoded claims.
+        signing_input (bytes): Signed part of the token (header and payload segment).
+        signature (bytes): Decoded signature.
+    """
+
+    header: Dict[str, Any]
+    payload: Dict[str, Any]
+    signing_input: bytes
+    signature: bytes
+
+
+def parse_token(token: str) -> ParsedToken:
+    """Parse a JWT in compact serialization without verifying it.
+
+    Only checks the structure: three base64url encoded segments of which header and
+    payload are JSON objects.
+
+    Args:
+        token (str): JWT.
+
+    Raises:
+        DecodeError: If the token is malformed.
+
+    Returns:
+        ParsedToken: Parsed token.
+    """
+    segments = token.split(".")
+    if len(segments) < 3:
+        raise DecodeError("Not enough segments")
+    if len(segments) > 3:
+        raise DecodeError("Too many segments")
+
+    header_segment, payload_segment, signature_segment = segments
+    return ParsedToken(
+        header=_decode_json_segment(segment=header_segment, name="header"),
+        payload=_decode_json_segment(segment=payload_segment, name="payload"),
+        signing_input=f"{header_segment}.{payload_segment}".encode(),
+        signature=_decode_segment(segment=signature_segment, name="crypto"),
+    )
+
+
+def _decode_segment(segment: str, name: str) -> bytes:
+    """Decode a base64url encoded token segment.
+
+    Args:
+        segment (str): Segment.
+        name (str): Name of the segment, used in error messages.
+
+    Raises:
+        DecodeError: If the segment is not base64url encoded.
+
+    Returns:
+        bytes: Decoded segment.
+    """
+    if not _BASE64URL_SEGMENT.fullmatch(segment):
+        raise DecodeError(f"Invalid {name} padding")
+    try:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    except ValueError as error:
+        raise DecodeError(f"Invalid {name} padding") from error
+
+
+def _decode_json_segment(segment: str, name: str) -> Dict[str, Any]:
+    """Decode a base64url encoded token segment containing a JSON object.
+
+    Args:
+        segment (str): Segment.
+        name (str): Name of the segment, used in error messages.
+
+    Raises:
+        DecodeError: If the segment does not contain a JSON object.
+
+    Returns:
+        Dict[str, Any]: Decoded JSON object.
+    """
+    if not segment:
+        raise DecodeError(f"Invalid {name} padding")
+    try:
+        decoded: Any = json.loads(_decode_segment(segment=segment, name=name))
+    except ValueError as error:
+        raise DecodeError(f"Invalid {name} string: {error}") from error
+    if not isinstance(decoded, dict):
+        raise DecodeError(f"Invalid {name} string: must be a json object")
+    return decoded
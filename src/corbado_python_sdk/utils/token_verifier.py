@@ -0,0 +1,97 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from jwt import (
+    DecodeError,
+    InvalidAlgorithmError,
+    InvalidSignatureError,
+    PyJWK,
+    PyJWT,
+)
+from jwt.algorithms import Algorithm, get_default_algorithms
+
+from .token_parser import ParsedToken
+
+# validates claims with the default options of decode(), its _validate_claims() is not public API,
+# so setup.py pins the PyJWT versions it is tested with
+_CLAIMS_VALIDATOR = PyJWT()
+
+
+class TokenVerifier:
+    """Ready-to-use verifier for JWTs signed with one signing key.
+
+    Built once per key: the public key is prepared for each allowed algorithm up front, so
+    verifying an already parsed token is one signature check followed by the claim checks
+    PyJWT's decode() does with its default options (iat, nbf, exp, aud, sub, jti).
+
+    Attributes:
+        signing_key (PyJWK): Signing key the verifier was built for.
+    """
+
+    __slots__ = ("signing_key", "_algorithms")
+
+    def __init__(self, signing_key: PyJWK, algorithms: Iterable[str]) -> None:
+        """Initialize a new instance of the TokenVerifier class.
+
+        Args:
+            signing_key (PyJWK): Signing key.
+            algorithms (Iterable[str]): Allowed algorithms.
+
+        Raises:
+            InvalidAlgorithmError: If an algorithm is not supported.
+        """
+        default_algorithms: Dict[str, Algorithm] = get_default_algorithms()
+        self.signing_key: PyJWK = signing_key
+        self._algorithms: Dict[str, Tuple[Algorithm, Any]] = {}
+        for name in algorithms:
+            algorithm: Optional[Algorithm] = default_algorithms.get(name)
+            if algorithm is None:
+                raise InvalidAlgorithmError(f"Algorithm not supported: {name}")
+            self._algorithms[name] = (algorithm, algorithm.prepare_key(signing_key.key))
+
+    def verify(self, token: ParsedToken, leeway: float = 0) -> Dict[str, Any]:
+        """Verify signature and registered claims of a parsed token.
+
+        Raises the same exceptions as PyJWT's decode().
+
+        Args:
+            token (ParsedToken): Parsed token.
+            leeway (float): Leeway in seconds for the time based claims. Defaults to 0.
+
+        Raises:
+            DecodeError: If the token uses a detached payload.
+            InvalidAlgorithmError: If the algorithm of the token is not allowed.
+            InvalidSignatureError: If the signature is invalid.
+
+        Returns:
+            Dict[str, Any]: Claims of the token.
+        """
+        if token.header.get("b64", True) is False:
+            raise DecodeError("Tokens with detached payload are not supported")
+        name: Any = token.header.get("alg")
+        prepared: Optional[Tuple[Algorithm, Any]] = self._algorithms.get(name) if isinstance(name, str) else None
+        if prepared is None:
+            raise InvalidAlgorithmError("The specified alg value is not allowed")
+
+        algorithm, key = prepared
+        if not algorithm.verify(token.signing_input, key, token.signature):
+            raise InvalidSignatureError("Signature verification failed")
+        verify_claims(payload=token.payload, leeway=leeway)
+        return token.payload
+
+
+def verify_claims(payload: Dict[str, Any], leeway: float = 0) -> None:
+    """Verify the registered claims of a token like PyJWT's decode() with default options.
+
+    Delegates to the claim validation of the installed PyJWT version, so the rules (e.g. whether sub and jti
+    must be strings) always match its decode().
+
+    Args:
+        payload (Dict[str, Any]): Claims.
+        leeway (float): Leeway in seconds for the time based claims. Defaults to 0.
+
+    Raises:
+        InvalidTokenError: If a claim is invalid (e.g. ExpiredSignatureError if exp is in the past).
+
+    # noqa: DAR402 InvalidTokenError
+    """
+    _CLAIMS_VALIDATOR._validate_claims(payload, options=_CLAIMS_VALIDATOR.options, leeway=leeway)
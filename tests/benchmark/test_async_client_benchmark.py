@@ -0,0 +1,87 @@
+# type: ignore
+import asyncio
+import os
+import threading
+import unittest
+from time import perf_counter
+
+from aiohttp import web
+
+from corbado_python_sdk import AsyncUserService, UserService
+from corbado_python_sdk.aio import AsyncApiClient, AsyncUsersApi
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.api_client import ApiClient
+from corbado_python_sdk.generated.configuration import Configuration
+from tests.benchmark.utils import ITERATIONS, benchmark
+
+LATENCY: float = float(os.getenv("CORBADO_BENCHMARK_BACKEND_LATENCY", "0.02"))
+
+
+class _SlowBackendStub:
+    """Backend API stub answering user requests after a fixed latency, on its own event loop thread."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self._loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_get("/users/{user_id}", self.get_user)
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        self.host = f"http://127.0.0.1:{self._runner.addresses[0][1]}"
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        return web.json_response(
+            {"userID": request.match_info["user_id"], "status": "active", "updated": "2024-01-01", "updatedMs": 1}
+        )
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@benchmark
+class TestAsyncClientBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = _SlowBackendStub(latency=LATENCY)
+        self.configuration = Configuration(host=self.stub.host, username="pro-1", password="secret")
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+
+    def test_requests_in_flight(self):
+        sync_service = UserService(client=UsersApi(api_client=ApiClient(configuration=self.configuration)))
+        sync_count = max(10, int(0.5 / LATENCY))
+        started = perf_counter()
+        for i in range(sync_count):
+            sync_service.get(user_id=f"usr-{i}")
+        sync_rate = sync_count / (perf_counter() - started)
+        print(f"UserService.get (sequential, {LATENCY * 1e3:.0f} ms latency): {sync_rate:,.0f} requests/s")
+
+        async def run_async(in_flight: int) -> float:
+            async with AsyncApiClient(configuration=self.configuration, max_connections=in_flight) as api_client:
+                service = AsyncUserService(client=AsyncUsersApi(api_client=api_client))
+                count = max(in_flight, ITERATIONS // 4)
+                started = perf_counter()
+                users = await asyncio.gather(*(service.get(user_id=f"usr-{i}") for i in range(count)))
+                self.assertEqual(count, len(users))
+                return count / (perf_counter() - started)
+
+        async_rates = {}
+        for in_flight in (10, 100, 200):
+            async_rates[in_flight] = asyncio.run(run_async(in_flight))
+            print(f"AsyncUserService.get ({in_flight} in flight, {LATENCY * 1e3:.0f} ms latency): {async_rates[in_flight]:,.0f} requests/s")
+
+        # with a slow backend the throughput of one event loop grows with the number of requests in flight
+        self.assertGreater(async_rates[10], sync_rate * 2)
+        self.assertGreater(async_rates[100], async_rates[10])
+
+
+if __name__ == "__main__":
+    unittest.main()
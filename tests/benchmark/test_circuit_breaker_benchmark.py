@@ -0,0 +1,40 @@
+# type: ignore
+import unittest
+
+from corbado_python_sdk import CircuitOpenException
+from corbado_python_sdk.resilience import CircuitBreaker
+from tests.benchmark.utils import benchmark, run_benchmark, run_threaded_benchmark
+
+KEY = "backendapi.cloud.corbado.io GET /users/{userID}"
+
+
+@benchmark
+class TestCircuitBreakerBenchmark(unittest.TestCase):
+    def test_overhead(self):
+        breaker = CircuitBreaker()
+
+        def closed_call(_i):
+            breaker.acquire(KEY)
+            breaker.record(KEY, True)
+
+        closed = run_benchmark("CircuitBreaker acquire + record (closed)", closed_call)
+        run_threaded_benchmark("CircuitBreaker acquire + record (closed)", closed_call, threads=4)
+
+        open_breaker = CircuitBreaker(failure_threshold=1)
+        open_breaker.acquire(KEY)
+        open_breaker.record(KEY, False)
+
+        def rejected_call(_i):
+            try:
+                open_breaker.acquire(KEY)
+            except CircuitOpenException:
+                pass
+
+        # an open circuit answers in microseconds instead of after a request timeout
+        rejected = run_benchmark("CircuitBreaker acquire (open, fail fast)", rejected_call)
+        self.assertLess(closed.p50_us, 100)
+        self.assertLess(rejected.p50_us, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+# type: ignore
+import unittest
+
+from corbado_python_sdk.resilience import AdaptiveConcurrencyLimiter
+from tests.benchmark.utils import benchmark, run_benchmark, run_threaded_benchmark
+
+
+@benchmark
+class TestConcurrencyLimiterBenchmark(unittest.TestCase):
+    def test_overhead(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=100, max_limit=100)
+
+        def request(_i):
+            limiter.release(limiter.acquire(), True)
+
+        uncontended = run_benchmark("AdaptiveConcurrencyLimiter acquire + release", request)
+        run_threaded_benchmark("AdaptiveConcurrencyLimiter acquire + release", request, threads=4)
+
+        self.assertLess(uncontended.p50_us, 100)
+        self.assertEqual(0, limiter.snapshot.in_flight)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# type: ignore
+import asyncio
+from time import time
+
+from corbado_python_sdk import SessionService
+from corbado_python_sdk.middleware import (
+    SESSION_KEY,
+    CorbadoASGIMiddleware,
+    CorbadoWSGIMiddleware,
+)
+from tests.benchmark.utils import benchmark, run_benchmark
+from tests.unit.test_session_service import TestBase
+
+
+def _wsgi_app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"OK"]
+
+
+async def _asgi_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"OK"})
+
+
+@benchmark
+class TestMiddlewareBenchmark(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.session_service = self.create_session_service()
+        self.jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+    def test_wsgi_throughput(self):
+        middleware = CorbadoWSGIMiddleware(_wsgi_app, self.session_service, required=True)
+        cookie = f"theme=dark; cbo_session_token={self.jwt}"
+
+        def start_response(status, headers):
+            pass
+
+        bare_result = run_benchmark("WSGI (bare app)", lambda _i: _wsgi_app({"HTTP_COOKIE": cookie}, start_response))
+        wrapped_result = run_benchmark("WSGI (middleware)", lambda _i: middleware({"HTTP_COOKIE": cookie}, start_response))
+        cached_middleware = CorbadoWSGIMiddleware(
+            _wsgi_app,
+            SessionService(issuer="https://auth.acme.com", jwks_uri="https://example_uri.com", project_id="pro-55", token_cache_size=100),
+            required=True,
+        )
+        cached_result = run_benchmark("WSGI (middleware, token cache)", lambda _i: cached_middleware({"HTTP_COOKIE": cookie}, start_response))
+
+        environ = {"HTTP_COOKIE": cookie}
+        middleware(environ, start_response)
+        self.assertIsNotNone(environ[SESSION_KEY])
+        self.assertGreater(bare_result.ops_per_sec, wrapped_result.ops_per_sec)
+        self.assertGreater(cached_result.ops_per_sec, wrapped_result.ops_per_sec)
+        # each middleware fetches the JWKS once, no request waits for the network afterwards
+        self.assertEqual(2, self.mock_urlopen.call_count)
+
+    def test_asgi_throughput(self):
+        middleware = CorbadoASGIMiddleware(_asgi_app, self.session_service, required=True)
+        headers = [(b"host", b"example.com"), (b"cookie", f"theme=dark; cbo_session_token={self.jwt}".encode())]
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            pass
+
+        # a single event loop for all requests, so the loop setup is not measured
+        loop = asyncio.new_event_loop()
+        try:
+            bare_result = run_benchmark(
+                "ASGI (bare app)", lambda _i: loop.run_until_complete(_asgi_app({"type": "http", "headers": headers}, receive, send))
+            )
+            wrapped_result = run_benchmark(
+                "ASGI (middleware)", lambda _i: loop.run_until_complete(middleware({"type": "http", "headers": headers}, receive, send))
+            )
+        finally:
+            loop.close()
+
+        self.assertGreater(bare_result.ops_per_sec, wrapped_result.ops_per_sec)
+        self.assertEqual(1, self.mock_urlopen.call_count)
@@ -0,0 +1,26 @@
+# type: ignore
+import unittest
+
+from corbado_python_sdk.resilience import RateLimit, RateLimiter
+from tests.benchmark.utils import benchmark, run_benchmark, run_threaded_benchmark
+
+
+@benchmark
+class TestRateLimiterBenchmark(unittest.TestCase):
+    def test_overhead(self):
+        # a rate that is never reached, so only the bookkeeping is measured
+        limiter = RateLimiter(limits={"read": RateLimit(rate=1e9)})
+
+        def reserve(_i):
+            limiter.reserve("GET /users/{userID}", "GET")
+
+        limited = run_benchmark("RateLimiter reserve (token available)", reserve)
+        run_threaded_benchmark("RateLimiter reserve (token available)", reserve, threads=4)
+        unlimited = run_benchmark("RateLimiter reserve (unlimited group)", lambda _i: limiter.reserve("POST /users", "POST"))
+
+        self.assertLess(limited.p50_us, 100)
+        self.assertLess(unlimited.p50_us, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+# type: ignore
+import unittest
+from collections import Counter
+from time import monotonic
+
+from corbado_python_sdk.resilience import RetryPolicy
+from tests.benchmark.utils import benchmark, run_benchmark
+
+
+@benchmark
+class TestRetryBenchmark(unittest.TestCase):
+    def test_retry_spread(self):
+        """1000 workers rate limited at the same moment: peak number of retries arriving within 10 ms."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+        workers = 1000
+
+        for retry in (1, 2, 3):
+            jittered = Counter(int(policy.backoff(retry) * 100) for _i in range(workers))
+            print(f"retry {retry}: peak of {max(jittered.values())} retries per 10 ms with full jitter, {workers} without jitter")
+            self.assertLess(max(jittered.values()), workers / 5)
+
+    def test_next_delay_overhead(self):
+        policy = RetryPolicy()
+        started = monotonic()
+
+        result = run_benchmark("RetryPolicy.next_delay (success)", lambda _i: policy.next_delay("GET /users/{userID}", "GET", 1, started, status=200))
+        run_benchmark("RetryPolicy.next_delay (retry)", lambda _i: policy.next_delay("GET /users/{userID}", "GET", 1, started, status=503))
+
+        # negligible next to a network round trip
+        self.assertLess(result.p50_us, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+# type: ignore
+import asyncio
+import base64
+import json
+import os
+import random
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import monotonic, perf_counter, sleep, time
+
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt import decode, encode
+
+from corbado_python_sdk import (
+    SessionService,
+    TokenValidationException,
+    UserEntity,
+    UserStatus,
+    ValidatedSession,
+)
+from corbado_python_sdk.utils.token_parser import parse_token
+from corbado_python_sdk.utils.token_verifier import TokenVerifier
+from tests.benchmark.utils import (
+    ITERATIONS,
+    benchmark,
+    measure_allocation,
+    run_benchmark,
+    run_threaded_benchmark,
+)
+from tests.unit.test_session_service import TestBase
+
+
+def _segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+@benchmark
+class TestSessionServiceBenchmark(TestBase):
+    def _generate_jwts(self, count: int):
+        """Generate distinct valid tokens, loading the private key only once."""
+        private_key = load_pem_private_key(self.private_key, password=None)
+        now = int(time())
+        return [
+            encode(
+                {"iss": "https://auth.acme.com", "iat": now, "exp": now + 100, "nbf": now - 100, "sub": f"usr-{i}", "name": "Test"},
+                key=private_key,
+                algorithm="RS256",
+                headers={"kid": "kid123"},
+            )
+            for i in range(count)
+        ]
+
+    def _provide_garbage_tokens(self, count: int):
+        """Provide a flood of garbage tokens as seen in credential stuffing or bot traffic."""
+        valid: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        _header, payload, signature = valid.split(".")
+        tokens = []
+        for i in range(count):
+            kind = i % 5
+            if kind == 0:
+                tokens.append("".join(random.choices(string.ascii_letters, k=200)))
+            elif kind == 1:
+                tokens.append(f"{_segment({'alg': 'HS256', 'kid': 'kid123'})}.{payload}.{signature}")
+            elif kind == 2:
+                tokens.append(f"{_segment({'alg': 'RS256'})}.{payload}.{signature}")
+            elif kind == 3:
+                tokens.append(f"{_segment({'alg': 'RS256', 'kid': 'kid123'})}.{payload}!.{signature}")
+            else:
+                tokens.append(f"{_segment({'alg': 'RS256', 'kid': f'random-{i}'})}.{payload}.{signature}")
+        return tokens
+
+    def test_garbage_token_flood(self):
+        session_service: SessionService = self.create_session_service()
+        valid: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        garbage = self._provide_garbage_tokens(count=1000)
+
+        valid_result = run_benchmark("validate_token (valid)", lambda _i: session_service.validate_token(valid))
+        garbage_result = run_benchmark(
+            "validate_token (garbage flood)", lambda i: session_service.validate_token(garbage[i % len(garbage)])
+        )
+
+        # the only fetch is the initial one, garbage never reaches the JWKS endpoint
+        self.assertEqual(1, self.mock_urlopen.call_count)
+        self.assertGreater(garbage_result.ops_per_sec, valid_result.ops_per_sec)
+
+    def test_rejection_path(self):
+        session_service: SessionService = self.create_session_service()
+        redacting_service: SessionService = SessionService(
+            issuer="https://auth.acme.com", jwks_uri="https://example_uri.com", project_id="pro-55", omit_token_in_errors=True
+        )
+        expired: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) - 100, nbf=int(time()) - 100)
+        garbage = self._provide_garbage_tokens(count=1000)
+
+        run_benchmark("validate_token (expired)", lambda _i: session_service.validate_token(expired))
+        run_benchmark("validate_token (expired, omit token)", lambda _i: redacting_service.validate_token(expired))
+        run_benchmark("validate_token (garbage)", lambda i: session_service.validate_token(garbage[i % len(garbage)]))
+
+        def reject_and_format(i):
+            try:
+                session_service.validate_token(garbage[i % len(garbage)])
+            except TokenValidationException as error:
+                return error.message
+
+        run_benchmark("validate_token (garbage, message formatted)", reject_and_format)
+
+    def test_result_types(self):
+        claims = {"iss": "https://auth.acme.com", "sub": "usr-1", "name": "Test", "exp": int(time()) + 100}
+
+        def create_user_entity(_i):
+            return UserEntity(userID="usr-1", fullName="Test", status=UserStatus.ACTIVE)
+
+        def create_validated_session(_i):
+            return ValidatedSession(user_id="usr-1", full_name="Test", status=UserStatus.ACTIVE, claims=claims)
+
+        entity = run_benchmark("UserEntity (create)", create_user_entity)
+        session = run_benchmark("ValidatedSession (create)", create_validated_session)
+        entity_bytes = measure_allocation("UserEntity (allocation)", create_user_entity)
+        session_bytes = measure_allocation("ValidatedSession (allocation)", create_validated_session)
+
+        self.assertLess(session.p50_us, entity.p50_us)
+        self.assertLess(session_bytes, entity_bytes)
+
+        session_service: SessionService = self.create_session_service()
+        tokens = self._generate_jwts(count=ITERATIONS // 4)
+        run_benchmark("validate_token", lambda i: session_service.validate_token(tokens[i % len(tokens)]), len(tokens))
+        run_benchmark("validate_session", lambda i: session_service.validate_session(tokens[i % len(tokens)]), len(tokens))
+
+    def test_validate_issuer(self):
+        session_service: SessionService = SessionService(
+            issuer="https://auth.acme.com",
+            jwks_uri="https://example_uri.com",
+            project_id="pro-55",
+            extra_issuers=[f"https://login-{i}.acme.com" for i in range(100)],
+        )
+
+        accepted = run_benchmark(
+            "_validate_issuer (accepted)", lambda _i: session_service._validate_issuer("https://login-99.acme.com", "token")
+        )
+        run_benchmark("_validate_issuer (mismatch)", lambda _i: session_service._validate_issuer("https://invalid.com", "token"))
+
+        # one hash lookup, independent of the number of accepted issuers and without any string building
+        self.assertLess(accepted.p50_us, 50)
+
+    def test_prebuilt_verifier(self):
+        session_service: SessionService = self.create_session_service()
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        signing_key = session_service.jwks_cache.get_signing_key("kid123")
+        verifier = TokenVerifier(signing_key=signing_key, algorithms=["RS256"])
+        parsed = parse_token(token)
+
+        decode_result = run_benchmark("jwt.decode (per-call key handling)", lambda _i: decode(token, key=signing_key.key, algorithms=["RS256"]))
+        run_benchmark("TokenVerifier.verify (incl. parsing)", lambda _i: verifier.verify(parse_token(token)))
+        # validate_session() parses the token once in the precheck and verifies the parsed token
+        verifier_result = run_benchmark("TokenVerifier.verify (pre-parsed)", lambda _i: verifier.verify(parsed))
+        run_benchmark("validate_session", lambda _i: session_service.validate_session(token))
+
+        self.assertEqual(decode(token, key=signing_key.key, algorithms=["RS256"]), verifier.verify(parsed))
+        self.assertGreater(verifier_result.ops_per_sec, decode_result.ops_per_sec)
+
+    def test_concurrent_key_lookup(self):
+        session_service: SessionService = self.create_session_service()
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        session_service.warm_up()
+        jwks_cache = session_service.jwks_cache
+
+        lookups = {
+            threads: run_threaded_benchmark("get_signing_key", lambda _i: jwks_cache.get_signing_key("kid123"), threads=threads)
+            for threads in (1, 2, 4, 8)
+        }
+        for threads in (1, 4):
+            run_threaded_benchmark("validate_session", lambda _i: session_service.validate_session(token), threads=threads)
+
+        # in the refresh window, while the background refresh is already started (and retried only after min_refresh_interval)
+        jwks_cache._background_refresh_at = monotonic()
+        jwks_cache._snapshot = jwks_cache._snapshot._replace(fetched_at=monotonic() - (jwks_cache.lifespan - jwks_cache.refresh_ahead))
+        window_lookups = {
+            threads: run_threaded_benchmark(
+                "get_signing_key in refresh window", lambda _i: jwks_cache.get_signing_key("kid123"), threads=threads
+            )
+            for threads in (1, 2, 4, 8)
+        }
+
+        for name, results in (("get_signing_key", lookups), ("get_signing_key in refresh window", window_lookups)):
+            for threads in (2, 4, 8):
+                scaling: float = results[threads].ops_per_sec / (threads * results[1].ops_per_sec)
+                print(f"{name} ({threads} threads): {scaling:.0%} of linear scaling")
+
+            # lookups take no lock, so free-threaded builds scale (almost) linearly up to the number of cores
+            if not getattr(sys, "_is_gil_enabled", lambda: True)() and (os.cpu_count() or 1) >= 4:
+                self.assertGreater(results[4].ops_per_sec, 4 * results[1].ops_per_sec * 0.7)
+            else:
+                # with the GIL only one thread runs at a time, the total throughput stays flat instead of collapsing
+                self.assertGreater(results[8].ops_per_sec, results[1].ops_per_sec * 0.5)
+        self.assertEqual(1, self.mock_urlopen.call_count)
+
+    def test_validate_tokens_batch(self):
+        session_service: SessionService = self.create_session_service()
+        tokens = self._generate_jwts(count=ITERATIONS // 2)
+
+        def validate_batch(executor=None):
+            started = perf_counter()
+            results = session_service.validate_tokens(session_tokens=tokens, executor=executor)
+            seconds = perf_counter() - started
+            self.assertTrue(all(isinstance(result, UserEntity) for result in results))
+            return len(tokens) / seconds
+
+        print(f"validate_tokens (sequential): {validate_batch():,.0f} tokens/s")
+        for workers in sorted({2, os.cpu_count() or 1}):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                print(f"validate_tokens ({workers} processes): {validate_batch(executor):,.0f} tokens/s")
+
+    def test_verify_stream(self):
+        session_service: SessionService = self.create_session_service()
+        tokens = self._generate_jwts(count=ITERATIONS)
+
+        started = perf_counter()
+        for token in tokens:
+            session_service.validate_token(token)
+        print(f"validate_token loop: {len(tokens) / (perf_counter() - started):,.0f} tokens/s")
+
+        # throughput should grow with the number of processes up to the number of cores
+        for processes in sorted({1, 2, os.cpu_count() or 1}):
+            started = perf_counter()
+            verified = sum(
+                isinstance(result, UserEntity) for result in session_service.verify_stream(session_tokens=iter(tokens), processes=processes)
+            )
+            print(f"verify_stream ({processes} processes): {len(tokens) / (perf_counter() - started):,.0f} tokens/s")
+            self.assertEqual(len(tokens), verified)
+
+    def test_event_loop_lag_on_cold_jwks_fetch(self):
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        def slow_fetch(*_args, **_kwargs):
+            sleep(0.2)
+            return self.mock_response
+
+        self.mock_urlopen.side_effect = slow_fetch
+
+        async def measure_max_lag(validate) -> float:
+            """Run validations next to a 1ms ticker and return the largest delay of a tick."""
+            max_lag = 0.0
+            stop = asyncio.Event()
+
+            async def ticker():
+                nonlocal max_lag
+                while not stop.is_set():
+                    started = perf_counter()
+                    await asyncio.sleep(0.001)
+                    max_lag = max(max_lag, perf_counter() - started - 0.001)
+
+            ticker_task = asyncio.create_task(ticker())
+            await asyncio.sleep(0.01)
+            await asyncio.gather(*(validate() for _i in range(ITERATIONS // 20)))
+            stop.set()
+            await ticker_task
+            return max_lag  # noqa: R504
+
+        sync_service: SessionService = self.create_session_service()
+        async_service: SessionService = self.create_session_service()
+
+        async def validate_sync():
+            sync_service.validate_token(session_token=token)
+
+        async def validate_async():
+            await async_service.avalidate_token(session_token=token)
+
+        sync_lag = asyncio.run(measure_max_lag(validate_sync))
+        async_lag = asyncio.run(measure_max_lag(validate_async))
+        print(f"event loop lag on cold JWKS fetch: validate_token {sync_lag * 1e3:.1f} ms, avalidate_token {async_lag * 1e3:.1f} ms")
+
+        self.assertGreaterEqual(sync_lag, 0.2)
+        self.assertLess(async_lag, sync_lag)
@@ -0,0 +1,197 @@
+# type: ignore
+import base64
+import json
+import os
+import random
+import string
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt import encode
+from jwt.algorithms import RSAAlgorithm
+
+from corbado_python_sdk import SessionService, TokenValidationException
+from corbado_python_sdk.exceptions import ValidationErrorType
+from tests.benchmark.utils import (
+    BASELINE_PATH,
+    ITERATIONS,
+    OUTPUT_PATH,
+    benchmark,
+    find_regressions,
+    load_results,
+    run_threaded_benchmark,
+    save_results,
+)
+
+MAX_THREADS: int = int(os.getenv("CORBADO_BENCHMARK_MAX_THREADS", "4"))
+SUITE = "session_validation"
+
+
+class _JWKSStub:
+    """Local HTTP server serving a JWKS document, counting the requests."""
+
+    def __init__(self, document: dict) -> None:
+        self.document = document
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                stub.requests += 1
+                body = json.dumps(stub.document).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.uri = f"http://127.0.0.1:{self._server.server_address[1]}/.well-known/jwks"
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+@benchmark
+class TestValidationSuiteBenchmark(unittest.TestCase):
+    """validate_token() against a JWKS served over HTTP, for valid, expired, garbage and key rotation traffic.
+
+    Set CORBADO_BENCHMARK_MAX_THREADS to change the maximum number of threads, CORBADO_BENCHMARK_OUTPUT to
+    change where the results are saved and CORBADO_BENCHMARK_BASELINE to compare against a previous run.
+    """
+
+    results = []
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        test_data: str = os.path.join(os.path.dirname(__file__), "..", "unit", "test_data")
+        with open(os.path.join(test_data, "jwks.json"), encoding="utf-8") as jwks_file:
+            cls.jwks = json.load(jwks_file)
+        with open(os.path.join(test_data, "privateKey.pem"), mode="rb") as private_key_file:
+            cls.private_key = load_pem_private_key(private_key_file.read(), password=None)
+
+        # key added by the rotation, the JWKS then holds the old and the new key
+        cls.rotated_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        rotated_jwk = json.loads(RSAAlgorithm.to_jwk(cls.rotated_private_key.public_key()))
+        rotated_jwk.update({"kid": "kid-rotated", "use": "sig", "alg": "RS256"})
+        cls.rotated_jwks = {"keys": cls.jwks["keys"] + [rotated_jwk]}
+
+        cls.stub = _JWKSStub(document=cls.jwks)
+        cls.thread_counts = sorted({1, MAX_THREADS} | {2**i for i in range(1, MAX_THREADS.bit_length()) if 2**i < MAX_THREADS})
+        cls.results = []
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+        baseline = load_results(BASELINE_PATH)
+        save_results(OUTPUT_PATH, SUITE, cls.results)
+        for regression in find_regressions(baseline, SUITE, cls.results):
+            print(f"REGRESSION {regression}")
+
+    def setUp(self) -> None:
+        self.stub.document = self.jwks
+        self.stub.requests = 0
+
+    def _create_session_service(self, **kwargs) -> SessionService:
+        session_service = SessionService(issuer="https://auth.acme.com", jwks_uri=self.stub.uri, project_id="pro-55", **kwargs)
+        session_service.warm_up()
+        return session_service
+
+    def _generate_jwts(self, count: int, exp_offset: int = 100, private_key=None, kid: str = "kid123"):
+        now = int(time())
+        return [
+            encode(
+                {"iss": "https://auth.acme.com", "iat": now, "exp": now + exp_offset, "nbf": now - 200, "sub": f"usr-{i}", "name": "Test"},
+                key=private_key or self.private_key,
+                algorithm="RS256",
+                headers={"kid": kid},
+            )
+            for i in range(count)
+        ]
+
+    def _run(self, case: str, tokens, session_service_factory=None):
+        """Run validate_token() over the tokens for each thread count, a new SessionService per run."""
+        results = {}
+        for threads in self.thread_counts:
+            session_service = (session_service_factory or self._create_session_service)()
+            result = run_threaded_benchmark(
+                f"validate_token ({case})",
+                lambda i, session_service=session_service: session_service.validate_token(tokens[i % len(tokens)]),
+                threads=threads,
+                iterations=max(1, ITERATIONS // threads),
+            )
+            self.results.append(result)
+            results[threads] = result
+        return results
+
+    def test_valid_tokens(self):
+        tokens = self._generate_jwts(count=200)
+        self.assertEqual("usr-0", self._create_session_service().validate_token(tokens[0]).user_id)
+        self.stub.requests = 0
+
+        self._run("valid", tokens)
+
+        # one fetch per SessionService, no request waits for the JWKS endpoint afterwards
+        self.assertEqual(len(self.thread_counts), self.stub.requests)
+
+    def test_expired_tokens(self):
+        tokens = self._generate_jwts(count=200, exp_offset=-100)
+        with self.assertRaises(TokenValidationException) as context:
+            self._create_session_service().validate_token(tokens[0])
+        self.assertEqual(ValidationErrorType.CODE_JWT_EXPIRED, context.exception.error_type)
+
+        self._run("expired", tokens)
+
+    def test_garbage_tokens(self):
+        valid: str = self._generate_jwts(count=1)[0]
+        _header, payload, signature = valid.split(".")
+        tokens = []
+        for i in range(500):
+            kind = i % 4
+            if kind == 0:
+                tokens.append("".join(random.choices(string.ascii_letters, k=200)))
+            elif kind == 1:
+                tokens.append(f"{_segment({'alg': 'HS256', 'kid': 'kid123'})}.{payload}.{signature}")
+            elif kind == 2:
+                tokens.append(f"{_segment({'alg': 'RS256', 'kid': 'kid123'})}.{payload}!.{signature}")
+            else:
+                tokens.append(f"{_segment({'alg': 'RS256', 'kid': f'random-{i}'})}.{payload}.{signature}")
+
+        self._run("garbage", tokens)
+
+        # random kids force at most one refresh per SessionService (min refresh interval)
+        self.assertLessEqual(self.stub.requests, 2 * len(self.thread_counts))
+
+    def test_key_rotation_storm(self):
+        tokens = self._generate_jwts(count=200, private_key=self.rotated_private_key, kid="kid-rotated")
+
+        def create_rotated_session_service():
+            # warmed up with the old JWKS, rotated right before all threads present tokens with the new kid;
+            # without min refresh interval, as the rotation happens right after the warm up
+            self.stub.document = self.jwks
+            session_service = self._create_session_service(jwks_min_refresh_interval=0)
+            self.stub.document = self.rotated_jwks
+            return session_service  # noqa: R504
+
+        self._run("key rotation", tokens, session_service_factory=create_rotated_session_service)
+
+        # one fetch on warm up and one shared refresh per SessionService, however many threads miss the kid
+        self.assertEqual(2 * len(self.thread_counts), self.stub.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
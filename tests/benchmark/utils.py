@@ -0,0 +1,176 @@
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# Benchmarks are skipped by the normal test suite, set CORBADO_BENCHMARK=1 (or run tox -e benchmark) to run them.
+ENABLED: bool = os.getenv("CORBADO_BENCHMARK") == "1"
+# set CORBADO_BENCHMARK_ITERATIONS to get more stable numbers
+ITERATIONS: int = int(os.getenv("CORBADO_BENCHMARK_ITERATIONS", "2000"))
+# results are saved to CORBADO_BENCHMARK_OUTPUT, a previous results file given as CORBADO_BENCHMARK_BASELINE
+# is compared against and every result that got slower by more than REGRESSION_TOLERANCE is reported
+REGRESSION_TOLERANCE: float = float(os.getenv("CORBADO_BENCHMARK_TOLERANCE", "0.2"))
+OUTPUT_PATH: str = os.getenv("CORBADO_BENCHMARK_OUTPUT", os.path.join(tempfile.gettempdir(), "corbado-benchmark-results.json"))
+BASELINE_PATH: Optional[str] = os.getenv("CORBADO_BENCHMARK_BASELINE")
+
+
+# class decorator of benchmark test cases
+benchmark = unittest.skipUnless(ENABLED, "benchmarks only run with CORBADO_BENCHMARK=1")
+
+
+class BenchmarkResult(NamedTuple):
+    """Result of a benchmark run."""
+
+    name: str
+    operations: int
+    seconds: float
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+    def __str__(self) -> str:
+        """Format result as a single line."""
+        return (
+            f"{self.name}: {self.ops_per_sec:,.0f} ops/s "
+            f"(p50 {self.p50_us:.2f} us, p99 {self.p99_us:.2f} us, {self.operations} ops)"
+        )
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index: int = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_benchmark(name: str, operation: Callable[[int], object], iterations: int = ITERATIONS) -> BenchmarkResult:
+    """Call operation(i) for i in range(iterations), exceptions count as completed operations."""
+    latencies: List[float] = []
+    started: float = time.perf_counter()
+    for i in range(iterations):
+        call_started: float = time.perf_counter()
+        try:
+            operation(i)
+        except Exception:  # noqa: S110
+            pass
+        latencies.append(time.perf_counter() - call_started)
+    seconds: float = time.perf_counter() - started
+
+    latencies.sort()
+    result = BenchmarkResult(
+        name=name,
+        operations=iterations,
+        seconds=seconds,
+        ops_per_sec=iterations / seconds if seconds else 0.0,
+        p50_us=percentile(latencies, 0.5) * 1e6,
+        p99_us=percentile(latencies, 0.99) * 1e6,
+    )
+    print(result)
+    return result
+
+
+def measure_allocation(name: str, operation: Callable[[int], object], iterations: int = ITERATIONS) -> float:
+    """Return the memory (bytes) retained per result of operation(i), the results are kept alive while measuring."""
+    results: List[object] = []
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        for i in range(iterations):
+            results.append(operation(i))
+        retained: int = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    per_result: float = retained / iterations
+    print(f"{name}: {per_result:,.0f} bytes per result")
+    return per_result
+
+
+def run_threaded_benchmark(
+    name: str, operation: Callable[[int], object], threads: int, iterations: int = ITERATIONS
+) -> BenchmarkResult:
+    """Call operation(i) iterations times in each of the given number of threads, all threads start at once."""
+    barrier = threading.Barrier(threads + 1)
+    latencies: List[List[float]] = [[] for _thread in range(threads)]
+
+    def worker(thread_latencies: List[float]) -> None:
+        barrier.wait()
+        for i in range(iterations):
+            call_started: float = time.perf_counter()
+            try:
+                operation(i)
+            except Exception:  # noqa: S110
+                pass
+            thread_latencies.append(time.perf_counter() - call_started)
+
+    workers = [threading.Thread(target=worker, args=(thread_latencies,)) for thread_latencies in latencies]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started: float = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    seconds: float = time.perf_counter() - started
+
+    all_latencies: List[float] = sorted(latency for thread_latencies in latencies for latency in thread_latencies)
+    operations: int = threads * iterations
+    result = BenchmarkResult(
+        name=f"{name} ({threads} threads)",
+        operations=operations,
+        seconds=seconds,
+        ops_per_sec=operations / seconds if seconds else 0.0,
+        p50_us=percentile(all_latencies, 0.5) * 1e6,
+        p99_us=percentile(all_latencies, 0.99) * 1e6,
+    )
+    print(result)
+    return result
+
+
+def save_results(path: str, suite: str, results: List[BenchmarkResult]) -> None:
+    """Save results of a suite as JSON, results of other suites (or other runs of the suite) already saved are kept."""
+    document: Dict[str, Any] = load_results(path) or {}
+    suite_results: Dict[str, Any] = document.setdefault("suites", {}).setdefault(suite, {})
+    suite_results.update(
+        python=platform.python_version(),
+        machine=platform.machine(),
+        cpus=os.cpu_count(),
+        saved_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+    )
+    suite_results.setdefault("results", {}).update({result.name: result._asdict() for result in results})
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(document, results_file, indent=2, sort_keys=True)
+    print(f"Saved {len(results)} results of {suite} to {path}")
+
+
+def load_results(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Load a results file written by save_results(), None if there is none."""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as results_file:
+        loaded: Dict[str, Any] = json.load(results_file)
+    return loaded
+
+
+def find_regressions(
+    baseline: Optional[Dict[str, Any]], suite: str, results: List[BenchmarkResult], tolerance: float = REGRESSION_TOLERANCE
+) -> List[str]:
+    """Compare results with the baseline and describe each result whose throughput dropped by more than tolerance."""
+    if baseline is None:
+        return []
+    baseline_results: Dict[str, Any] = baseline.get("suites", {}).get(suite, {}).get("results", {})
+    regressions: List[str] = []
+    for result in results:
+        previous: Optional[Dict[str, Any]] = baseline_results.get(result.name)
+        if previous is None or not previous["ops_per_sec"]:
+            continue
+        change: float = result.ops_per_sec / previous["ops_per_sec"] - 1
+        line = f"{result.name}: {previous['ops_per_sec']:,.0f} -> {result.ops_per_sec:,.0f} ops/s ({change:+.0%})"
+        print(line)
+        if change < -tolerance:
+            regressions.append(line)
+    return regressions
@@ -0,0 +1,244 @@
+# type: ignore
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from corbado_python_sdk import (
+    AsyncIdentifierService,
+    AsyncUserService,
+    CircuitOpenException,
+    Config,
+    CorbadoSDK,
+    IdentifierStatus,
+    IdentifierType,
+    RateLimitException,
+    UserEntity,
+    UserStatus,
+)
+from corbado_python_sdk.aio import AsyncApiClient, AsyncIdentifiersApi, AsyncUsersApi
+from corbado_python_sdk.aio.rest import AsyncRESTClientObject
+from corbado_python_sdk.corbado_sdk import CORBADO_HEADER_NAME
+from corbado_python_sdk.exceptions import ServerException
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    RateLimit,
+    RateLimiter,
+    RetryCounters,
+    RetryPolicy,
+)
+
+
+def _user(user_id: str) -> dict:
+    return {"userID": user_id, "fullName": "Test", "status": "active", "updated": "2024-01-01", "updatedMs": 1}
+
+
+def _identifier(identifier_id: str, value: str = "test@example.com") -> dict:
+    return {"identifierID": identifier_id, "type": "email", "value": value, "status": "verified", "userID": "usr-1"}
+
+
+def _error(status: int, message: str) -> web.Response:
+    body = {
+        "httpStatusCode": status,
+        "message": message,
+        "requestData": {"requestID": "req-1", "link": ""},
+        "runtime": 0.1,
+        "error": {"type": "not_found", "validation": []},
+    }
+    return web.json_response(body, status=status)
+
+
+class _BackendStub:
+    """Backend API stub recording requests and the peak number of requests in flight."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.requests = []
+        self.failures = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = web.Application()
+        self.app.router.add_route("*", "/{tail:.*}", self.handle)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path_qs, dict(request.headers), await request.text()))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.failures:
+            return _error(self.failures.pop(0), "Unavailable")
+
+        parts = request.path.strip("/").split("/")
+        if parts[0] == "users" and len(parts) == 2:
+            if parts[1] == "usr-missing":
+                return _error(404, "User not found")
+            if request.method == "DELETE":
+                return web.json_response({"httpStatusCode": 200, "message": "OK", "requestData": {"requestID": "req-1"}, "runtime": 0.1})
+            return web.json_response(_user(parts[1]))
+        if parts[0] == "users" and len(parts) == 1:
+            return web.json_response(_user("usr-new"))
+        if parts[0] == "identifiers":
+            page = int(request.query.get("page", 1))
+            return web.json_response(
+                {"identifiers": [_identifier(f"ide-{page}")], "paging": {"page": page, "totalPages": 3, "totalItems": 3}}
+            )
+        if parts[0] == "users" and parts[2] == "identifiers":
+            if request.method == "DELETE":
+                return web.json_response({"httpStatusCode": 200, "message": "OK", "requestData": {"requestID": "req-1"}, "runtime": 0.1})
+            return web.json_response(_identifier("ide-new", value=json.loads(await request.text() or "{}").get("identifierValue", "")))
+        return _error(404, "Not found")
+
+
+class TestAsyncServices(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.stub = _BackendStub()
+        self.server = TestServer(self.stub.app)
+        await self.server.start_server()
+        self.api_client = AsyncApiClient(
+            configuration=Configuration(host=str(self.server.make_url("")).rstrip("/"), username="pro-1", password="secret"),
+            max_connections=10,
+        )
+        self.users = AsyncUserService(client=AsyncUsersApi(api_client=self.api_client))
+        self.identifiers = AsyncIdentifierService(client=AsyncIdentifiersApi(api_client=self.api_client))
+
+    async def asyncTearDown(self) -> None:
+        await self.api_client.close()
+        await self.server.close()
+
+    async def test_get_user_expect_user_entity(self):
+        user = await self.users.get(user_id="usr-1")
+
+        self.assertIsInstance(user, UserEntity)
+        self.assertEqual("usr-1", user.user_id)
+        method, path, headers, _body = self.stub.requests[0]
+        self.assertEqual(("GET", "/users/usr-1"), (method, path))
+        self.assertTrue(headers["Authorization"].startswith("Basic "))
+
+    async def test_create_and_delete_user(self):
+        user = await self.users.create(status=UserStatus.ACTIVE, full_name="Test")
+        await self.users.delete(user_id=user.user_id)
+
+        self.assertEqual("usr-new", user.user_id)
+        self.assertEqual({"status": "active", "fullName": "Test"}, json.loads(self.stub.requests[0][3]))
+        self.assertEqual(("DELETE", "/users/usr-new"), self.stub.requests[1][:2])
+
+    async def test_error_response_expect_server_exception(self):
+        with self.assertRaises(ServerException) as context:
+            await self.users.get(user_id="usr-missing")
+
+        self.assertEqual(404, context.exception.http_status_code)
+        self.assertEqual("req-1", context.exception.request_id)
+
+    async def test_list_all_emails_expect_all_pages(self):
+        identifiers = await self.identifiers.list_all_emails_by_user_id(user_id="usr-1")
+
+        self.assertEqual(["ide-1", "ide-2", "ide-3"], [identifier.identifier_id for identifier in identifiers])
+        self.assertIn("filter%5B%5D=userID:eq:1", self.stub.requests[0][1])
+        self.assertIn("filter%5B%5D=identifierType:eq:email", self.stub.requests[0][1])
+
+    async def test_identifier_create_update_delete(self):
+        created = await self.identifiers.create(
+            user_id="usr-1", identifier_type=IdentifierType.EMAIL, identifier_value="new@example.com", status=IdentifierStatus.VERIFIED
+        )
+        await self.identifiers.update_status(user_id="usr-1", identifier_id=created.identifier_id, status=IdentifierStatus.PRIMARY)
+        await self.identifiers.delete(user_id="usr-1", identifier_id=created.identifier_id)
+
+        self.assertEqual("new@example.com", created.value)
+        self.assertEqual(["POST", "PATCH", "DELETE"], [request[0] for request in self.stub.requests])
+        self.assertTrue(await self.identifiers.exists_by_value_and_type(value="new@example.com", identifier_type=IdentifierType.EMAIL))
+
+    async def test_unavailable_expect_retried(self):
+        self.api_client.retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+        self.stub.failures = [503, 429]
+
+        user = await self.users.get(user_id="usr-1")
+
+        self.assertEqual("usr-1", user.user_id)
+        self.assertEqual(3, len(self.stub.requests))
+        self.assertEqual({"GET /users/{userID}": RetryCounters(calls=1, retries=2, exhausted=0)}, self.api_client.retry_policy.counters)
+        self.assertNotIn("X-Corbado-Operation", self.stub.requests[0][2])
+
+    async def test_open_circuit_expect_fail_fast(self):
+        self.api_client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        self.stub.failures = [503]
+
+        with self.assertRaises(ServerException):
+            await self.users.get(user_id="usr-1")
+        with self.assertRaises(CircuitOpenException):
+            await self.users.get(user_id="usr-1")
+
+        self.assertEqual(1, len(self.stub.requests))
+
+    async def test_rate_limit_expect_throttled(self):
+        await self.users.get(user_id="usr-0")
+        self.api_client.rate_limiter = RateLimiter(limits={"read": RateLimit(rate=5, burst=2)}, timeout=0.3)
+
+        results = await asyncio.gather(*(self.users.get(user_id=f"usr-{i}") for i in range(4)), return_exceptions=True)
+
+        # waits of 0, 0, 0.2 and 0.4 seconds, the last one is longer than the timeout
+        self.assertEqual(["usr-0", "usr-1", "usr-2"], [user.user_id for user in results[:3]])
+        self.assertIsInstance(results[3], RateLimitException)
+        self.assertEqual("read", results[3].group)
+        self.assertEqual(4, len(self.stub.requests))
+
+    async def test_adaptive_concurrency_expect_limited_in_flight(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        self.api_client.rest_client.concurrency_limiter = limiter
+        self.stub.delay = 0.01
+
+        users = await asyncio.gather(*(self.users.get(user_id=f"usr-{i}") for i in range(20)))
+
+        self.assertEqual(20, len(users))
+        self.assertLessEqual(self.stub.max_in_flight, 3)
+        self.assertEqual((0, 0), (limiter.snapshot.in_flight, limiter.snapshot.queued))
+
+    async def test_concurrent_requests_expect_limited_connections(self):
+        self.stub.delay = 0.01
+
+        users = await asyncio.gather(*(self.users.get(user_id=f"usr-{i}") for i in range(50)))
+
+        self.assertEqual([f"usr-{i}" for i in range(50)], [user.user_id for user in users])
+        self.assertGreater(self.stub.max_in_flight, 1)
+        self.assertLessEqual(self.stub.max_in_flight, 10)
+
+    async def test_new_client_expect_no_urllib3_pool(self):
+        with patch("urllib3.PoolManager") as pool_manager:
+            api_client = AsyncApiClient(
+                configuration=Configuration(host="http://localhost"), concurrency_limiter=AdaptiveConcurrencyLimiter()
+            )
+        await api_client.close()
+
+        pool_manager.assert_not_called()
+        self.assertIsInstance(api_client.rest_client, AsyncRESTClientObject)
+        self.assertIs(api_client.concurrency_limiter, api_client.rest_client.concurrency_limiter)
+        self.assertEqual("OpenAPI-Generator/1.0.0/python", api_client.user_agent)
+
+
+class TestCorbadoSDKAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_async_services_expect_shared_client_with_sdk_header(self):
+        sdk = CorbadoSDK(
+            config=Config(
+                project_id="pro-1",
+                api_secret="corbado1_secret",
+                frontend_api="https://pro-1.frontendapi.cloud.corbado.io",
+                backend_api="https://backendapi.cloud.corbado.io",
+                async_max_connections=5,
+            )
+        )
+
+        self.assertIs(sdk.async_users.client.api_client, sdk.async_identifiers.client.api_client)
+        self.assertEqual(5, sdk.async_api_client.rest_client.max_connections)
+        self.assertIn(CORBADO_HEADER_NAME, sdk.async_api_client.default_headers)
+        await sdk.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
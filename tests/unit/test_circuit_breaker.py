@@ -0,0 +1,186 @@
+# type: ignore
+import pickle  # noqa: S403
+import unittest
+from time import sleep
+
+from corbado_python_sdk import CircuitOpenException, UserService
+from corbado_python_sdk.exceptions import ServerException
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    CircuitBreaker,
+    CircuitSnapshot,
+    CircuitState,
+    ResilientApiClient,
+    RetryPolicy,
+)
+from tests.unit.test_retry import _FlakyBackendStub
+
+KEY = "backendapi.cloud.corbado.io GET /users/{userID}"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def _fail(self, breaker: CircuitBreaker, count: int, key: str = KEY) -> None:
+        for _i in range(count):
+            breaker.acquire(key)
+            breaker.record(key, False)
+
+    def test_consecutive_failures_expect_open(self):
+        breaker = CircuitBreaker(failure_threshold=3, min_calls=10)
+
+        self._fail(breaker, 2)
+        breaker.acquire(KEY)
+        breaker.record(KEY, True)
+        self._fail(breaker, 2)
+        self.assertEqual(CircuitState.CLOSED, breaker.circuits[KEY].state)
+
+        self._fail(breaker, 1)
+        with self.assertRaises(CircuitOpenException) as context:
+            breaker.acquire(KEY)
+
+        self.assertEqual(KEY, context.exception.circuit)
+        self.assertGreater(context.exception.retry_after, 0)
+        self.assertEqual(CircuitSnapshot(CircuitState.OPEN, 3, 5 / 6, 6, 1, 1), breaker.circuits[KEY])
+
+    def test_error_rate_expect_open(self):
+        breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, window_size=10, min_calls=4)
+
+        for success in (True, False, True, True, False):
+            breaker.acquire(KEY)
+            breaker.record(KEY, success)
+        self.assertEqual(CircuitState.CLOSED, breaker.circuits[KEY].state)
+
+        self._fail(breaker, 1)
+        self.assertEqual(CircuitState.OPEN, breaker.circuits[KEY].state)
+
+    def test_error_rate_expect_sliding_window(self):
+        breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, window_size=4, min_calls=4)
+
+        self._fail(breaker, 1)
+        for _i in range(10):
+            breaker.acquire(KEY)
+            breaker.record(KEY, True)
+        self._fail(breaker, 1)
+
+        self.assertEqual(0.25, breaker.circuits[KEY].error_rate)
+        self.assertEqual(CircuitState.CLOSED, breaker.circuits[KEY].state)
+
+    def test_half_open_expect_limited_probes(self):
+        breaker = CircuitBreaker(failure_threshold=1, open_timeout=0.05, half_open_max_calls=2)
+        self._fail(breaker, 1)
+        sleep(0.06)
+
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.circuits[KEY].state)
+        breaker.acquire(KEY)
+        breaker.acquire(KEY)
+        with self.assertRaises(CircuitOpenException):
+            breaker.acquire(KEY)
+
+        # an aborted probe frees its slot without deciding
+        breaker.record(KEY, None)
+        breaker.acquire(KEY)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.circuits[KEY].state)
+
+    def test_probe_success_expect_closed(self):
+        breaker = CircuitBreaker(failure_threshold=1, open_timeout=0.05)
+        self._fail(breaker, 1)
+        sleep(0.06)
+
+        breaker.acquire(KEY)
+        breaker.record(KEY, True)
+
+        self.assertEqual(CircuitSnapshot(CircuitState.CLOSED, 0, 0.0, 0, 1, 0), breaker.circuits[KEY])
+
+    def test_probe_failure_expect_open_again(self):
+        breaker = CircuitBreaker(failure_threshold=1, open_timeout=0.05)
+        self._fail(breaker, 1)
+        sleep(0.06)
+
+        breaker.acquire(KEY)
+        breaker.record(KEY, False)
+
+        self.assertEqual(CircuitState.OPEN, breaker.circuits[KEY].state)
+        self.assertEqual(2, breaker.circuits[KEY].times_opened)
+        with self.assertRaises(CircuitOpenException):
+            breaker.acquire(KEY)
+
+    def test_circuits_expect_independent(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        self._fail(breaker, 1)
+        breaker.acquire("backendapi.cloud.corbado.io GET /identifiers")
+
+        states = {key: circuit.state for key, circuit in breaker.circuits.items()}
+        self.assertEqual({KEY: CircuitState.OPEN, "backendapi.cloud.corbado.io GET /identifiers": CircuitState.CLOSED}, states)
+
+    def test_exception_pickled_expect_attributes_and_message_preserved(self):
+        error = CircuitOpenException(circuit=KEY, retry_after=1.5)
+
+        unpickled: CircuitOpenException = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+        self.assertEqual((error.circuit, error.retry_after), (unpickled.circuit, unpickled.retry_after))
+        self.assertEqual(f"Circuit {KEY} is open, the Backend API is considered unavailable (retry in 1.5s)", str(unpickled))
+
+    def test_invalid_parameters_expect_error(self):
+        test_cases = [
+            {"failure_threshold": 0},
+            {"error_rate_threshold": 0},
+            {"error_rate_threshold": 1.5},
+            {"window_size": 5, "min_calls": 6},
+            {"open_timeout": 0},
+            {"half_open_max_calls": 0},
+        ]
+        for kwargs in test_cases:
+            with self.assertRaises(ValueError, msg=kwargs):
+                CircuitBreaker(**kwargs)
+
+
+class TestResilientApiClientCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = _FlakyBackendStub()
+        self.breaker = CircuitBreaker(failure_threshold=2, open_timeout=0.2)
+        configuration = Configuration(host=self.stub.host, username="pro-1", password="secret", retries=False)
+        self.api_client = ResilientApiClient(configuration=configuration, circuit_breaker=self.breaker)
+        self.service = UserService(client=UsersApi(api_client=self.api_client))
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+
+    def test_failing_backend_expect_fail_fast(self):
+        self.stub.failures = [(503, {})] * 2
+
+        for _i in range(2):
+            with self.assertRaises(ServerException):
+                self.service.get(user_id="usr-1")
+        with self.assertRaises(CircuitOpenException):
+            self.service.get(user_id="usr-1")
+
+        self.assertEqual(2, len(self.stub.requests))
+        circuit = f"{self.stub.host[len('http://'):]} GET /users/{{userID}}"
+        self.assertEqual(CircuitState.OPEN, self.breaker.circuits[circuit].state)
+
+        sleep(0.25)
+        self.assertEqual("usr-1", self.service.get(user_id="usr-1").user_id)
+        self.assertEqual(CircuitState.CLOSED, self.breaker.circuits[circuit].state)
+
+    def test_client_errors_expect_not_counted(self):
+        self.stub.failures = [(404, {})] * 3
+
+        for _i in range(3):
+            with self.assertRaises(ServerException):
+                self.service.get(user_id="usr-1")
+
+        self.assertEqual(3, len(self.stub.requests))
+
+    def test_open_circuit_expect_retries_stopped(self):
+        self.api_client.retry_policy = RetryPolicy(max_attempts=5, base_delay=0.001)
+        self.stub.failures = [(503, {})] * 5
+
+        with self.assertRaises(CircuitOpenException):
+            self.service.get(user_id="usr-1")
+
+        self.assertEqual(2, len(self.stub.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
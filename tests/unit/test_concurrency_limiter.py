@@ -0,0 +1,225 @@
+# type: ignore
+import asyncio
+import pickle  # noqa: S403
+import threading
+import unittest
+
+from corbado_python_sdk import (
+    ConcurrencyLimitException,
+    Config,
+    CorbadoSDK,
+    UserService,
+)
+from corbado_python_sdk.exceptions import ServerException
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    LimitedRESTClientObject,
+    ResilientApiClient,
+)
+from tests.unit.test_retry import _FlakyBackendStub
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def _complete(self, limiter: AdaptiveConcurrencyLimiter, latency: float, success: bool = True) -> None:
+        limiter.release(limiter.acquire() - latency, success)
+
+    def test_fast_responses_at_limit_expect_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        limits = []
+        for _i in range(20):
+            started = [limiter.acquire() for _j in range(limiter.limit)]
+            for start in started:
+                limiter.release(start - 0.01, True)
+            limits.append(limiter.limit)
+
+        # about +1 per round trip at the limit, capped at max_limit
+        self.assertEqual(sorted(limits), limits)
+        self.assertEqual(2, limits[0])
+        self.assertEqual(4, limits[-1])
+
+    def test_unused_limit_expect_no_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+        for _i in range(100):
+            self._complete(limiter, 0.01)
+
+        self.assertEqual(10, limiter.limit)
+
+    def test_failure_expect_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+        self._complete(limiter, 0, success=False)
+        self.assertEqual(5, limiter.limit)
+        self._complete(limiter, 0, success=False)
+        self._complete(limiter, 0, success=False)
+        self._complete(limiter, 0, success=False)
+
+        self.assertEqual(1, limiter.limit)
+        self.assertEqual(4, limiter.snapshot.decreases)
+
+    def test_concurrent_failures_expect_one_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+        started = [limiter.acquire() for _i in range(3)]
+
+        for start in started:
+            limiter.release(start, False)
+
+        self.assertEqual(5, limiter.limit)
+        self.assertEqual(1, limiter.snapshot.decreases)
+
+    def test_latency_above_tolerance_expect_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2.0, backoff_ratio=0.5)
+        self._complete(limiter, 0.01)
+
+        self._complete(limiter, 0.015)
+        self.assertEqual(10, limiter.limit)
+        self._complete(limiter, 0.05)
+
+        self.assertEqual(5, limiter.limit)
+        self.assertAlmostEqual(0.01, limiter.snapshot.min_latency, delta=0.001)
+
+    def test_min_latency_window_expect_lasting_change_followed(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, min_latency_window=2)
+        self._complete(limiter, 0.01)
+        self._complete(limiter, 0.01)
+
+        started = [limiter.acquire(), limiter.acquire()]
+        for start in started:
+            limiter.release(start - 0.05, True)
+
+        self.assertAlmostEqual(0.05, limiter.snapshot.min_latency, delta=0.001)
+        self.assertEqual(1, limiter.snapshot.decreases)
+
+    def test_limit_reached_expect_wait_for_release(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        self.assertEqual(1, limiter.snapshot.queued)
+        limiter.release(started, None)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+        self.assertEqual((1, 0), (limiter.snapshot.in_flight, limiter.snapshot.queued))
+
+    def test_timeout_expect_concurrency_limit_exception(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, timeout=0.05)
+        limiter.acquire()
+
+        with self.assertRaises(ConcurrencyLimitException) as context:
+            limiter.acquire()
+
+        self.assertEqual(1, context.exception.limit)
+        self.assertEqual((1, 0, 1), (limiter.snapshot.in_flight, limiter.snapshot.queued, limiter.snapshot.rejected))
+
+    def test_cancelled_async_waiter_expect_no_leaked_slot(self):
+        async def scenario(limiter: AdaptiveConcurrencyLimiter) -> None:
+            started = await limiter.acquire_async()
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            limiter.release(started, True)
+            await asyncio.wait_for(limiter.acquire_async(), 1)
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        asyncio.run(scenario(limiter))
+
+        self.assertEqual((1, 0, 0), (limiter.snapshot.in_flight, limiter.snapshot.queued, limiter.snapshot.rejected))
+
+    def test_async_timeout_expect_concurrency_limit_exception(self):
+        async def scenario(limiter: AdaptiveConcurrencyLimiter) -> None:
+            await limiter.acquire_async()
+            with self.assertRaises(ConcurrencyLimitException):
+                await limiter.acquire_async()
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, timeout=0.05)
+        asyncio.run(scenario(limiter))
+
+        self.assertEqual(1, limiter.snapshot.rejected)
+
+    def test_exception_pickled_expect_attributes_and_message_preserved(self):
+        error = ConcurrencyLimitException(limit=3, timeout=0.5)
+
+        unpickled: ConcurrencyLimitException = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+        self.assertEqual((error.limit, error.timeout), (unpickled.limit, unpickled.timeout))
+        self.assertEqual("No Backend API request slot freed up within 0.50s (concurrency limit 3)", str(unpickled))
+
+    def test_invalid_parameters_expect_error(self):
+        test_cases = [
+            {"initial_limit": 0},
+            {"initial_limit": 5, "max_limit": 4},
+            {"initial_limit": 5, "min_limit": 6},
+            {"latency_tolerance": 1},
+            {"backoff_ratio": 1},
+            {"min_latency_window": 0},
+            {"timeout": -1},
+        ]
+        for kwargs in test_cases:
+            with self.assertRaises(ValueError, msg=kwargs):
+                AdaptiveConcurrencyLimiter(**kwargs)
+
+
+class TestResilientApiClientConcurrencyLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = _FlakyBackendStub()
+        self.limiter = AdaptiveConcurrencyLimiter(initial_limit=4, backoff_ratio=0.5, timeout=0.05)
+        self.breaker = CircuitBreaker(failure_threshold=1)
+        configuration = Configuration(host=self.stub.host, username="pro-1", password="secret", retries=False)
+        self.api_client = ResilientApiClient(configuration=configuration, circuit_breaker=self.breaker, concurrency_limiter=self.limiter)
+        self.service = UserService(client=UsersApi(api_client=self.api_client))
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+
+    def test_server_error_expect_decrease(self):
+        self.stub.failures = [(503, {})]
+
+        with self.assertRaises(ServerException):
+            self.service.get(user_id="usr-1")
+
+        self.assertIsInstance(self.api_client.rest_client, LimitedRESTClientObject)
+        self.assertEqual(2, self.limiter.limit)
+        self.assertEqual(0, self.limiter.snapshot.in_flight)
+
+    def test_no_slot_expect_not_counted_by_circuit_breaker(self):
+        held = [self.limiter.acquire() for _i in range(4)]
+
+        with self.assertRaises(ConcurrencyLimitException):
+            self.service.get(user_id="usr-1")
+        for start in held:
+            self.limiter.release(start, None)
+
+        self.assertEqual(0, len(self.stub.requests))
+        self.assertEqual("usr-1", self.service.get(user_id="usr-1").user_id)
+
+
+class TestCorbadoSDKConcurrencyLimiter(unittest.TestCase):
+    def test_config_expect_limited_transport(self):
+        sdk = CorbadoSDK(
+            config=Config(
+                project_id="pro-1",
+                api_secret="corbado1_secret",
+                frontend_api="https://pro-1.frontendapi.cloud.corbado.io",
+                backend_api="https://backendapi.cloud.corbado.io",
+                adaptive_concurrency=True,
+                concurrency_max_limit=8,
+            )
+        )
+
+        self.assertIsInstance(sdk.api_client.rest_client, LimitedRESTClientObject)
+        self.assertIs(sdk.concurrency_limiter, sdk.api_client.concurrency_limiter)
+        self.assertEqual(8, sdk.api_client.configuration.connection_pool_maxsize)
+        self.assertEqual(8, sdk.concurrency_limiter.limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
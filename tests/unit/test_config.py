@@ -37,6 +37,28 @@ class TestConfig(unittest.TestCase):
         config = Config(project_id="pro-123", api_secret="corbado1_123", frontend_api="https://test.com", backend_api=test_url)
         self.assertTrue(config.backend_api.endswith("/v2"))
 
+    def test_set_jwks(self):
+        jwks = '{"keys": [{"kty": "RSA", "kid": "kid123", "n": "xxx", "e": "AQAB"}]}'
+        config = Config(
+            project_id="pro-123", api_secret="corbado1_123", frontend_api="https://test.com", backend_api="https://test.com", jwks=jwks
+        )
+        self.assertEqual("kid123", config.jwks["keys"][0]["kid"])
+
+        for invalid in ["{invalid", '{"no_keys": []}']:
+            with self.assertRaises(ValueError):
+                config.jwks = invalid
+
+    def test_set_jwks_and_jwks_path_expect_error(self):
+        with self.assertRaises(ValueError):
+            Config(
+                project_id="pro-123",
+                api_secret="corbado1_123",
+                frontend_api="https://test.com",
+                backend_api="https://test.com",
+                jwks={"keys": []},
+                jwks_path="/tmp/jwks.json",  # noqa: S108
+            )
+
     def provide_urls(self):
         return [
             ("", False),
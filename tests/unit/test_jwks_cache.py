@@ -0,0 +1,230 @@
+# type: ignore
+import copy
+import json
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from jwt import PyJWKClientConnectionError, PyJWKClientError
+
+from corbado_python_sdk.cache import JWKSCache
+
+
+class TestJWKSCache(unittest.TestCase):
+    jwks = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        jwks_path: str = os.path.join(os.path.dirname(__file__), "test_data", "jwks.json")
+        with open(file=jwks_path, mode="rb") as jwks_file:
+            cls.jwks = json.loads(jwks_file.read())
+
+    def setUp(self) -> None:
+        self.cache = JWKSCache(
+            uri="https://example_uri.com", lifespan=10, refresh_ahead=2, max_stale=20, min_refresh_interval=1, unknown_kid_ttl=5
+        )
+        self.my_patch = patch.object(self.cache._client, "fetch_data", return_value=self.jwks)
+        self.mock_fetch = self.my_patch.start()
+        self.addCleanup(self.my_patch.stop)
+
+    def _age(self, seconds: float) -> None:
+        self.cache._snapshot = self.cache._snapshot._replace(fetched_at=self.cache._snapshot.fetched_at - seconds)
+
+    def _wait_for_background_refresh(self) -> None:
+        for thread in threading.enumerate():
+            if thread.name == "corbado-jwks-refresh":
+                thread.join(timeout=5)
+
+    def test_get_signing_key_expect_single_fetch(self):
+        for _i in range(3):
+            self.assertEqual("kid123", self.cache.get_signing_key("kid123").key_id)
+        self.assertEqual(1, self.mock_fetch.call_count)
+        self.assertEqual(1, self.cache.refresh_success_count)
+
+    def test_refresh_ahead_expect_background_refresh(self):
+        self.cache.get_signing_key("kid123")
+        self._age(9)
+
+        self.assertEqual("kid123", self.cache.get_signing_key("kid123").key_id)
+        self._wait_for_background_refresh()
+
+        self.assertEqual(2, self.mock_fetch.call_count)
+        self.assertEqual(2, self.cache.refresh_success_count)
+
+    def test_refresh_failure_expect_stale_keys_served(self):
+        self.cache.get_signing_key("kid123")
+        self._age(15)
+        self.mock_fetch.side_effect = PyJWKClientConnectionError("unreachable")
+
+        self.assertEqual("kid123", self.cache.get_signing_key("kid123").key_id)
+        self._wait_for_background_refresh()
+
+        self.assertEqual(1, self.cache.refresh_failure_count)
+        self.assertIsInstance(self.cache.last_refresh_error, PyJWKClientConnectionError)
+
+    def test_failing_background_refresh_expect_retry_after_min_refresh_interval(self):
+        self.cache.get_signing_key("kid123")
+        self._age(15)
+        self.mock_fetch.side_effect = PyJWKClientConnectionError("unreachable")
+
+        for _i in range(100):
+            self.assertEqual("kid123", self.cache.get_signing_key("kid123").key_id)
+            self.assertEqual("kid123", self.cache.get_cached_signing_key("kid123").key_id)
+            self._wait_for_background_refresh()
+        self.assertEqual(2, self.mock_fetch.call_count)
+
+        self.cache._background_refresh_at -= 1
+        self.cache.get_signing_key("kid123")
+        self._wait_for_background_refresh()
+        self.assertEqual(3, self.mock_fetch.call_count)
+        self.assertEqual(2, self.cache.refresh_failure_count)
+
+    def test_lookups_in_refresh_window_expect_no_lock(self):
+        self.cache.get_signing_key("kid123")
+        self._age(9)
+        self.cache._refreshing = True
+        lock = self.cache._lock
+        self.cache._lock = MagicMock(wraps=lock)
+
+        for _i in range(10):
+            self.cache.get_signing_key("kid123")
+            self.cache.get_cached_signing_key("kid123")
+        self.assertEqual(0, self.cache._lock.__enter__.call_count)
+
+        self.cache._refreshing = False
+        self.cache._background_refresh_at = time.monotonic()
+        self.cache.get_signing_key("kid123")
+        self.assertEqual(0, self.cache._lock.__enter__.call_count)
+        self.assertEqual(1, self.mock_fetch.call_count)
+
+    def test_max_stale_exceeded_expect_synchronous_fetch(self):
+        self.cache.get_signing_key("kid123")
+        self._age(31)
+        self.mock_fetch.side_effect = PyJWKClientConnectionError("unreachable")
+
+        with self.assertRaises(PyJWKClientConnectionError):
+            self.cache.get_signing_key("kid123")
+        self.assertEqual(1, self.cache.refresh_failure_count)
+
+    def test_unknown_kid_expect_refresh_and_error(self):
+        self.cache.get_signing_key("kid123")
+        self._age(1)
+
+        with self.assertRaises(PyJWKClientError):
+            self.cache.get_signing_key("unknown")
+        self.assertEqual(2, self.mock_fetch.call_count)
+        self.assertEqual(1, self.cache.rejected_kid_count)
+
+    def test_unknown_kid_expect_negative_cache_hit(self):
+        self.cache.get_signing_key("kid123")
+        self._age(1)
+        with self.assertRaises(PyJWKClientError):
+            self.cache.get_signing_key("unknown")
+
+        self._age(2)
+        for _i in range(10):
+            with self.assertRaises(PyJWKClientError):
+                self.cache.get_signing_key("unknown")
+
+        self.assertEqual(2, self.mock_fetch.call_count)
+        self.assertEqual(11, self.cache.rejected_kid_count)
+
+    def test_random_kids_within_min_refresh_interval_expect_no_refresh(self):
+        self.cache.get_signing_key("kid123")
+
+        for i in range(10):
+            with self.assertRaises(PyJWKClientError):
+                self.cache.get_signing_key(f"random-{i}")
+
+        self.assertEqual(1, self.mock_fetch.call_count)
+        self.assertEqual(10, self.cache.rejected_kid_count)
+
+    def test_missing_kid_expect_no_refresh(self):
+        self.cache.get_signing_key("kid123")
+        self._age(1)
+
+        with self.assertRaises(PyJWKClientError):
+            self.cache.get_signing_key(None)
+        self.assertEqual(1, self.mock_fetch.call_count)
+
+    def test_concurrent_misses_on_key_rotation_expect_single_fetch(self):
+        self.cache.get_signing_key("kid123")
+        self._age(1)
+        rotated = copy.deepcopy(self.jwks)
+        rotated["keys"][0]["kid"] = "kid456"
+
+        def slow_fetch():
+            time.sleep(0.05)
+            return rotated
+
+        self.mock_fetch.side_effect = slow_fetch
+        num_threads = 32
+        barrier = threading.Barrier(num_threads)
+
+        def lookup(_i):
+            barrier.wait()
+            return self.cache.get_signing_key("kid456").key_id
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            kids = list(executor.map(lookup, range(num_threads)))
+
+        self.assertEqual(["kid456"] * num_threads, kids)
+        self.assertEqual(2, self.mock_fetch.call_count)
+        self.assertEqual(2, self.cache.refresh_success_count)
+
+    def test_concurrent_cold_start_expect_single_fetch(self):
+        def slow_fetch():
+            time.sleep(0.05)
+            return self.jwks
+
+        self.mock_fetch.side_effect = slow_fetch
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(lambda _i: self.cache.get_signing_key("kid123"), range(16)))
+
+        self.assertEqual(1, self.mock_fetch.call_count)
+
+    def test_lookups_during_refreshes_expect_consistent_key_set(self):
+        self.cache.get_signing_key("kid123")
+        rotated = copy.deepcopy(self.jwks)
+        rotated["keys"][0]["kid"] = "kid456"
+        stop = threading.Event()
+
+        def rotate():
+            documents = [rotated, self.jwks]
+            i = 0
+            while not stop.is_set():
+                self.cache.seed(documents[i % 2])
+                i += 1
+
+        def lookup(_i):
+            kids = set()
+            for _j in range(2000):
+                snapshot = self.cache._snapshot
+                kids.update(snapshot.keys)
+                self.assertEqual(1, len(snapshot.keys))
+                self.assertEqual(snapshot.document["keys"][0]["kid"], next(iter(snapshot.keys)))
+            return kids
+
+        rotator = threading.Thread(target=rotate)
+        rotator.start()
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                kids = set().union(*executor.map(lookup, range(4)))
+        finally:
+            stop.set()
+            rotator.join()
+
+        self.assertTrue(kids <= {"kid123", "kid456"})
+
+    def test_init_parameters(self):
+        for lifespan, refresh_ahead, max_stale in [(0, 0, 0), (10, 10, 0), (10, -1, 0), (10, 1, -1)]:
+            with self.assertRaises(ValueError):
+                JWKSCache(uri="https://example_uri.com", lifespan=lifespan, refresh_ahead=refresh_ahead, max_stale=max_stale)
+
+
+if __name__ == "__main__":
+    unittest.main()
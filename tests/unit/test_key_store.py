@@ -0,0 +1,108 @@
+# type: ignore
+import copy
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from jwt import PyJWKClientError
+
+from corbado_python_sdk.cache import FileKeyStore, JWKSCache
+
+
+class TestFileKeyStore(unittest.TestCase):
+    jwks = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        jwks_path: str = os.path.join(os.path.dirname(__file__), "test_data", "jwks.json")
+        with open(file=jwks_path, mode="rb") as jwks_file:
+            cls.jwks = json.loads(jwks_file.read())
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "jwks.json")
+
+    def _create_cache(self) -> JWKSCache:
+        cache = JWKSCache(uri="https://example_uri.com", lifespan=10, refresh_ahead=2, key_store=FileKeyStore(path=self.path))
+        fetch_patch = patch.object(cache._client, "fetch_data", return_value=self.jwks)
+        fetch_patch.start()
+        self.addCleanup(fetch_patch.stop)
+        return cache
+
+    def test_load_without_file_expect_none(self):
+        self.assertIsNone(FileKeyStore(path=self.path).load())
+
+    def test_save_and_load(self):
+        store = FileKeyStore(path=self.path)
+        store.save(document=self.jwks)
+
+        stored = store.load()
+        self.assertEqual(self.jwks, stored.document)
+        self.assertAlmostEqual(time.time(), stored.stored_at, delta=5)
+        self.assertEqual([], [name for name in os.listdir(self.directory.name) if name.endswith(".tmp")])
+
+    def test_load_invalid_file_expect_none(self):
+        with open(self.path, "w") as key_set_file:
+            key_set_file.write("{invalid")
+        self.assertIsNone(FileKeyStore(path=self.path).load())
+
+    def test_sibling_cache_expect_keys_loaded_from_store(self):
+        first = self._create_cache()
+        second = self._create_cache()
+
+        first.get_signing_key("kid123")
+        second.get_signing_key("kid123")
+
+        self.assertEqual(1, first._client.fetch_data.call_count)
+        self.assertEqual(0, second._client.fetch_data.call_count)
+        self.assertEqual(1, second.key_store_hit_count)
+
+    def test_stale_store_expect_fetch(self):
+        FileKeyStore(path=self.path).save(document=self.jwks)
+        stale: float = time.time() - 9
+        os.utime(self.path, (stale, stale))
+        cache = self._create_cache()
+
+        cache.get_signing_key("kid123")
+
+        self.assertEqual(1, cache._client.fetch_data.call_count)
+        self.assertEqual(0, cache.key_store_hit_count)
+
+    def test_own_key_set_in_store_expect_forced_refresh_fetches(self):
+        cache = self._create_cache()
+        cache.min_refresh_interval = 0
+        cache.get_signing_key("kid123")
+
+        with self.assertRaises(PyJWKClientError):
+            cache.get_signing_key("unknown")
+
+        self.assertEqual(2, cache._client.fetch_data.call_count)
+        self.assertEqual(0, cache.key_store_hit_count)
+
+    def test_sibling_saved_old_key_set_after_rotation_expect_unknown_kid_fetched(self):
+        first = self._create_cache()
+        second = self._create_cache()
+        first.min_refresh_interval = 0
+        first.get_signing_key("kid123")
+        second.get_signing_key("kid123")
+        # the sibling saves the key set from before the rotation again, later than the first cache loaded it
+        second._key_store.save(document=self.jwks)
+        newer: float = time.time() + 1
+        os.utime(self.path, (newer, newer))
+        rotated = copy.deepcopy(self.jwks)
+        rotated["keys"][0]["kid"] = "kid456"
+        first._client.fetch_data.return_value = rotated
+
+        self.assertEqual("kid456", first.get_signing_key("kid456").key_id)
+
+        self.assertEqual(2, first.refresh_success_count)
+        self.assertEqual(0, first.key_store_hit_count)
+        self.assertEqual("kid456", FileKeyStore(path=self.path).load().document["keys"][0]["kid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
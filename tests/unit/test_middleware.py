@@ -0,0 +1,138 @@
+# type: ignore
+import asyncio
+from time import time
+from unittest.mock import patch
+
+from corbado_python_sdk import TokenValidationException, ValidatedSession
+from corbado_python_sdk.middleware import (
+    SESSION_ERROR_KEY,
+    SESSION_KEY,
+    CorbadoASGIMiddleware,
+    CorbadoWSGIMiddleware,
+    extract_session_token,
+)
+from corbado_python_sdk.services.implementation import SessionService
+from tests.unit.test_session_service import TEST_USER_ID, TestBase
+
+
+def _wsgi_app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"OK"]
+
+
+async def _asgi_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"OK"})
+
+
+class TestExtractSessionToken(TestBase):
+    def test_extract_session_token(self):
+        test_cases = [
+            ("Bearer token1", None, "token1"),
+            ("bearer  token1 ", "cbo_session_token=token2", "token1"),
+            ("Basic dXNlcjpwYXNz", "cbo_session_token=token2", "token2"),
+            (None, "a=b; cbo_session_token=token2; c=d", "token2"),
+            (None, "cbo_session_token=token2", "token2"),
+            (None, "xcbo_session_token=token3; cbo_session_token=token2", "token2"),
+            (None, "xcbo_session_token=token3", None),
+            (None, "cbo_session_token=", None),
+            ("Bearer ", None, None),
+            (None, None, None),
+        ]
+        for authorization, cookie, expected in test_cases:
+            self.assertEqual(expected, extract_session_token(authorization=authorization, cookie=cookie), (authorization, cookie))
+
+
+class TestCorbadoWSGIMiddleware(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.session_service = self.create_session_service()
+        self.jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        self.statuses = []
+
+    def _start_response(self, status, headers):
+        self.statuses.append(status)
+
+    def test_valid_cookie_expect_session_in_environ(self):
+        environ = {"HTTP_COOKIE": f"cbo_session_token={self.jwt}"}
+
+        body = CorbadoWSGIMiddleware(_wsgi_app, self.session_service)(environ, self._start_response)
+
+        self.assertEqual([b"OK"], body)
+        self.assertIsInstance(environ[SESSION_KEY], ValidatedSession)
+        self.assertEqual(TEST_USER_ID, environ[SESSION_KEY].user_id)
+        self.assertIsNone(environ[SESSION_ERROR_KEY])
+
+    def test_invalid_token_expect_error_in_environ(self):
+        environ = {"HTTP_AUTHORIZATION": "Bearer invalid"}
+
+        CorbadoWSGIMiddleware(_wsgi_app, self.session_service)(environ, self._start_response)
+
+        self.assertIsNone(environ[SESSION_KEY])
+        self.assertIsInstance(environ[SESSION_ERROR_KEY], TokenValidationException)
+        self.assertEqual(["200 OK"], self.statuses)
+
+    def test_required_without_token_expect_unauthorized(self):
+        environ = {}
+
+        body = CorbadoWSGIMiddleware(_wsgi_app, self.session_service, required=True)(environ, self._start_response)
+
+        self.assertEqual([b"Unauthorized"], body)
+        self.assertEqual(["401 Unauthorized"], self.statuses)
+
+    def test_nested_middleware_expect_validated_once(self):
+        app = CorbadoWSGIMiddleware(CorbadoWSGIMiddleware(_wsgi_app, self.session_service), self.session_service, required=True)
+
+        with patch.object(SessionService, "validate_session", autospec=True, side_effect=SessionService.validate_session) as mock_validate:
+            app({"HTTP_AUTHORIZATION": f"Bearer {self.jwt}"}, self._start_response)
+
+        self.assertEqual(1, mock_validate.call_count)
+        self.assertEqual(["200 OK"], self.statuses)
+
+
+class TestCorbadoASGIMiddleware(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.session_service = self.create_session_service()
+        self.jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+    def _call(self, app, scope):
+        messages = []
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(app(scope, receive, send))
+        return messages  # noqa: R504
+
+    def test_valid_cookie_expect_session_in_scope(self):
+        scope = {"type": "http", "headers": [(b"host", b"example.com"), (b"cookie", f"cbo_session_token={self.jwt}".encode())]}
+
+        messages = self._call(CorbadoASGIMiddleware(_asgi_app, self.session_service), scope)
+
+        self.assertEqual(200, messages[0]["status"])
+        self.assertEqual(TEST_USER_ID, scope[SESSION_KEY].user_id)
+        self.assertIsNone(scope[SESSION_ERROR_KEY])
+
+    def test_required_with_invalid_token_expect_unauthorized(self):
+        scope = {"type": "http", "headers": [(b"authorization", b"Bearer invalid")]}
+
+        messages = self._call(CorbadoASGIMiddleware(_asgi_app, self.session_service, required=True), scope)
+
+        self.assertEqual(401, messages[0]["status"])
+        self.assertIsInstance(scope[SESSION_ERROR_KEY], TokenValidationException)
+
+    def test_required_websocket_without_token_expect_closed(self):
+        messages = self._call(CorbadoASGIMiddleware(_asgi_app, self.session_service, required=True), {"type": "websocket", "headers": []})
+
+        self.assertEqual([{"type": "websocket.close", "code": 1008}], messages)
+
+    def test_lifespan_expect_passed_through(self):
+        scope = {"type": "lifespan"}
+
+        self._call(CorbadoASGIMiddleware(_asgi_app, self.session_service, required=True), scope)
+
+        self.assertNotIn(SESSION_KEY, scope)
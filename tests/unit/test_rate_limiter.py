@@ -0,0 +1,156 @@
+# type: ignore
+import pickle  # noqa: S403
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from corbado_python_sdk import Config, CorbadoSDK, RateLimitException, UserService
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    RateLimit,
+    RateLimitCounters,
+    RateLimiter,
+    ResilientApiClient,
+)
+from tests.unit.test_retry import _FlakyBackendStub
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_expect_no_wait(self):
+        limiter = RateLimiter(limits={"write": RateLimit(rate=1, burst=3)})
+
+        self.assertEqual([0.0, 0.0, 0.0], [limiter.reserve("POST /users", "POST") for _i in range(3)])
+
+    def test_empty_bucket_expect_waits_in_order(self):
+        limiter = RateLimiter(limits={"write": RateLimit(rate=10, burst=1)})
+
+        waits = [limiter.reserve("POST /users", "POST") for _i in range(4)]
+
+        self.assertEqual(0.0, waits[0])
+        for expected, wait in zip((0.1, 0.2, 0.3), waits[1:]):
+            self.assertAlmostEqual(expected, wait, delta=0.01)
+        counters = limiter.counters["write"]
+        self.assertEqual((4, 3, 0), (counters.acquired, counters.delayed, counters.rejected))
+        self.assertAlmostEqual(0.6, counters.waited, delta=0.03)
+
+    def test_timeout_expect_rate_limit_exception(self):
+        limiter = RateLimiter(limits={"write": RateLimit(rate=10, burst=1)}, timeout=0.15)
+        limiter.reserve("POST /users", "POST")
+        limiter.reserve("POST /users", "POST")
+
+        with self.assertRaises(RateLimitException) as context:
+            limiter.reserve("POST /users", "POST")
+
+        self.assertEqual("write", context.exception.group)
+        self.assertAlmostEqual(0.2, context.exception.retry_after, delta=0.01)
+        # a rejected request does not take a token
+        self.assertEqual(RateLimitCounters(acquired=2, delayed=1, rejected=1, waited=limiter.counters["write"].waited), limiter.counters["write"])
+
+    def test_groups_expect_independent(self):
+        limits = {"write": RateLimit(rate=1, burst=1), "import": RateLimit(rate=1, burst=1)}
+        limiter = RateLimiter(limits=limits, operations={"POST /users": "import"}, timeout=0)
+
+        limiter.reserve("POST /users", "POST")
+        limiter.reserve("DELETE /users/{userID}", "DELETE")
+        for _i in range(100):
+            self.assertEqual(0.0, limiter.reserve("GET /users/{userID}", "GET"))
+
+        self.assertEqual("import", limiter.group("POST /users", "POST"))
+        self.assertEqual("read", limiter.group("GET /users/{userID}", "get"))
+        with self.assertRaises(RateLimitException):
+            limiter.reserve("POST /users", "POST")
+        with self.assertRaises(RateLimitException):
+            limiter.reserve("PATCH /users/{userID}", "PATCH")
+
+    def test_default_burst_expect_one_second(self):
+        limiter = RateLimiter(limits={"read": RateLimit(rate=2.5)}, timeout=0)
+
+        for _i in range(3):
+            limiter.reserve("GET /users/{userID}", "GET")
+        with self.assertRaises(RateLimitException):
+            limiter.reserve("GET /users/{userID}", "GET")
+
+    def test_exception_pickled_expect_attributes_and_message_preserved(self):
+        error = RateLimitException(group="write", retry_after=0.25)
+
+        unpickled: RateLimitException = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+        self.assertEqual((error.group, error.retry_after), (unpickled.group, unpickled.retry_after))
+        self.assertEqual("Rate limit of write requests exceeded (retry in 0.25s)", str(unpickled))
+
+    def test_invalid_parameters_expect_error(self):
+        test_cases = [
+            {"limits": {"read": RateLimit(rate=0)}},
+            {"limits": {"read": RateLimit(rate=1, burst=0)}},
+            {"limits": {}, "timeout": -1},
+        ]
+        for kwargs in test_cases:
+            with self.assertRaises(ValueError, msg=kwargs):
+                RateLimiter(**kwargs)
+
+
+class TestResilientApiClientRateLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = _FlakyBackendStub()
+        self.limiter = RateLimiter(limits={"read": RateLimit(rate=20, burst=1)})
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+
+    def _create_service(self) -> UserService:
+        configuration = Configuration(host=self.stub.host, username="pro-1", password="secret", retries=False)
+        return UserService(client=UsersApi(api_client=ResilientApiClient(configuration=configuration, rate_limiter=self.limiter)))
+
+    def test_shared_limiter_expect_combined_rate(self):
+        services = [self._create_service(), self._create_service()]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda i: services[i % 2].get(user_id="usr-1"), range(6)))
+
+        # 6 requests with a burst of 1 at 20 per second take at least 5 intervals of 0.05 seconds
+        times = sorted(request[2] for request in self.stub.requests)
+        self.assertEqual(6, len(times))
+        self.assertGreaterEqual(times[-1] - times[0], 0.24)
+        self.assertEqual(6, self.limiter.counters["read"].acquired)
+
+    def test_timeout_expect_no_request(self):
+        self.limiter.timeout = 0
+        service = self._create_service()
+
+        service.get(user_id="usr-1")
+        with self.assertRaises(RateLimitException):
+            service.get(user_id="usr-1")
+
+        self.assertEqual(1, len(self.stub.requests))
+
+
+class TestCorbadoSDKRateLimiter(unittest.TestCase):
+    def _create_config(self, **kwargs) -> Config:
+        return Config(
+            project_id="pro-1",
+            api_secret="corbado1_secret",
+            frontend_api="https://pro-1.frontendapi.cloud.corbado.io",
+            backend_api="https://backendapi.cloud.corbado.io",
+            **kwargs,
+        )
+
+    def test_config_expect_rate_limiter(self):
+        sdk = CorbadoSDK(config=self._create_config(rate_limit_writes=10, rate_limit_burst=5, rate_limit_timeout=1))
+
+        self.assertEqual({"write": RateLimit(rate=10, burst=5)}, sdk.rate_limiter.limits)
+        self.assertEqual(1, sdk.rate_limiter.timeout)
+        self.assertIs(sdk.rate_limiter, sdk.api_client.rate_limiter)
+        self.assertIsNone(CorbadoSDK(config=self._create_config()).rate_limiter)
+
+    def test_shared_rate_limiter_expect_same_instance(self):
+        limiter = RateLimiter(limits={"write": RateLimit(rate=10)})
+
+        first = CorbadoSDK(config=self._create_config(), rate_limiter=limiter)
+        second = CorbadoSDK(config=self._create_config(rate_limit_writes=100), rate_limiter=limiter)
+
+        self.assertIs(limiter, first.api_client.rate_limiter)
+        self.assertIs(limiter, second.api_client.rate_limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
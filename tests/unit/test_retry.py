@@ -0,0 +1,216 @@
+# type: ignore
+import json
+import socket
+import threading
+import unittest
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, time
+from unittest.mock import patch
+
+import urllib3
+
+from corbado_python_sdk import Config, CorbadoSDK, UserService
+from corbado_python_sdk.exceptions import ServerException
+from corbado_python_sdk.generated.api import UsersApi
+from corbado_python_sdk.generated.configuration import Configuration
+from corbado_python_sdk.resilience import (
+    DEFAULT_RETRY_DEADLINE,
+    ResilientApiClient,
+    RetryCounters,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+_USER = {"userID": "usr-1", "status": "active", "updated": "2024-01-01", "updatedMs": 1}
+_ERROR = {"httpStatusCode": 503, "message": "Unavailable", "requestData": {"requestID": "req-1"}, "runtime": 0.1, "error": {}}
+
+
+class _FlakyBackendStub:
+    """Backend API stub answering with the queued (status, headers) first and with a user afterwards."""
+
+    def __init__(self) -> None:
+        self.failures = []
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self) -> None:
+                stub.requests.append((self.command, self.path, monotonic()))
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, headers = stub.failures.pop(0) if stub.failures else (200, {})
+                body = json.dumps(_USER if status == 200 else _ERROR).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_DELETE = _respond  # noqa: N815
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.host = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_expect_full_jitter_capped(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+        with patch("corbado_python_sdk.resilience.retry.random.uniform", side_effect=lambda low, high: high) as mock_uniform:
+            self.assertEqual([0.1, 0.2, 0.4, 0.5, 0.5], [policy.backoff(retry) for retry in range(1, 6)])
+        self.assertEqual(0, mock_uniform.call_args[0][0])
+        for _i in range(100):
+            self.assertTrue(0 <= policy.backoff(3) <= 0.4)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(3.0, parse_retry_after(" 3 "))
+        self.assertAlmostEqual(10, parse_retry_after(formatdate(time() + 10, usegmt=True)), delta=1.5)
+        self.assertEqual(0.0, parse_retry_after(formatdate(time() - 10, usegmt=True)))
+        for value in (None, "", "soon", "-1", "1.5"):
+            self.assertIsNone(parse_retry_after(value), value)
+
+    def test_next_delay(self):
+        policy = RetryPolicy(max_attempts=3, deadline=5)
+        started = monotonic()
+        test_cases = [
+            ("GET", 1, 503, None, True),
+            ("GET", 2, None, None, True),
+            ("GET", 3, 503, None, False),
+            ("GET", 1, 404, None, False),
+            ("GET", 1, 200, None, False),
+            ("POST", 1, 503, None, False),
+            ("PATCH", 1, None, None, False),
+            ("DELETE", 1, 429, "1", True),
+            ("GET", 1, 429, "10", False),
+        ]
+        for method, attempt, status, retry_after, expected in test_cases:
+            delay = policy.next_delay("op", method, attempt, started, status=status, retry_after=retry_after)
+            self.assertEqual(expected, delay is not None, (method, attempt, status, retry_after))
+
+        self.assertEqual(1.0, policy.next_delay("op", "GET", 1, started, status=429, retry_after="1"))
+
+    def test_counters_expect_per_operation(self):
+        policy = RetryPolicy(max_attempts=2)
+        started = monotonic()
+
+        policy.next_delay("GET /users/{userID}", "GET", 1, started, status=503)
+        policy.next_delay("GET /users/{userID}", "GET", 2, started, status=503)
+        policy.next_delay("GET /users/{userID}", "GET", 1, started, status=200)
+        policy.next_delay("POST /users", "POST", 1, started, status=503)
+
+        self.assertEqual(
+            {"GET /users/{userID}": RetryCounters(calls=2, retries=1, exhausted=1), "POST /users": RetryCounters(calls=1, retries=0, exhausted=0)},
+            policy.counters,
+        )
+
+    def test_invalid_parameters_expect_error(self):
+        for kwargs in ({"max_attempts": 0}, {"base_delay": 0}, {"max_delay": -1}, {"deadline": 0}):
+            with self.assertRaises(ValueError, msg=kwargs):
+                RetryPolicy(**kwargs)
+
+
+class TestResilientApiClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = _FlakyBackendStub()
+        self.policy = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05, deadline=5)
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+
+    def _create_service(self, host=None) -> UserService:
+        configuration = Configuration(host=host or self.stub.host, username="pro-1", password="secret", retries=False)
+        return UserService(client=UsersApi(api_client=ResilientApiClient(configuration=configuration, retry_policy=self.policy)))
+
+    def test_unavailable_expect_retried(self):
+        self.stub.failures = [(503, {}), (503, {})]
+
+        user = self._create_service().get(user_id="usr-1")
+
+        self.assertEqual("usr-1", user.user_id)
+        self.assertEqual(3, len(self.stub.requests))
+        self.assertEqual({"GET /users/{userID}": RetryCounters(calls=1, retries=2, exhausted=0)}, self.policy.counters)
+
+    def test_retry_after_expect_honored(self):
+        self.stub.failures = [(429, {"Retry-After": "1"})]
+
+        self._create_service().get(user_id="usr-1")
+
+        self.assertGreaterEqual(self.stub.requests[1][2] - self.stub.requests[0][2], 0.9)
+
+    def test_attempts_exhausted_expect_last_error(self):
+        self.stub.failures = [(503, {})] * 3
+
+        with self.assertRaises(ServerException) as context:
+            self._create_service().get(user_id="usr-1")
+
+        self.assertEqual(503, context.exception.http_status_code)
+        self.assertEqual(3, len(self.stub.requests))
+        self.assertEqual(RetryCounters(calls=1, retries=2, exhausted=1), self.policy.counters["GET /users/{userID}"])
+
+    def test_non_idempotent_method_expect_not_retried(self):
+        self.stub.failures = [(503, {})]
+
+        with self.assertRaises(ServerException):
+            self._create_service().create_from_request(request={"status": "active"})
+
+        self.assertEqual(1, len(self.stub.requests))
+        self.assertEqual(RetryCounters(calls=1, retries=0, exhausted=0), self.policy.counters["POST /users"])
+
+    def test_connection_error_expect_retried_and_raised(self):
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            host = f"http://127.0.0.1:{unused.getsockname()[1]}"
+
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            self._create_service(host=host).get(user_id="usr-1")
+
+        self.assertEqual(RetryCounters(calls=1, retries=2, exhausted=1), self.policy.counters["GET /users/{userID}"])
+
+    def test_operation_header_expect_not_sent(self):
+        api_client = ResilientApiClient(configuration=Configuration(host=self.stub.host))
+
+        with patch.object(api_client.rest_client, "request", wraps=api_client.rest_client.request) as mock_request:
+            UsersApi(api_client=api_client).user_get(user_id="usr-1")
+
+        self.assertNotIn("X-Corbado-Operation", mock_request.call_args.kwargs["headers"])
+
+
+class TestCorbadoSDKRetryPolicy(unittest.TestCase):
+    def _create_sdk(self, **kwargs) -> CorbadoSDK:
+        return CorbadoSDK(
+            config=Config(
+                project_id="pro-1",
+                api_secret="corbado1_secret",
+                frontend_api="https://pro-1.frontendapi.cloud.corbado.io",
+                backend_api="https://backendapi.cloud.corbado.io",
+                **kwargs,
+            )
+        )
+
+    def test_default_expect_no_retry_policy_and_urllib3_retries(self):
+        sdk = self._create_sdk()
+
+        self.assertIsNone(sdk.retry_policy)
+        self.assertIsNone(sdk.api_client.configuration.retries)
+
+    def test_max_attempts_expect_retry_policy_with_default_deadline(self):
+        sdk = self._create_sdk(retry_max_attempts=3)
+
+        self.assertIs(sdk.retry_policy, sdk.api_client.retry_policy)
+        self.assertEqual((3, DEFAULT_RETRY_DEADLINE), (sdk.retry_policy.max_attempts, sdk.retry_policy.deadline))
+        self.assertFalse(sdk.api_client.configuration.retries)
+
+
+if __name__ == "__main__":
+    unittest.main()
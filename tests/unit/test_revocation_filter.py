@@ -0,0 +1,119 @@
+# type: ignore
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from corbado_python_sdk.cache import RevocationFilter
+
+
+def _create_session_list(session_ids, total_pages: int = 1) -> MagicMock:
+    session_list = MagicMock()
+    session_list.sessions = [MagicMock(session_id=session_id) for session_id in session_ids]
+    session_list.paging.total_pages = total_pages
+    return session_list
+
+
+class TestRevocationFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.session_list.return_value = _create_session_list(["ses-1"])
+        self.filter = RevocationFilter(client=self.client, refresh_interval=10, retention=100, page_size=2)
+
+    def _age(self, seconds: float) -> None:
+        self.filter._attempted_at -= seconds
+
+    def _wait_for_background_refresh(self) -> None:
+        for thread in threading.enumerate():
+            if thread.name == "corbado-revocation-refresh":
+                thread.join(timeout=5)
+
+    def test_is_revoked_expect_single_sync(self):
+        self.assertTrue(self.filter.initial_sync_pending)
+        self.assertTrue(self.filter.is_revoked("ses-1"))
+        self.assertFalse(self.filter.initial_sync_pending)
+        self.assertFalse(self.filter.is_revoked("ses-2"))
+        self.assertTrue(self.filter.is_revoked("ses-1"))
+
+        self.assertEqual(1, self.client.session_list.call_count)
+        self.assertEqual(2, self.filter.rejected_count)
+        filter_arg = self.client.session_list.call_args.kwargs["filter"]
+        self.assertEqual("status:eq:revoked", filter_arg[0])
+        self.assertTrue(filter_arg[1].startswith("updated:gt:"))
+
+    def test_sync_expect_all_pages_listed(self):
+        self.client.session_list.side_effect = [
+            _create_session_list(["ses-1", "ses-2"], total_pages=2),
+            _create_session_list(["ses-3"], total_pages=2),
+        ]
+
+        self.assertEqual(3, self.filter.refresh())
+        self.assertEqual([1, 2], [call.kwargs["page"] for call in self.client.session_list.call_args_list])
+
+    def test_refresh_interval_expect_incremental_background_sync(self):
+        self.filter.is_revoked("ses-1")
+        first_since = self.client.session_list.call_args.kwargs["filter"][1]
+        self.client.session_list.return_value = _create_session_list(["ses-2"])
+        self._age(11)
+
+        self.filter.is_revoked("ses-2")
+        self._wait_for_background_refresh()
+
+        self.assertEqual(2, self.client.session_list.call_count)
+        self.assertGreater(self.client.session_list.call_args.kwargs["filter"][1], first_since)
+        self.assertTrue(self.filter.is_revoked("ses-1"))
+        self.assertTrue(self.filter.is_revoked("ses-2"))
+
+    def test_sync_failure_expect_known_revocations_kept(self):
+        self.filter.is_revoked("ses-1")
+        self.client.session_list.side_effect = RuntimeError("unreachable")
+        self._age(11)
+
+        self.filter.is_revoked("ses-1")
+        self._wait_for_background_refresh()
+
+        self.assertTrue(self.filter.is_revoked("ses-1"))
+        self.assertEqual(1, self.filter.refresh_failure_count)
+        self.assertIsInstance(self.filter.last_refresh_error, RuntimeError)
+
+    def test_initial_sync_failure_expect_not_revoked(self):
+        self.client.session_list.side_effect = RuntimeError("unreachable")
+
+        self.assertFalse(self.filter.is_revoked("ses-1"))
+        self.assertFalse(self.filter.is_revoked("ses-1"))
+        self.assertEqual(1, self.client.session_list.call_count)
+
+    def test_revoke_expect_revoked_immediately(self):
+        self.filter.refresh()
+
+        self.filter.revoke("ses-2")
+
+        self.client.session_revoke.assert_called_once_with(session_id="ses-2")
+        self.assertTrue(self.filter.is_revoked("ses-2"))
+        self.assertEqual(1, self.client.session_list.call_count)
+
+    def test_retention_expect_old_revocations_dropped(self):
+        self.filter.refresh()
+        self.filter._revoked = {session_id: added_at - 101 for session_id, added_at in self.filter._revoked.items()}
+        self.client.session_list.return_value = _create_session_list([])
+
+        self.filter.refresh()
+
+        self.assertEqual(0, len(self.filter))
+
+    def test_init_parameters(self):
+        for refresh_interval, retention, page_size in [(0, 1, 1), (1, 0, 1), (1, 1, 0)]:
+            with self.assertRaises(ValueError):
+                RevocationFilter(client=self.client, refresh_interval=refresh_interval, retention=retention, page_size=page_size)
+
+    def test_is_revoked_expect_no_request_after_sync(self):
+        self.filter.refresh()
+        started = time.perf_counter()
+        for _i in range(1000):
+            self.filter.is_revoked("ses-2")
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertEqual(1, self.client.session_list.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
 # type: ignore
+import asyncio
+import json
 import os
+import pickle  # noqa: S403
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from time import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,7 +16,7 @@ from jwt import (
     ImmatureSignatureError,
     InvalidAlgorithmError,
     InvalidSignatureError,
-    PyJWKClientError,
+    MissingRequiredClaimError,
     encode,
 )
 from pydantic import ValidationError
@@ -19,9 +25,19 @@ from corbado_python_sdk import (
     Config,
     CorbadoSDK,
     SessionService,
+    StandardException,
     TokenValidationException,
     UserEntity,
+    UserStatus,
+    ValidatedSession,
+    ValidationErrorType,
 )
+from corbado_python_sdk.cache import RevocationFilter, UserStatusCache
+from corbado_python_sdk.generated.exceptions import NotFoundException
+from corbado_python_sdk.services.implementation.session_service import (
+    _get_validation_worker,
+)
+from corbado_python_sdk.utils.token_verifier import TokenVerifier
 
 TEST_NAME = "Test Name"
 TEST_EMAIL = "test@email.com"
@@ -131,8 +147,8 @@ class TestBase(unittest.TestCase):
                     "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6"
                     "IkpvaG4gRG9lIiwiYWRtaW4iOnRydWV9.dyt0CoTl4WoVjAHI9Q_CwSKhl6d_9rhM3NrXuJttkao"
                 ),
-                PyJWKClientError,
-                'Unable to find a signing key that matches: "None"',
+                InvalidAlgorithmError,
+                "The specified alg value is not allowed",
             ),
             # Not before (nfb) in future
             (
@@ -207,7 +223,7 @@ class TestBase(unittest.TestCase):
         ]
 
     @classmethod
-    def _generate_jwt(cls, iss: str, exp: int, nbf: int, valid_key: bool = True) -> str:
+    def _generate_jwt(cls, iss: str, exp: int, nbf: int, valid_key: bool = True, headers=None, **claims) -> str:
         payload = {
             "iss": iss,
             "iat": int(time()),
@@ -216,10 +232,13 @@ class TestBase(unittest.TestCase):
             "sub": TEST_USER_ID,
             "name": TEST_NAME,
         }
+        payload.update(claims)
+        payload = {key: value for key, value in payload.items() if value is not None}
+        headers = {"kid": "kid123"} if headers is None else headers
 
         if valid_key:
-            return encode(payload, key=cls.private_key, algorithm="RS256", headers={"kid": "kid123"})
-        return encode(payload, key=cls.invalid_private_key, algorithm="RS256", headers={"kid": "kid123"})
+            return encode(payload, key=cls.private_key, algorithm="RS256", headers=headers)
+        return encode(payload, key=cls.invalid_private_key, algorithm="RS256", headers=headers)
 
 
 class TestSessionService(TestBase):
@@ -274,6 +293,612 @@ class TestSessionService(TestBase):
                     SessionService(**params)
 
 
+class TestSessionServiceValidateSession(TestBase):
+    def test_validate_session(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        validated_session: ValidatedSession = self.create_session_service().validate_session(session_token=jwt)
+
+        self.assertEqual(TEST_USER_ID, validated_session.user_id)
+        self.assertEqual(TEST_NAME, validated_session.full_name)
+        self.assertEqual(UserStatus.ACTIVE, validated_session.status)
+        self.assertEqual("https://auth.acme.com", validated_session.claims["iss"])
+        self.assertFalse(hasattr(validated_session, "__dict__"))
+
+    def test_to_user_entity_expect_created_once(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        validated_session: ValidatedSession = self.create_session_service().validate_session(session_token=jwt)
+
+        user: UserEntity = validated_session.to_user_entity()
+
+        self.assertEqual(UserEntity(userID=TEST_USER_ID, fullName=TEST_NAME, status=UserStatus.ACTIVE), user)
+        self.assertIs(user, validated_session.to_user_entity())
+
+    def test_validate_token_expect_claims_exposed(self):
+        exp: int = int(time()) + 100
+        jwt: str = self._generate_jwt(
+            iss="https://auth.acme.com", exp=exp, nbf=int(time()) - 100, orig=TEST_EMAIL, custom={"tenant": "acme"}
+        )
+
+        with patch.object(TokenVerifier, "verify", autospec=True, side_effect=TokenVerifier.verify) as mock_verify:
+            user: UserEntity = self.create_session_service().validate_token(session_token=jwt)
+            claims = user.claims
+
+        self.assertEqual(1, mock_verify.call_count)
+        self.assertEqual(TEST_EMAIL, claims["orig"])
+        self.assertEqual(exp, claims["exp"])
+        self.assertEqual({"tenant": "acme"}, claims["custom"])
+        with self.assertRaises(TypeError):
+            claims["orig"] = "changed"
+
+    def test_user_entity_without_token_expect_empty_claims(self):
+        self.assertEqual({}, dict(UserEntity(userID=TEST_USER_ID, status=UserStatus.ACTIVE).claims))
+
+    def test_user_entity_equality_expect_claims_ignored(self):
+        user: UserEntity = UserEntity(userID=TEST_USER_ID, status=UserStatus.ACTIVE)
+        user._claims = {"orig": TEST_EMAIL}
+
+        self.assertEqual(UserEntity(userID=TEST_USER_ID, status=UserStatus.ACTIVE), user)
+        self.assertNotEqual(UserEntity(userID=TEST_USER_ID, status=UserStatus.DISABLED), user)
+
+    def test_avalidate_session(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        validated_session: ValidatedSession = asyncio.run(self.create_session_service().avalidate_session(session_token=jwt))
+
+        self.assertEqual(TEST_USER_ID, validated_session.user_id)
+
+    def test_replaced_signing_key_expect_verifier_rebuilt(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        session_service: SessionService = self.create_session_service()
+        session_service.validate_session(session_token=jwt)
+        verifier = session_service._verifiers["kid123"]
+
+        session_service.validate_session(session_token=jwt)
+        self.assertIs(verifier, session_service._verifiers["kid123"])
+
+        session_service.jwks_cache.seed(document=json.loads(self.jwks))
+        session_service.validate_session(session_token=jwt)
+        self.assertIsNot(verifier, session_service._verifiers["kid123"])
+        self.assertIs(session_service.jwks_cache.get_signing_key("kid123"), session_service._verifiers["kid123"].signing_key)
+
+
+class TestSessionServiceUserStatus(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MagicMock()
+        self.client.user_get.return_value = MagicMock(status=UserStatus.ACTIVE)
+        self.status_session_service = SessionService(
+            issuer="https://auth.acme.com",
+            jwks_uri="https://example_uri.com",
+            project_id="pro-55",
+            token_cache_size=10,
+            user_status_cache=UserStatusCache(client=self.client, max_size=10, ttl=10),
+        )
+        self.jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+    def _assert_rejected(self, error_type: ValidationErrorType):
+        with self.assertRaises(TokenValidationException) as context:
+            self.status_session_service.validate_token(session_token=self.jwt)
+        self.assertEqual(error_type, context.exception.error_type)
+
+    def test_active_user_expect_status_cached(self):
+        for _i in range(3):
+            self.assertEqual(UserStatus.ACTIVE, self.status_session_service.validate_token(session_token=self.jwt).status)
+
+        self.client.user_get.assert_called_once_with(user_id=TEST_USER_ID)
+        self.assertEqual(2, self.status_session_service.user_status_cache.hits)
+
+    def test_pending_user_expect_actual_status(self):
+        self.client.user_get.return_value = MagicMock(status=UserStatus.PENDING)
+
+        self.assertEqual(UserStatus.PENDING, self.status_session_service.validate_token(session_token=self.jwt).status)
+        self.assertEqual(UserStatus.PENDING, self.status_session_service.validate_tokens([self.jwt])[0].status)
+
+    def test_disabled_user_expect_rejected(self):
+        self.client.user_get.return_value = MagicMock(status=UserStatus.DISABLED)
+
+        self._assert_rejected(ValidationErrorType.CODE_JWT_USER_DISABLED)
+        self.assertIsInstance(self.status_session_service.validate_tokens([self.jwt])[0], TokenValidationException)
+
+    def test_deleted_user_expect_rejected(self):
+        self.client.user_get.side_effect = NotFoundException(status=404, reason="Not Found")
+
+        self._assert_rejected(ValidationErrorType.CODE_JWT_USER_NOT_FOUND)
+
+    def test_status_error_expect_rejected(self):
+        self.client.user_get.side_effect = RuntimeError("unreachable")
+
+        self._assert_rejected(ValidationErrorType.CODE_JWT_USER_STATUS_ERROR)
+
+    def test_invalidate_user_expect_cached_token_rejected(self):
+        self.status_session_service.validate_token(session_token=self.jwt)
+        self.client.user_get.return_value = MagicMock(status=UserStatus.DISABLED)
+
+        self.status_session_service.invalidate_user(user_id=TEST_USER_ID)
+
+        self._assert_rejected(ValidationErrorType.CODE_JWT_USER_DISABLED)
+        self.assertEqual(1, self.status_session_service.token_cache.hits)
+
+    def test_avalidate_token_expect_status_checked(self):
+        self.client.user_get.return_value = MagicMock(status=UserStatus.DISABLED)
+
+        with self.assertRaises(TokenValidationException) as context:
+            asyncio.run(self.status_session_service.avalidate_token(session_token=self.jwt))
+
+        self.assertEqual(ValidationErrorType.CODE_JWT_USER_DISABLED, context.exception.error_type)
+
+
+class TestSessionServiceRevocation(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MagicMock()
+        self.client.session_list.return_value = MagicMock(sessions=[MagicMock(session_id="ses-revoked")], paging=MagicMock(total_pages=1))
+        self.revocation_session_service = SessionService(
+            issuer="https://auth.acme.com",
+            jwks_uri="https://example_uri.com",
+            project_id="pro-55",
+            token_cache_size=10,
+            revocation_filter=RevocationFilter(client=self.client),
+        )
+
+    def _generate_session_jwt(self, **claims) -> str:
+        return self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100, **claims)
+
+    def test_revoked_session_expect_rejected(self):
+        with self.assertRaises(TokenValidationException) as context:
+            self.revocation_session_service.validate_token(session_token=self._generate_session_jwt(sid="ses-revoked"))
+
+        self.assertEqual(ValidationErrorType.CODE_JWT_SESSION_REVOKED, context.exception.error_type)
+
+    def test_active_session_or_no_session_id_expect_valid(self):
+        for jwt in [self._generate_session_jwt(sid="ses-active"), self._generate_session_jwt()]:
+            self.assertIsInstance(self.revocation_session_service.validate_token(session_token=jwt), UserEntity)
+
+    def test_revoke_expect_cached_token_rejected(self):
+        jwt: str = self._generate_session_jwt(sid="ses-active")
+        self.revocation_session_service.validate_token(session_token=jwt)
+
+        self.revocation_session_service.revocation_filter.revoke(session_id="ses-active")
+
+        results = self.revocation_session_service.validate_tokens([jwt])
+        self.assertEqual(ValidationErrorType.CODE_JWT_SESSION_REVOKED, results[0].error_type)
+        with self.assertRaises(TokenValidationException):
+            asyncio.run(self.revocation_session_service.avalidate_token(session_token=jwt))
+
+    def test_avalidate_token_expect_initial_sync_off_event_loop(self):
+        sync_threads = []
+        self.client.session_list.side_effect = lambda **_kwargs: (
+            sync_threads.append(threading.current_thread()) or self.client.session_list.return_value
+        )
+
+        async def validate(session_token: str):
+            return threading.current_thread(), await self.revocation_session_service.avalidate_token(session_token=session_token)
+
+        loop_thread, _user = asyncio.run(validate(self._generate_session_jwt(sid="ses-active")))
+        with self.assertRaises(TokenValidationException) as context:
+            asyncio.run(validate(self._generate_session_jwt(sid="ses-revoked")))
+
+        self.assertEqual(1, len(sync_threads))
+        self.assertIsNot(loop_thread, sync_threads[0])
+        self.assertEqual(ValidationErrorType.CODE_JWT_SESSION_REVOKED, context.exception.error_type)
+        self.assertFalse(self.revocation_session_service.revocation_filter.initial_sync_pending)
+
+
+class TestSessionServiceIssuer(TestBase):
+    def test_extra_issuers_expect_accepted(self):
+        session_service: SessionService = SessionService(
+            issuer="https://auth.acme.com",
+            jwks_uri="https://example_uri.com",
+            project_id="pro-55",
+            extra_issuers=["https://login.acme.org"],
+        )
+
+        for iss in ["https://auth.acme.com", "https://login.acme.org", "https://pro-55.frontendapi.corbado.io"]:
+            jwt: str = self._generate_jwt(iss=iss, exp=int(time()) + 100, nbf=int(time()) - 100)
+            self.assertIsInstance(session_service.validate_token(session_token=jwt), UserEntity)
+
+    def test_non_string_issuer_expect_mismatch(self):
+        jwt: str = self._generate_jwt(iss=["https://auth.acme.com"], exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        with self.assertRaises(TokenValidationException) as context:
+            self.create_session_service().validate_token(session_token=jwt)
+
+        self.assertEqual(ValidationErrorType.CODE_JWT_ISSUER_MISSMATCH, context.exception.error_type)
+
+    def test_change_issuer_expect_accepted_issuers_and_token_cache_updated(self):
+        session_service: SessionService = SessionService(
+            issuer="https://auth.acme.com", jwks_uri="https://example_uri.com", project_id="pro-55", token_cache_size=10
+        )
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        session_service.validate_token(session_token=jwt)
+
+        session_service.issuer = "https://login.acme.org"
+
+        self.assertEqual(0, len(session_service.token_cache))
+        with self.assertRaises(TokenValidationException) as context:
+            session_service.validate_token(session_token=jwt)
+        self.assertEqual(ValidationErrorType.CODE_JWT_ISSUER_MISSMATCH, context.exception.error_type)
+
+
+class TestSessionServiceErrorMessages(TestBase):
+    def test_expired_token_expect_message_formatted_lazily(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) - 100, nbf=int(time()) - 100)
+
+        with self.assertRaises(TokenValidationException) as context:
+            self.create_session_service().validate_token(session_token=jwt)
+
+        self.assertIsNone(context.exception._message)
+        self.assertEqual(f"Error occured during token decode: {jwt}. Token expired", context.exception.message)
+        self.assertEqual((context.exception.message,), context.exception.args)
+        self.assertEqual(jwt, context.exception.session_token)
+
+    def test_assigned_message_expect_lazy_message_replaced(self):
+        error = TokenValidationException(
+            message="Unknown session {session_id}", error_type=ValidationErrorType.CODE_JWT_GENERAL, lazy=True, message_args={"session_id": "ses-1"}
+        )
+
+        error.message = "Custom"
+
+        self.assertEqual(("Custom",), error.args)
+        self.assertEqual("[Invalid token] Custom", str(error))
+        self.assertEqual("TokenValidationException('Custom')", repr(error))
+
+    def test_message_without_lazy_expect_not_formatted(self):
+        error = TokenValidationException(message="Invalid {claim}", error_type=ValidationErrorType.CODE_JWT_GENERAL)
+
+        self.assertEqual("Invalid {claim}", error.message)
+        self.assertEqual(("Invalid {claim}",), error.args)
+        with self.assertRaises(ValueError):
+            TokenValidationException(message="Invalid {claim}", error_type=ValidationErrorType.CODE_JWT_GENERAL, message_args={"claim": "sub"})
+
+    def test_issuer_mismatch_expect_issuers_in_message(self):
+        jwt: str = self._generate_jwt(iss="https://{invalid}.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        with self.assertRaises(TokenValidationException) as context:
+            self.create_session_service().validate_token(session_token=jwt)
+
+        self.assertEqual(
+            "Issuer mismatch (configured via FrontendAPI: 'https://auth.acme.com', JWT issuer: 'https://{invalid}.com')",
+            context.exception.message,
+        )
+
+    def test_omit_token_in_errors_expect_token_not_in_exception(self):
+        session_service: SessionService = SessionService(
+            issuer="https://auth.acme.com", jwks_uri="https://example_uri.com", project_id="pro-55", omit_token_in_errors=True
+        )
+        jwts = [
+            self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) - 100, nbf=int(time()) - 100),
+            self._generate_jwt(iss="https://invalid.com", exp=int(time()) + 100, nbf=int(time()) - 100),
+            self._generate_jwt(valid_key=False, iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100),
+        ]
+
+        for jwt in jwts:
+            with self.assertRaises(TokenValidationException) as context:
+                session_service.validate_token(session_token=jwt)
+            self.assertIsNone(context.exception.session_token)
+            self.assertNotIn(jwt, str(context.exception))
+
+    def test_pickle_expect_message_preserved(self):
+        jwt: str = self._generate_jwt(iss="https://invalid.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        with self.assertRaises(TokenValidationException) as context:
+            self.create_session_service().validate_token(session_token=jwt)
+        unpickled: TokenValidationException = pickle.loads(pickle.dumps(context.exception))  # noqa: S301
+
+        self.assertEqual(context.exception.error_type, unpickled.error_type)
+        self.assertEqual(context.exception.message, unpickled.message)
+
+
+class TestSessionServicePrecheck(TestBase):
+    def _provide_malformed_jwts(self):
+        valid: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        header, payload, signature = valid.split(".")
+        return [
+            ("a.b", ValidationErrorType.CODE_JWT_GENERAL),
+            (valid + ".x", ValidationErrorType.CODE_JWT_GENERAL),
+            (f"{header}!.{payload}.{signature}", ValidationErrorType.CODE_JWT_GENERAL),
+            (f"{header}.{payload}x.{signature}", ValidationErrorType.CODE_JWT_GENERAL),
+            (f"e30.{payload}.{signature}", ValidationErrorType.CODE_JWT_INVALID_SIGNATURE),
+            (f"{header}.{payload}.", ValidationErrorType.CODE_JWT_INVALID_SIGNATURE),
+            (
+                self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100, headers={}),
+                ValidationErrorType.CODE_JWT_SIGNING_KEY_ERROR,
+            ),
+            (
+                self._generate_jwt(iss="https://auth.acme.com", exp=None, nbf=int(time()) - 100),
+                ValidationErrorType.CODE_JWT_GENERAL,
+            ),
+            (
+                self._generate_jwt(iss=None, exp=int(time()) + 100, nbf=int(time()) - 100),
+                ValidationErrorType.CODE_JWT_ISSUER_EMPTY,
+            ),
+        ]
+
+    def test_malformed_token_expect_rejected_without_key_lookup(self):
+        session_service: SessionService = self.create_session_service()
+        for token, expected_error_type in self._provide_malformed_jwts():
+            with self.assertRaises(TokenValidationException) as context:
+                session_service.validate_token(session_token=token)
+            self.assertEqual(expected_error_type, context.exception.error_type, token)
+        self.assertEqual(0, self.mock_urlopen.call_count)
+        self.assertEqual(0, session_service.jwks_cache.refresh_success_count)
+
+    def test_missing_exp_expect_missing_required_claim_error(self):
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=None, nbf=int(time()) - 100)
+        with self.assertRaises(TokenValidationException) as context:
+            self.session_service.validate_token(session_token=token)
+        self.assertIsInstance(context.exception.original_exception, MissingRequiredClaimError)
+
+
+class TestSessionServiceTokenCache(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cached_session_service = SessionService(
+            issuer="https://auth.acme.com",
+            jwks_uri="https://example_uri.com",
+            project_id="pro-55",
+            token_cache_size=2,
+        )
+
+    def test_validate_token_twice_expect_cache_hit(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        first: UserEntity = self.cached_session_service.validate_token(session_token=jwt)
+
+        with patch.object(TokenVerifier, "verify") as mock_verify:
+            second: UserEntity = self.cached_session_service.validate_token(session_token=jwt)
+            mock_verify.assert_not_called()
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.cached_session_service.token_cache.hits)
+
+    def test_invalid_token_expect_not_cached(self):
+        jwt: str = self._generate_jwt(iss="https://invalid.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        for _i in range(2):
+            with self.assertRaises(TokenValidationException):
+                self.cached_session_service.validate_token(session_token=jwt)
+        self.assertEqual(0, len(self.cached_session_service.token_cache))
+
+    def test_token_about_to_expire_expect_entry_not_outliving_exp(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        with patch("corbado_python_sdk.services.implementation.session_service.time", return_value=time() + 100):
+            self.cached_session_service.validate_token(session_token=jwt)
+        self.assertEqual(0, len(self.cached_session_service.token_cache))
+
+    def test_token_cache_full_expect_least_recently_used_evicted(self):
+        jwts = [
+            self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100 + i, nbf=int(time()) - 100) for i in range(3)
+        ]
+        for jwt in jwts:
+            self.cached_session_service.validate_token(session_token=jwt)
+        self.assertEqual(2, len(self.cached_session_service.token_cache))
+
+    def test_invalidate_token_expect_revalidation(self):
+        jwt: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        first: UserEntity = self.cached_session_service.validate_token(session_token=jwt)
+        self.cached_session_service.invalidate_token(session_token=jwt)
+        second: UserEntity = self.cached_session_service.validate_token(session_token=jwt)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(0, self.cached_session_service.token_cache.hits)
+
+    def test_token_cache_disabled_by_default(self):
+        self.assertIsNone(self.session_service.token_cache)
+
+
+class TestSessionServiceValidateTokens(TestBase):
+    def test_validate_tokens_expect_results_in_order(self):
+        tokens = [token for _valid, token, _error, _message in self._provide_jwts()]
+        results = self.session_service.validate_tokens(session_tokens=tokens + [""])
+
+        self.assertEqual(len(tokens) + 1, len(results))
+        for (valid, _token, expected_original_error, _message), result in zip(self._provide_jwts(), results):
+            if valid:
+                self.assertIsInstance(result, UserEntity)
+                self.assertEqual(TEST_USER_ID, result.user_id)
+            else:
+                self.assertIsInstance(result, TokenValidationException)
+                if expected_original_error:
+                    self.assertIsInstance(result.original_exception, expected_original_error)
+        self.assertEqual(ValidationErrorType.CODE_JWT_EMPTY_SESSION_TOKEN, results[-1].error_type)
+
+    def test_validate_tokens_with_duplicates_expect_single_verification(self):
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        session_service: SessionService = self.create_session_service()
+
+        jwks_cache = session_service.jwks_cache
+        with patch.object(jwks_cache, "get_signing_key", wraps=jwks_cache.get_signing_key) as key_lookup:
+            with patch.object(TokenVerifier, "verify", autospec=True, side_effect=TokenVerifier.verify) as mock_verify:
+                results = session_service.validate_tokens(session_tokens=[token] * 10)
+
+        self.assertEqual(1, key_lookup.call_count)
+        self.assertEqual(1, mock_verify.call_count)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_validate_tokens_with_executors_expect_same_results(self):
+        tokens = [token for _valid, token, _error, _message in self._provide_jwts()]
+        expected = [type(result) for result in self.session_service.validate_tokens(session_tokens=tokens)]
+
+        for executor in (ThreadPoolExecutor(max_workers=2), ProcessPoolExecutor(max_workers=2)):
+            with executor:
+                results = self.session_service.validate_tokens(session_tokens=tokens, executor=executor, chunk_size=3)
+            self.assertEqual(expected, [type(result) for result in results])
+
+    def test_validate_tokens_without_user_claims_expect_error_result(self):
+        valid: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        without_sub: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100, sub=None)
+
+        for executor in (None, ThreadPoolExecutor(max_workers=2), ProcessPoolExecutor(max_workers=2)):
+            results = self.session_service.validate_tokens(session_tokens=[valid, without_sub], executor=executor, chunk_size=1)
+            if executor is not None:
+                executor.shutdown()
+
+            self.assertEqual(TEST_USER_ID, results[0].user_id)
+            self.assertIsInstance(results[1], TokenValidationException)
+            self.assertEqual(ValidationErrorType.CODE_JWT_GENERAL, results[1].error_type)
+            self.assertIsInstance(results[1].original_exception, ValidationError)
+        with self.assertRaises(TokenValidationException):
+            self.session_service.validate_token(session_token=without_sub)
+
+    def test_worker_session_service_expect_created_once_per_settings(self):
+        settings = self.session_service._worker_settings()
+        settings["jwks"] = self.session_service.jwks_cache.document
+
+        worker = _get_validation_worker(settings=settings)
+
+        self.assertIs(worker, _get_validation_worker(settings=dict(settings)))
+        self.assertIsNot(worker, _get_validation_worker(settings=dict(settings, jwks={"keys": []})))
+
+
+class TestSessionServiceVerifyStream(TestBase):
+    def test_verify_stream_from_file_expect_results_in_order(self):
+        provided = self._provide_jwts()
+        session_service: SessionService = self.create_session_service()
+        expected = [type(result) for result in session_service.validate_tokens(session_tokens=[token for _v, token, _e, _m in provided])]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tokens.txt")
+            with open(path, "w", encoding="utf-8") as tokens_file:
+                tokens_file.writelines(f"{token}\n" for _valid, token, _error, _message in provided)
+            with open(path, encoding="utf-8") as tokens_file:
+                results = list(session_service.verify_stream(session_tokens=tokens_file, processes=2, chunk_size=3))
+
+        self.assertEqual(expected, [type(result) for result in results])
+        self.assertEqual(
+            [valid for valid, _token, _error, _message in provided], [isinstance(result, UserEntity) for result in results]
+        )
+        self.assertEqual(1, self.mock_urlopen.call_count)
+
+    def test_verify_stream_with_leeway_expect_expired_tokens_verified(self):
+        expired: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) - 86400, nbf=int(time()) - 90000)
+        invalid_signature: str = self._generate_jwt(
+            iss="https://auth.acme.com", exp=int(time()) - 86400, nbf=int(time()) - 90000, valid_key=False
+        )
+
+        results = list(
+            self.create_session_service().verify_stream(session_tokens=[expired, invalid_signature], processes=1, leeway=float("inf"))
+        )
+
+        self.assertEqual(TEST_USER_ID, results[0].user_id)
+        self.assertEqual(ValidationErrorType.CODE_JWT_INVALID_SIGNATURE, results[1].error_type)
+
+    def test_verify_stream_without_user_claims_expect_error_result(self):
+        without_sub: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100, sub=None)
+        valid: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+        results = list(self.create_session_service().verify_stream(session_tokens=[without_sub, valid], processes=1, chunk_size=2))
+
+        self.assertEqual(ValidationErrorType.CODE_JWT_GENERAL, results[0].error_type)
+        self.assertIsInstance(results[0].original_exception, ValidationError)
+        self.assertEqual(TEST_USER_ID, results[1].user_id)
+
+    def test_verify_stream_expect_bounded_read_ahead(self):
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        consumed = []
+
+        def tokens():
+            for i in range(100):
+                consumed.append(i)
+                yield token
+
+        stream = self.create_session_service().verify_stream(session_tokens=tokens(), processes=1, chunk_size=2, max_pending_chunks=3)
+        self.assertEqual([], consumed)
+
+        self.assertEqual(TEST_USER_ID, next(stream).user_id)
+        self.assertEqual(6, len(consumed))
+        stream.close()
+
+    def test_verify_stream_parameters(self):
+        session_service: SessionService = self.create_session_service()
+        for kwargs in [{"processes": 0}, {"chunk_size": 0}, {"max_pending_chunks": 0}]:
+            with self.assertRaises(ValueError):
+                session_service.verify_stream(session_tokens=[], **kwargs)
+
+
+class TestSessionServiceAsync(TestBase):
+    def test_avalidate_token(self):
+        for valid, token, expected_original_error, _message in self._provide_jwts():
+            if valid:
+                result: UserEntity = asyncio.run(self.session_service.avalidate_token(session_token=token))
+                self.assertEqual(TEST_USER_ID, result.user_id)
+            else:
+                with self.assertRaises(TokenValidationException) as context:
+                    asyncio.run(self.session_service.avalidate_token(session_token=token))
+                if expected_original_error:
+                    self.assertIsInstance(context.exception.original_exception, expected_original_error)
+
+    def test_avalidate_token_expect_jwks_fetched_off_event_loop(self):
+        session_service: SessionService = self.create_session_service()
+        token: str = self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+        fetch_threads = []
+
+        def fetch(*_args, **_kwargs):
+            fetch_threads.append(threading.current_thread())
+            return self.mock_response
+
+        self.mock_urlopen.side_effect = fetch
+
+        async def validate_twice():
+            await session_service.avalidate_token(session_token=token)
+            await session_service.avalidate_token(session_token=token)
+
+        asyncio.run(validate_twice())
+
+        self.assertEqual(1, len(fetch_threads))
+        self.assertIsNot(threading.main_thread(), fetch_threads[0])
+
+
+class TestSessionServiceOffline(TestBase):
+    def _create_session_service(self, **kwargs) -> SessionService:
+        return SessionService(issuer="https://auth.acme.com", jwks_uri="https://example_uri.com", project_id="pro-55", **kwargs)
+
+    def _generate_valid_jwt(self) -> str:
+        return self._generate_jwt(iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100)
+
+    def test_static_jwks_expect_no_fetch(self):
+        session_service: SessionService = self._create_session_service(jwks=json.loads(self.jwks))
+
+        self.assertEqual(1, session_service.warm_up())
+        self.assertIsInstance(session_service.validate_token(session_token=self._generate_valid_jwt()), UserEntity)
+        self.mock_urlopen.assert_not_called()
+
+    def test_jwks_path_expect_keys_read_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "jwks.json")
+            with open(path, "wb") as jwks_file:
+                jwks_file.write(self.jwks)
+            session_service: SessionService = self._create_session_service(jwks_path=path)
+
+            self.assertIsInstance(session_service.validate_token(session_token=self._generate_valid_jwt()), UserEntity)
+        self.mock_urlopen.assert_not_called()
+
+    def test_static_jwks_unknown_kid_expect_rejected_without_fetch(self):
+        session_service: SessionService = self._create_session_service(jwks=json.loads(self.jwks), jwks_min_refresh_interval=0)
+        token: str = self._generate_jwt(
+            iss="https://auth.acme.com", exp=int(time()) + 100, nbf=int(time()) - 100, headers={"kid": "unknown"}
+        )
+
+        with self.assertRaises(TokenValidationException) as context:
+            session_service.validate_token(session_token=token)
+
+        self.assertEqual(ValidationErrorType.CODE_JWT_SIGNING_KEY_ERROR, context.exception.error_type)
+        self.mock_urlopen.assert_not_called()
+
+    def test_warm_up_expect_fetched_once(self):
+        session_service: SessionService = self.create_session_service()
+
+        session_service.warm_up()
+        session_service.validate_token(session_token=self._generate_valid_jwt())
+
+        self.assertEqual(1, self.mock_urlopen.call_count)
+
+    def test_warm_up_missing_file_expect_standard_exception(self):
+        session_service: SessionService = self._create_session_service(jwks_path="/nonexistent/jwks.json")
+
+        with self.assertRaises(StandardException):
+            session_service.warm_up()
+
+
 class TestSessionServiceConfiguration(TestBase):
     def test_set_cname_expect_issuer_changed(self):
         test_cname = "cname.test.com"
@@ -0,0 +1,70 @@
+# type: ignore
+import json
+import os
+import unittest
+from time import time
+
+from jwt import PyJWK, PyJWTError, decode, encode
+
+from corbado_python_sdk.utils.token_parser import parse_token
+from corbado_python_sdk.utils.token_verifier import TokenVerifier
+
+
+class TestTokenVerifier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        test_data: str = os.path.join(os.path.dirname(__file__), "test_data")
+        with open(os.path.join(test_data, "jwks.json"), encoding="utf-8") as jwks_file:
+            cls.signing_key = PyJWK.from_dict(json.load(jwks_file)["keys"][0])
+        with open(os.path.join(test_data, "privateKey.pem"), mode="rb") as private_key_file:
+            cls.private_key = private_key_file.read()
+        with open(os.path.join(test_data, "invalidPrivateKey.pem"), mode="rb") as private_key_file:
+            cls.invalid_private_key = private_key_file.read()
+
+    def _encode(self, payload, private_key=None, headers=None) -> str:
+        return encode(payload, key=private_key or self.private_key, algorithm="RS256", headers=headers or {"kid": "kid123"})
+
+    def test_verify_expect_same_result_as_decode(self):
+        now = int(time())
+        test_cases = [
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now + 100, "nbf": now - 100, "iat": now}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now - 100}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now + 100, "nbf": now + 100}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now + 100, "iat": now + 100}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": "soon"}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now + 100, "aud": "acme"}),
+            self._encode({"iss": "https://auth.acme.com", "sub": 1, "exp": now + 100}),
+            self._encode({"iss": "https://auth.acme.com", "sub": "usr-1", "exp": now + 100}, private_key=self.invalid_private_key),
+        ]
+        verifier = TokenVerifier(signing_key=self.signing_key, algorithms=["RS256"])
+
+        for token in test_cases:
+            try:
+                expected = decode(token, key=self.signing_key.key, algorithms=["RS256"])
+            except PyJWTError as error:
+                expected = error
+            try:
+                result = verifier.verify(parse_token(token))
+            except PyJWTError as error:
+                result = error
+
+            if isinstance(expected, Exception):
+                self.assertIsInstance(result, PyJWTError, token)
+                self.assertEqual(str(expected), str(result), token)
+            else:
+                self.assertEqual(expected, result)
+
+    def test_verify_with_disallowed_algorithm_expect_error(self):
+        token = self._encode({"iss": "https://auth.acme.com", "exp": int(time()) + 100})
+        verifier = TokenVerifier(signing_key=self.signing_key, algorithms=["RS512"])
+
+        with self.assertRaisesRegex(PyJWTError, "alg value is not allowed"):
+            verifier.verify(parse_token(token))
+
+    def test_unsupported_algorithm_expect_error(self):
+        with self.assertRaises(PyJWTError):
+            TokenVerifier(signing_key=self.signing_key, algorithms=["XS256"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+# type: ignore
+import unittest
+
+from corbado_python_sdk.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_expect_hit_and_miss_counted(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_put_expect_least_recently_used_evicted(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+
+    def test_expired_entry_expect_miss(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.put("a", 1, ttl=0)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+    def test_invalidate_expect_entry_removed(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.invalidate("a")
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_init_parameters(self):
+        for max_size, ttl in [(0, 1), (1, 0)]:
+            with self.assertRaises(ValueError):
+                TTLCache(max_size=max_size, ttl=ttl)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# type: ignore
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from corbado_python_sdk.cache import UserStatusCache
+from corbado_python_sdk.exceptions import ServerException
+from corbado_python_sdk.generated.exceptions import ApiException, NotFoundException
+from corbado_python_sdk.generated.models.user_status import UserStatus
+
+TEST_USER_ID = "usr-123"
+
+
+def _create_user(status: UserStatus) -> MagicMock:
+    user = MagicMock()
+    user.status = status
+    return user
+
+
+class TestUserStatusCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.user_get.return_value = _create_user(UserStatus.ACTIVE)
+        self.cache = UserStatusCache(client=self.client, max_size=10, ttl=10, not_found_ttl=5)
+
+    def test_get_status_expect_cached(self):
+        for _i in range(3):
+            self.assertEqual(UserStatus.ACTIVE, self.cache.get_status(user_id=TEST_USER_ID))
+
+        self.client.user_get.assert_called_once_with(user_id=TEST_USER_ID)
+        self.assertEqual(2, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_not_found_expect_negative_cached(self):
+        self.client.user_get.side_effect = NotFoundException(status=404, reason="Not Found")
+
+        self.assertIsNone(self.cache.get_status(user_id=TEST_USER_ID))
+        self.assertEqual((True, None), self.cache.get_cached_status(user_id=TEST_USER_ID))
+        self.assertEqual(1, self.client.user_get.call_count)
+
+    def test_expired_entry_expect_fetched_again(self):
+        self.cache.get_status(user_id=TEST_USER_ID)
+        _expires_at, entry = self.cache._entries._entries[TEST_USER_ID]
+        self.cache._entries._entries[TEST_USER_ID] = (time.monotonic() - 1, entry)
+
+        self.cache.get_status(user_id=TEST_USER_ID)
+
+        self.assertEqual(2, self.client.user_get.call_count)
+
+    def test_invalidate_expect_fetched_again(self):
+        self.cache.get_status(user_id=TEST_USER_ID)
+        self.client.user_get.return_value = _create_user(UserStatus.DISABLED)
+
+        self.cache.invalidate(user_id=TEST_USER_ID)
+
+        self.assertEqual(UserStatus.DISABLED, self.cache.get_status(user_id=TEST_USER_ID))
+
+    def test_invalidate_during_request_expect_result_not_cached(self):
+        def user_get(user_id):
+            self.cache.invalidate(user_id=user_id)
+            return _create_user(UserStatus.ACTIVE)
+
+        self.client.user_get.side_effect = user_get
+
+        self.assertEqual(UserStatus.ACTIVE, self.cache.get_status(user_id=TEST_USER_ID))
+        self.assertEqual((False, None), self.cache.get_cached_status(user_id=TEST_USER_ID))
+
+    def test_server_error_expect_server_exception_and_not_cached(self):
+        body = json.dumps(
+            {"httpStatusCode": 500, "message": "Internal error", "requestData": {"requestID": "req-1"}, "runtime": 0.1, "error": {}}
+        )
+        self.client.user_get.side_effect = ApiException(status=500, reason="Internal Server Error", body=body)
+
+        with self.assertRaises(ServerException):
+            self.cache.get_status(user_id=TEST_USER_ID)
+
+        self.assertEqual((False, None), self.cache.get_cached_status(user_id=TEST_USER_ID))
+
+    def test_concurrent_lookups_expect_single_request(self):
+        def slow_user_get(user_id):
+            time.sleep(0.05)
+            return _create_user(UserStatus.ACTIVE)
+
+        self.client.user_get.side_effect = slow_user_get
+        num_threads = 16
+        barrier = threading.Barrier(num_threads)
+
+        def lookup(_i):
+            barrier.wait()
+            return self.cache.get_status(user_id=TEST_USER_ID)
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            statuses = list(executor.map(lookup, range(num_threads)))
+
+        self.assertEqual([UserStatus.ACTIVE] * num_threads, statuses)
+        self.assertEqual(1, self.client.user_get.call_count)
+
+    def test_init_parameters(self):
+        for max_size, ttl, not_found_ttl in [(0, 10, None), (10, 0, None), (10, 10, 0)]:
+            with self.assertRaises(ValueError):
+                UserStatusCache(client=self.client, max_size=max_size, ttl=ttl, not_found_ttl=not_found_ttl)
+
+
+if __name__ == "__main__":
+    unittest.main()